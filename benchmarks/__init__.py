@@ -0,0 +1 @@
+"""Micro-benchmarks for local-deep-research components."""
@@ -0,0 +1,125 @@
+"""Benchmark worker-model tokens per page with and without chunk selection.
+
+Runs scraper_node over synthetic long pages (a few on-topic paragraphs
+among navigation, boilerplate and off-topic text) with a fake LLM that
+only counts the tokens it is sent. Reports tokens per page and the time
+spent in the selection stage itself. Pages are cut at scrape()'s default
+max_content_length, as scraped pages are.
+
+Usage:
+    uv run python -m benchmarks.bench_chunk_selection [--pages N] [--paragraphs N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+from src.config import settings
+from src.nodes import scraper
+from src.prompts.budget import count_tokens
+from src.tools.scrape import ScrapeResult
+
+QUERY = "qubit error correction"
+TASK = "How do quantum computers correct errors?"
+
+ON_TOPIC = [
+    "Quantum error correction encodes one logical qubit into many physical "
+    "qubits so that errors can be detected without measuring the state.",
+    "The surface code arranges qubits on a lattice and measures stabilizers "
+    "to locate bit-flip and phase-flip errors.",
+    "Error correction thresholds describe the physical error rate below "
+    "which adding more qubits reduces the logical error rate.",
+]
+
+# scrape()'s default max_content_length.
+MAX_CONTENT_LENGTH = 50000
+
+FILLER_WORDS = (
+    "company news product pricing cookie privacy policy newsletter subscribe "
+    "account login menu contact careers press events partners blog archive "
+    "weather sports travel recipe market stock report community forum"
+).split()
+
+
+def _page(rng: random.Random, paragraphs: int) -> str:
+    """Build one synthetic page with a few on-topic paragraphs."""
+    blocks = [
+        " ".join(rng.choices(FILLER_WORDS, k=rng.randint(60, 140)))
+        for _ in range(paragraphs)
+    ]
+    for text in ON_TOPIC:
+        blocks[rng.randrange(paragraphs // 2)] = f"## Section\n\n{text} " * 2
+    return "\n\n".join(blocks)[:MAX_CONTENT_LENGTH]
+
+
+async def _run(pages: list[str], selection: bool) -> tuple[int, int]:
+    """Run scraper_node over the pages; return (LLM calls, prompt tokens)."""
+    sent = {"calls": 0, "tokens": 0}
+
+    async def fake_stream(
+        urls: list[str], **kwargs: Any
+    ) -> AsyncIterator[tuple[int, ScrapeResult]]:
+        for index, (url, markdown) in enumerate(zip(urls, pages, strict=True)):
+            yield index, ScrapeResult(url=url, markdown=markdown, success=True)
+
+    async def fake_llm(prompt: str, **kwargs: Any) -> str:
+        sent["calls"] += 1
+        sent["tokens"] += count_tokens(prompt)
+        return "summary " * 50
+
+    settings.chunk_selection = selection
+    scraper.scrape_stream = fake_stream  # type: ignore[assignment]
+    scraper.call_llm = fake_llm  # type: ignore[assignment]
+    await scraper.scraper_node(
+        {
+            "references": [f"https://example.com/{i}" for i in range(len(pages))],
+            "current_search_query": QUERY,
+            "task": TASK,
+        }
+    )
+    return sent["calls"], sent["tokens"]
+
+
+def _time_selection(pages: list[str]) -> float:
+    """Return mean milliseconds spent selecting passages per page."""
+    settings.chunk_selection = True
+    start = time.perf_counter()
+    for page in pages:
+        scraper._select_relevant(page, f"{QUERY} {TASK}")
+    return (time.perf_counter() - start) * 1000 / len(pages)
+
+
+async def main(page_count: int, paragraphs: int) -> None:
+    """Run the benchmark."""
+    # Measure summarization itself, not the content-hash summary cache.
+    settings.summary_cache_ttl = 0
+    rng = random.Random(0)
+    pages = [_page(rng, paragraphs) for _ in range(page_count)]
+    page_tokens = sum(count_tokens(page) for page in pages) / page_count
+    print(f"{page_count} pages, {page_tokens:.0f} tokens per page on average")
+
+    results = {}
+    for label, selection in (("without selection", False), ("with selection", True)):
+        calls, tokens = await _run(pages, selection)
+        results[label] = tokens
+        print(
+            f"{label:<18} {tokens / page_count:8.0f} tokens/page  "
+            f"{calls / page_count:5.1f} LLM calls/page"
+        )
+
+    ratio = results["without selection"] / max(results["with selection"], 1)
+    print(f"reduction          {ratio:8.1f}x")
+    print(f"selection cost     {_time_selection(pages):8.2f} ms/page")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--paragraphs", type=int, default=80)
+    args = parser.parse_args()
+    asyncio.run(main(args.pages, args.paragraphs))
@@ -0,0 +1,107 @@
+"""Benchmark per-call client overhead of call_llm against a fake Ollama.
+
+Starts a local server that answers /api/chat instantly, so the measured
+time is client construction, connection setup and request handling
+rather than inference. Compares constructing a ChatOllama per call (the
+previous behaviour) with the shared client registry used by call_llm.
+
+Usage:
+    uv run python -m benchmarks.bench_llm_clients [--calls N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+from aiohttp import web
+from langchain_ollama import ChatOllama
+
+from src.config import settings
+from src.llm import call_llm, close_llm_clients
+
+MODEL = "fake-model:1b"
+
+
+async def _fake_chat(request: web.Request) -> web.StreamResponse:
+    """Answer an Ollama chat request with a single streamed chunk."""
+    body = await request.json()
+    chunk = {
+        "model": body.get("model", MODEL),
+        "created_at": "2026-01-01T00:00:00Z",
+        "message": {"role": "assistant", "content": "ok"},
+        "done": True,
+        "done_reason": "stop",
+        "total_duration": 1,
+        "eval_count": 1,
+        "prompt_eval_count": 1,
+    }
+    response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+    await response.prepare(request)
+    await response.write(json.dumps(chunk).encode() + b"\n")
+    await response.write_eof()
+    return response
+
+
+async def _per_call_client(prompt: str) -> None:
+    """Call the model the way call_llm did before the registry."""
+    llm = ChatOllama(model=MODEL, base_url=settings.ollama_url, temperature=0.7)
+    await llm.ainvoke(prompt)
+
+
+async def _registry_client(prompt: str) -> None:
+    """Call the model through call_llm."""
+    await call_llm(prompt, model=MODEL)
+
+
+async def _measure(call: Callable[[str], Awaitable[None]], calls: int) -> list[float]:
+    """Return per-call latencies in milliseconds."""
+    latencies = []
+    for i in range(calls):
+        start = time.perf_counter()
+        await call(f"prompt {i}")
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    """Print latency statistics."""
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(
+        f"{label:<18} mean {statistics.mean(latencies):7.3f} ms  "
+        f"p50 {statistics.median(latencies):7.3f} ms  p95 {p95:7.3f} ms"
+    )
+
+
+async def main(calls: int) -> None:
+    """Run the benchmark against a local fake Ollama server."""
+    app = web.Application()
+    app.router.add_post("/api/chat", _fake_chat)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    settings.ollama_url = f"http://127.0.0.1:{port}"
+
+    try:
+        await _per_call_client("warmup")
+        await _registry_client("warmup")
+
+        _report("client per call", await _measure(_per_call_client, calls))
+        _report("shared client", await _measure(_registry_client, calls))
+    finally:
+        await close_llm_clients()
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls))
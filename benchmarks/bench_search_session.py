@@ -0,0 +1,108 @@
+"""Benchmark per-query search latency with and without the shared session.
+
+Starts a stub SearXNG server on localhost and issues the same queries
+through a fresh aiohttp.ClientSession per call (the previous behaviour)
+and through search(), which reuses the pooled session.
+
+Usage:
+    uv run python -m benchmarks.bench_search_session [--queries N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+import aiohttp
+from aiohttp import web
+
+from src.config import settings
+from src.tools.http import close_http_session
+from src.tools.search import search
+
+STUB_RESPONSE = {
+    "query": "benchmark",
+    "results": [
+        {
+            "title": f"Result {i}",
+            "url": f"https://example.com/{i}",
+            "content": "Stub snippet " * 20,
+            "engine": "stub",
+        }
+        for i in range(10)
+    ],
+}
+
+
+async def _stub_search(request: web.Request) -> web.Response:
+    """Return a canned SearXNG JSON response."""
+    return web.json_response(STUB_RESPONSE)
+
+
+async def _fresh_session_search(query: str) -> None:
+    """Issue one search the way search() did before the shared session."""
+    async with aiohttp.ClientSession() as session:
+        async with session.get(
+            f"{settings.searxng_url}/search",
+            params={"q": query, "format": "json"},
+            timeout=aiohttp.ClientTimeout(total=10.0),
+        ) as response:
+            await response.json()
+
+
+async def _shared_session_search(query: str) -> None:
+    """Issue one search through search()."""
+    await search(query)
+
+
+async def _measure(call: Callable[[str], Awaitable[None]], queries: int) -> list[float]:
+    """Return per-query latencies in milliseconds."""
+    latencies = []
+    for i in range(queries):
+        start = time.perf_counter()
+        await call(f"benchmark query {i}")
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    """Print latency statistics."""
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(
+        f"{label:<16} mean {statistics.mean(latencies):7.3f} ms  "
+        f"p50 {statistics.median(latencies):7.3f} ms  p95 {p95:7.3f} ms"
+    )
+
+
+async def main(queries: int) -> None:
+    """Run the benchmark against a local stub server."""
+    app = web.Application()
+    app.router.add_get("/search", _stub_search)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    settings.searxng_url = f"http://127.0.0.1:{port}"
+
+    try:
+        # Warm up both paths once.
+        await _fresh_session_search("warmup")
+        await _shared_session_search("warmup")
+
+        _report("fresh session", await _measure(_fresh_session_search, queries))
+        _report("shared session", await _measure(_shared_session_search, queries))
+    finally:
+        await close_http_session()
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.queries))
@@ -0,0 +1,89 @@
+"""Benchmark report translation throughput in segments per second on CPU.
+
+Translates a synthetic markdown report with the real Opus-MT model, one
+segment per generate() call and in padded batches of increasing size,
+and reports segments per second for each. Also shows how much of the
+report the previous single-call path (tokenizer truncation) covered.
+The model is loaded once before timing.
+
+Usage:
+    uv run python -m benchmarks.bench_translation [--lang ja] [--sections N] [--batch-sizes N ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from src.config import settings
+from src.segmentation import segment_markdown
+from src.tools.translate import REVERSE_MODELS, _load_model, translate_segments
+
+SENTENCES = [
+    "Quantum error correction encodes one logical qubit into many physical qubits.",
+    "The surface code measures stabilizers on a two-dimensional lattice.",
+    "Below the threshold, adding qubits lowers the logical error rate.",
+    "Recent experiments demonstrated logical qubits that outlive physical ones.",
+    "Decoding must keep up with the rate at which syndromes are measured.",
+    "Hardware noise is rarely independent, which complicates the analysis.",
+]
+
+
+def _report(sections: int) -> str:
+    """Build a markdown report with headings, paragraphs and references."""
+    parts = ["# Research Report", ""]
+    for index in range(sections):
+        rotated = (
+            SENTENCES[index % len(SENTENCES) :] + SENTENCES[: index % len(SENTENCES)]
+        )
+        parts += [
+            f"## Section {index + 1}",
+            "",
+            " ".join(f"{sentence[:-1]} in case {index}." for sentence in rotated),
+            "",
+        ]
+    parts += ["## References", ""]
+    parts += [f"{i}. https://example.com/paper/{i}" for i in range(1, 11)]
+    return "\n".join(parts)
+
+
+def _old_path_coverage(report: str, model_name: str) -> float:
+    """Return the share of the report's tokens the truncating path saw."""
+    tokenizer, _ = _load_model(model_name)
+    full = len(tokenizer(report)["input_ids"])
+    kept = len(tokenizer(report, truncation=True)["input_ids"])
+    return kept / full
+
+
+def main(lang: str, sections: int, batch_sizes: list[int]) -> None:
+    """Run the benchmark."""
+    model_name = REVERSE_MODELS[lang]
+    report = _report(sections)
+    segments = segment_markdown(report).segments
+    # Distinct segments only: repeats are translated once and would
+    # flatter the larger batches.
+    segments = list(dict.fromkeys(segments))
+    print(f"{model_name}: {len(segments)} segments, {len(report)} characters")
+
+    _load_model(model_name)
+    coverage = _old_path_coverage(report, model_name)
+    print(f"single generate() with truncation covers {coverage:.0%} of the report")
+
+    for batch_size in batch_sizes:
+        settings.translation_batch_size = batch_size
+        start = time.perf_counter()
+        translate_segments(segments, model_name)
+        elapsed = time.perf_counter() - start
+        print(
+            f"batch size {batch_size:3d}  {len(segments) / elapsed:7.2f} segments/s  "
+            f"{elapsed:7.1f} s total"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lang", default="ja", choices=sorted(REVERSE_MODELS))
+    parser.add_argument("--sections", type=int, default=8)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 4, 8, 16, 32])
+    args = parser.parse_args()
+    main(args.lang, args.sections, args.batch_sizes)
@@ -0,0 +1,95 @@
+"""Benchmark translation latency and memory per inference backend on CPU.
+
+Each backend runs in a fresh process so peak memory is measured from the
+same baseline: load the model (the "transformers" backend is the
+_load_model path), then translate the segments of a synthetic report.
+Reports load time, per-segment latency, throughput and peak RSS. The
+translation memory is disabled so every segment reaches the model.
+
+Usage:
+    uv run python -m benchmarks.bench_translation_backends [--lang ja]
+        [--sections N] [--backends transformers int8 ctranslate2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import resource
+import time
+
+from benchmarks.bench_translation import _report
+from src.config import settings
+from src.segmentation import segment_markdown
+from src.tools.translate import (
+    REVERSE_MODELS,
+    TRANSLATION_BACKENDS,
+    _get_backend,
+    translate_segments,
+)
+
+
+def _peak_rss_mb() -> float:
+    """Return this process's peak resident set size in MB (Linux)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _run(backend: str, model_name: str, segments: list[str]) -> dict[str, float]:
+    """Load one backend and translate the segments; runs in a child process."""
+    from src import metrics
+
+    settings.translation_backend = backend
+    settings.translation_memory_size = 0
+    settings.translation_cache_ttl = 0
+    baseline = _peak_rss_mb()
+
+    start = time.perf_counter()
+    _get_backend(model_name)
+    loaded = time.perf_counter() - start
+
+    start = time.perf_counter()
+    translate_segments(segments, model_name)
+    elapsed = time.perf_counter() - start
+    return {
+        "load_s": loaded,
+        "ms_per_segment": elapsed * 1000 / len(segments),
+        "segments_per_s": len(segments) / elapsed,
+        "peak_mb": _peak_rss_mb() - baseline,
+        "fell_back": metrics.get("translation_backend_fallbacks"),
+    }
+
+
+def main(lang: str, sections: int, backends: list[str]) -> None:
+    """Run the benchmark."""
+    model_name = REVERSE_MODELS[lang]
+    segments = list(dict.fromkeys(segment_markdown(_report(sections)).segments))
+    print(
+        f"{model_name}: {len(segments)} segments, batch size "
+        f"{settings.translation_batch_size}"
+    )
+
+    context = multiprocessing.get_context("spawn")
+    for backend in backends:
+        with context.Pool(1) as pool:
+            result = pool.apply(_run, (backend, model_name, segments))
+        note = "  (not installed, used transformers)" if result["fell_back"] else ""
+        print(
+            f"{backend:<13} load {result['load_s']:6.1f} s  "
+            f"{result['ms_per_segment']:7.1f} ms/segment  "
+            f"{result['segments_per_s']:6.2f} segments/s  "
+            f"peak +{result['peak_mb']:6.0f} MB{note}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lang", default="ja", choices=sorted(REVERSE_MODELS))
+    parser.add_argument("--sections", type=int, default=8)
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        default=list(TRANSLATION_BACKENDS),
+        choices=TRANSLATION_BACKENDS,
+    )
+    args = parser.parse_args()
+    main(args.lang, args.sections, args.backends)
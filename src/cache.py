@@ -0,0 +1,275 @@
+"""SQLite-backed on-disk cache with TTL and size-bounded LRU eviction."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from src.config import settings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+"""
+
+
+def make_key(*parts: Any) -> str:
+    """Build a stable cache key from JSON-serializable parts.
+
+    Args:
+        *parts: Values identifying the cached item.
+
+    Returns:
+        A hex SHA-256 digest of the parts.
+    """
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    """A cached value with its creation time."""
+
+    value: Any
+    created_at: float
+
+    @property
+    def age(self) -> float:
+        """Seconds since the entry was stored."""
+        return time.time() - self.created_at
+
+
+class DiskCache:
+    """Persistent key-value cache stored in a single SQLite file.
+
+    Values must be JSON-serializable and are stored zlib-compressed. Entries
+    older than ``ttl`` seconds are treated as misses by get(). When the
+    cache grows beyond ``max_entries`` or ``max_bytes`` (compressed), the
+    least recently used entries are evicted.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        ttl: float | None = None,
+        max_entries: int = 10000,
+        max_bytes: int | None = None,
+    ) -> None:
+        """Open (or create) a cache file.
+
+        Args:
+            path: Location of the SQLite database.
+            ttl: Seconds an entry stays fresh. None means entries never expire.
+            max_entries: Maximum number of entries kept.
+            max_bytes: Maximum total compressed size. None means unbounded.
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def get_entry(self, key: str) -> CacheEntry | None:
+        """Return an entry regardless of its age, without counting a hit or miss.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The entry, or None if absent.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE entries SET accessed_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            self._conn.commit()
+
+        value = json.loads(zlib.decompress(row[0]).decode("utf-8"))
+        return CacheEntry(value=value, created_at=row[1])
+
+    def get(self, key: str) -> Any | None:
+        """Return a fresh cached value.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached value, or None if absent or expired.
+        """
+        entry = self.get_entry(key)
+        if entry is None or (self.ttl is not None and entry.age > self.ttl):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry.value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value and evict old entries if the cache is over its limits.
+
+        Args:
+            key: The cache key.
+            value: A JSON-serializable value.
+        """
+        blob = zlib.compress(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, blob, len(blob), now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Delete least recently used entries beyond the size limits."""
+        count, total = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+
+        excess = count - self.max_entries
+        if excess > 0:
+            self._delete_oldest(excess)
+            count -= excess
+
+        if self.max_bytes is None or total <= self.max_bytes:
+            return
+
+        # Walk entries from least recently used until the total fits.
+        to_free = total - self.max_bytes
+        keys: list[str] = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM entries ORDER BY accessed_at"
+        ):
+            if to_free <= 0 or len(keys) >= count - 1:
+                break
+            keys.append(key)
+            to_free -= size
+        self._conn.executemany(
+            "DELETE FROM entries WHERE key = ?", [(key,) for key in keys]
+        )
+        self.evictions += len(keys)
+
+    def _delete_oldest(self, n: int) -> None:
+        """Delete the n least recently used entries."""
+        self._conn.execute(
+            "DELETE FROM entries WHERE key IN "
+            "(SELECT key FROM entries ORDER BY accessed_at LIMIT ?)",
+            (n,),
+        )
+        self.evictions += n
+
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+        return int(row[0])
+
+    def stats(self) -> dict[str, int]:
+        """Return hit, miss and eviction counters."""
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_caches: dict[tuple[str, str], DiskCache] = {}
+
+
+def get_cache(
+    name: str,
+    *,
+    ttl: float | None = None,
+    max_entries: int = 10000,
+    max_bytes: int | None = None,
+) -> DiskCache:
+    """Return the named cache under settings.cache_dir, opening it on first use.
+
+    Limits passed on later calls update the already-open cache.
+
+    Args:
+        name: Cache name, used as the database file name.
+        ttl: Seconds an entry stays fresh. None means entries never expire.
+        max_entries: Maximum number of entries kept.
+        max_bytes: Maximum total compressed size. None means unbounded.
+
+    Returns:
+        The shared DiskCache for this name and cache directory.
+    """
+    cache_dir = str(Path(settings.cache_dir).expanduser())
+    cache = _caches.get((cache_dir, name))
+    if cache is None:
+        cache = DiskCache(
+            Path(cache_dir) / f"{name}.sqlite3",
+            ttl=ttl,
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+        )
+        _caches[(cache_dir, name)] = cache
+    else:
+        cache.ttl = ttl
+        cache.max_entries = max_entries
+        cache.max_bytes = max_bytes
+    return cache
+
+
+def cache_stats() -> dict[str, dict[str, int]]:
+    """Return counters for every open cache, keyed by cache name."""
+    return {name: cache.stats() for (_, name), cache in _caches.items()}
+
+
+def reset_cache_stats() -> None:
+    """Zero the counters of every open cache."""
+    for cache in _caches.values():
+        cache.hits = cache.misses = cache.evictions = 0
+
+
+def close_caches() -> None:
+    """Close every open cache."""
+    caches = list(_caches.values())
+    _caches.clear()
+    for cache in caches:
+        cache.close()
@@ -0,0 +1,109 @@
+"""Token-bounded splitting of markdown documents."""
+
+from __future__ import annotations
+
+import re
+
+from src.prompts.budget import count_tokens
+
+_BLANK_LINES = re.compile(r"\n\s*\n")
+
+# Progressively finer separators tried when a block is too large.
+_SEPARATORS = ("\n", ". ", " ")
+
+
+def split_markdown(text: str, max_tokens: int, *, sections: bool = True) -> list[str]:
+    """Split markdown into chunks of at most max_tokens.
+
+    Paragraphs are packed greedily into chunks. With sections, a heading
+    starts a new chunk once the current one is at least half full, so
+    sections tend to stay together at the cost of some part-filled chunks.
+    Paragraphs larger than max_tokens are split on lines, then sentences,
+    then words.
+
+    Args:
+        text: The markdown document.
+        max_tokens: Maximum estimated tokens per chunk.
+        sections: Whether headings start new chunks.
+
+    Returns:
+        The chunks in document order. Empty if text is blank.
+    """
+    blocks: list[str] = []
+    for paragraph in _BLANK_LINES.split(text):
+        paragraph = paragraph.strip()
+        if paragraph:
+            blocks.extend(_split_block(paragraph, max_tokens))
+
+    chunks: list[str] = []
+    current: list[str] = []
+    used = 0
+    for block in blocks:
+        size = count_tokens(block) + (1 if current else 0)
+        starts_section = sections and block.startswith("#") and used >= max_tokens // 2
+        if current and (used + size > max_tokens or starts_section):
+            chunks.append("\n\n".join(current))
+            current, used = [], 0
+            size = count_tokens(block)
+        current.append(block)
+        used += size
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+def _split_block(block: str, max_tokens: int, level: int = 0) -> list[str]:
+    """Split one paragraph into pieces of at most max_tokens."""
+    if count_tokens(block) <= max_tokens:
+        return [block]
+    if level >= len(_SEPARATORS):
+        # No separator left (e.g. a long run of CJK text): cut by length.
+        step = max(1, len(block) * max_tokens // count_tokens(block))
+        return [block[i : i + step] for i in range(0, len(block), step)]
+
+    separator = _SEPARATORS[level]
+    pieces: list[str] = []
+    current = ""
+    for part in block.split(separator):
+        candidate = f"{current}{separator}{part}" if current else part
+        if count_tokens(candidate) <= max_tokens:
+            current = candidate
+            continue
+        if current:
+            pieces.append(current)
+        if count_tokens(part) <= max_tokens:
+            current = part
+        else:
+            pieces.extend(_split_block(part, max_tokens, level + 1))
+            current = ""
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def group_by_tokens(items: list[str], max_tokens: int) -> list[list[str]]:
+    """Group consecutive items so each group's total stays within max_tokens.
+
+    Every group holds at least two items when available, so repeatedly
+    combining groups always makes progress.
+
+    Args:
+        items: Texts in order.
+        max_tokens: Target maximum estimated tokens per group.
+
+    Returns:
+        The groups in order.
+    """
+    groups: list[list[str]] = []
+    current: list[str] = []
+    used = 0
+    for item in items:
+        size = count_tokens(item)
+        if len(current) >= 2 and used + size > max_tokens:
+            groups.append(current)
+            current, used = [], 0
+        current.append(item)
+        used += size
+    if current:
+        groups.append(current)
+    return groups
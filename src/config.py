@@ -30,9 +30,53 @@ class Settings:
     worker_model: str = field(default="")
     max_context_length: int = field(default=4096)
     max_iterations: int = field(default=5)
+    llm_concurrency: int = field(default=1)
+    research_fanout: int = field(default=1)
+    rerank_results: bool = field(default=True)
+    # HTTP client settings
+    http_pool_limit: int = field(default=20)
+    http_pool_limit_per_host: int = field(default=10)
+    # Cache settings
+    cache_dir: str = field(default="")
+    search_cache_ttl: int = field(default=86400)
+    search_cache_max_entries: int = field(default=10000)
+    page_cache_ttl: int = field(default=86400)
+    page_cache_max_mb: int = field(default=512)
+    page_cache_serve_stale: bool = field(default=True)
+    page_cache_revalidate_timeout: float = field(default=5.0)
+    enable_llm_cache: bool = field(default=False)
+    llm_cache_ttl: int = field(default=604800)
+    llm_cache_max_entries: int = field(default=5000)
+    llm_cache_max_temperature: float = field(default=0.0)
+    summary_cache_ttl: int = field(default=604800)
+    summary_cache_max_entries: int = field(default=20000)
+    translation_memory_size: int = field(default=4096)
+    translation_cache_ttl: int = field(default=2592000)
+    translation_cache_max_entries: int = field(default=50000)
+    # Scraping settings
+    browser_pool_size: int = field(default=2)
+    browser_max_pages: int = field(default=50)
+    scrape_concurrency: int = field(default=2)
+    scrape_per_domain_limit: int = field(default=1)
+    scrape_memory_per_page_mb: int = field(default=256)
+    summary_queue_size: int = field(default=2)
+    summary_chunk_tokens: int = field(default=2048)
+    summary_max_chunks: int = field(default=8)
+    chunk_selection: bool = field(default=True)
+    scrape_triage: bool = field(default=True)
+    triage_verbatim_chars: int = field(default=500)
+    selection_passage_tokens: int = field(default=256)
+    selection_top_k: int = field(default=0)
+    selection_max_tokens: int = field(default=4096)
     # Translation settings
     enable_translation: bool = field(default=True)
     translation_device: str = field(default="auto")
+    translation_workers: int = field(default=1)
+    translation_threads: int = field(default=0)
+    translation_queue_size: int = field(default=4)
+    translation_batch_size: int = field(default=16)
+    translation_backend: str = field(default="transformers")
+    translation_preload: bool = field(default=True)
 
     def __post_init__(self) -> None:
         """Load settings from environment variables."""
@@ -42,6 +86,60 @@ class Settings:
         self.worker_model = os.getenv("WORKER_MODEL", "qwen2.5:3b")
         self.max_context_length = int(os.getenv("MAX_CONTEXT_LENGTH", "4096"))
         self.max_iterations = int(os.getenv("MAX_ITERATIONS", "5"))
+        self.llm_concurrency = int(os.getenv("LLM_CONCURRENCY", "1"))
+        self.research_fanout = int(os.getenv("RESEARCH_FANOUT", "1"))
+        self.rerank_results = os.getenv("RERANK_RESULTS", "true").lower() == "true"
+        # HTTP client settings
+        self.http_pool_limit = int(os.getenv("HTTP_POOL_LIMIT", "20"))
+        self.http_pool_limit_per_host = int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "10"))
+        # Cache settings
+        self.cache_dir = os.getenv("CACHE_DIR", "~/.cache/local-deep-research")
+        self.search_cache_ttl = int(os.getenv("SEARCH_CACHE_TTL", "86400"))
+        self.search_cache_max_entries = int(
+            os.getenv("SEARCH_CACHE_MAX_ENTRIES", "10000")
+        )
+        self.page_cache_ttl = int(os.getenv("PAGE_CACHE_TTL", "86400"))
+        self.page_cache_max_mb = int(os.getenv("PAGE_CACHE_MAX_MB", "512"))
+        self.page_cache_serve_stale = (
+            os.getenv("PAGE_CACHE_SERVE_STALE", "true").lower() == "true"
+        )
+        self.page_cache_revalidate_timeout = float(
+            os.getenv("PAGE_CACHE_REVALIDATE_TIMEOUT", "5.0")
+        )
+        self.enable_llm_cache = os.getenv("ENABLE_LLM_CACHE", "false").lower() == "true"
+        self.llm_cache_ttl = int(os.getenv("LLM_CACHE_TTL", "604800"))
+        self.llm_cache_max_entries = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+        self.llm_cache_max_temperature = float(
+            os.getenv("LLM_CACHE_MAX_TEMPERATURE", "0.0")
+        )
+        self.summary_cache_ttl = int(os.getenv("SUMMARY_CACHE_TTL", "604800"))
+        self.summary_cache_max_entries = int(
+            os.getenv("SUMMARY_CACHE_MAX_ENTRIES", "20000")
+        )
+        self.translation_memory_size = int(os.getenv("TRANSLATION_MEMORY_SIZE", "4096"))
+        self.translation_cache_ttl = int(os.getenv("TRANSLATION_CACHE_TTL", "2592000"))
+        self.translation_cache_max_entries = int(
+            os.getenv("TRANSLATION_CACHE_MAX_ENTRIES", "50000")
+        )
+        # Scraping settings
+        self.browser_pool_size = int(os.getenv("BROWSER_POOL_SIZE", "2"))
+        self.browser_max_pages = int(os.getenv("BROWSER_MAX_PAGES", "50"))
+        self.scrape_concurrency = int(os.getenv("SCRAPE_CONCURRENCY", "2"))
+        self.scrape_per_domain_limit = int(os.getenv("SCRAPE_PER_DOMAIN_LIMIT", "1"))
+        self.scrape_memory_per_page_mb = int(
+            os.getenv("SCRAPE_MEMORY_PER_PAGE_MB", "256")
+        )
+        self.summary_queue_size = int(os.getenv("SUMMARY_QUEUE_SIZE", "2"))
+        self.summary_chunk_tokens = int(os.getenv("SUMMARY_CHUNK_TOKENS", "2048"))
+        self.summary_max_chunks = int(os.getenv("SUMMARY_MAX_CHUNKS", "8"))
+        self.chunk_selection = os.getenv("CHUNK_SELECTION", "true").lower() == "true"
+        self.scrape_triage = os.getenv("SCRAPE_TRIAGE", "true").lower() == "true"
+        self.triage_verbatim_chars = int(os.getenv("TRIAGE_VERBATIM_CHARS", "500"))
+        self.selection_passage_tokens = int(
+            os.getenv("SELECTION_PASSAGE_TOKENS", "256")
+        )
+        self.selection_top_k = int(os.getenv("SELECTION_TOP_K", "0"))
+        self.selection_max_tokens = int(os.getenv("SELECTION_MAX_TOKENS", "4096"))
         # Translation settings
         self.enable_translation = (
             os.getenv("ENABLE_TRANSLATION", "true").lower() == "true"
@@ -51,6 +149,14 @@ class Settings:
         self.translation_device = (
             _detect_device() if device_setting == "auto" else device_setting
         )
+        self.translation_workers = int(os.getenv("TRANSLATION_WORKERS", "1"))
+        self.translation_threads = int(os.getenv("TRANSLATION_THREADS", "0"))
+        self.translation_queue_size = int(os.getenv("TRANSLATION_QUEUE_SIZE", "4"))
+        self.translation_batch_size = int(os.getenv("TRANSLATION_BATCH_SIZE", "16"))
+        self.translation_backend = os.getenv("TRANSLATION_BACKEND", "transformers")
+        self.translation_preload = (
+            os.getenv("TRANSLATION_PRELOAD", "true").lower() == "true"
+        )
 
 
 # Global settings instance
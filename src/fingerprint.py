@@ -0,0 +1,88 @@
+"""Content fingerprints for spotting identical and near-identical pages."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+
+SIMHASH_BITS = 64
+
+# Pages whose SimHashes differ in at most this many bits are near-duplicates.
+NEAR_DUPLICATE_DISTANCE = 3
+
+# Words per shingle used as SimHash features.
+SHINGLE_SIZE = 3
+
+_MARKDOWN_LINK = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize_text(text: str) -> str:
+    """Reduce extracted markdown to its words.
+
+    Link targets, markup, punctuation, case and whitespace are dropped, so
+    mirrors, AMP pages and print views of one article normalize alike.
+
+    Args:
+        text: Page markdown.
+
+    Returns:
+        Lowercase words separated by single spaces.
+    """
+    text = _MARKDOWN_LINK.sub(r"\1", text)
+    return _NON_WORD.sub(" ", text.lower()).strip()
+
+
+def content_hash(text: str) -> str:
+    """Return a hex SHA-256 digest of the normalized text."""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def simhash(text: str) -> int:
+    """Compute a 64-bit SimHash over word shingles of the normalized text.
+
+    Args:
+        text: Page markdown.
+
+    Returns:
+        The fingerprint. Similar texts have fingerprints with a small
+        Hamming distance.
+    """
+    words = normalize_text(text).split()
+    if len(words) < SHINGLE_SIZE:
+        shingles = [" ".join(words)]
+    else:
+        shingles = [
+            " ".join(words[i : i + SHINGLE_SIZE])
+            for i in range(len(words) - SHINGLE_SIZE + 1)
+        ]
+
+    weights = [0] * SIMHASH_BITS
+    for shingle in shingles:
+        digest = hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest()
+        value = int.from_bytes(digest, "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Return the number of differing bits between two fingerprints."""
+    return (a ^ b).bit_count()
+
+
+def find_near_duplicate(fingerprint: int, known: dict[str, int]) -> str | None:
+    """Return the key of a known fingerprint close to the given one.
+
+    Args:
+        fingerprint: SimHash of the new page.
+        known: Fingerprints of earlier pages, keyed by URL.
+
+    Returns:
+        The URL of the first near-duplicate, or None.
+    """
+    for url, other in known.items():
+        if hamming_distance(fingerprint, other) <= NEAR_DUPLICATE_DISTANCE:
+            return url
+    return None
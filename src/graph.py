@@ -5,9 +5,10 @@ from __future__ import annotations
 from typing import Any
 
 from langgraph.graph import END, START, StateGraph
+from langgraph.types import Send
 
 from src.nodes.planner import planner_node
-from src.nodes.researcher import researcher_node
+from src.nodes.researcher import dispatch_queries, researcher_node
 from src.nodes.reviewer import reviewer_node, should_continue_research
 from src.nodes.scraper import scraper_node
 from src.nodes.translator import translator_input_node, translator_output_node
@@ -15,6 +16,13 @@ from src.nodes.writer import writer_node
 from src.state import ResearchState
 
 
+def _route_after_review(state: ResearchState) -> str | list[Send]:
+    """Go to the writer when research is sufficient, else dispatch queries."""
+    if should_continue_research(state) == "writer":  # type: ignore[arg-type]
+        return "writer"
+    return dispatch_queries(state)  # type: ignore[arg-type]
+
+
 def build_graph() -> Any:
     """Build and return the research workflow graph.
 
@@ -27,6 +35,9 @@ def build_graph() -> Any:
                                                                    ↓
                                               Writer → TranslatorOutput → END
 
+    With settings.research_fanout above 1, the researcher step is fanned
+    out over several plan queries in parallel via Send.
+
     Returns:
         A compiled StateGraph ready for execution.
     """
@@ -44,15 +55,15 @@ def build_graph() -> Any:
     # Add edges
     graph.add_edge(START, "planner")
     graph.add_edge("planner", "translator_input")
-    graph.add_edge("translator_input", "researcher")
+    graph.add_conditional_edges("translator_input", dispatch_queries, ["researcher"])
     graph.add_edge("researcher", "scraper")
     graph.add_edge("scraper", "reviewer")
 
     # Conditional edge from reviewer
     graph.add_conditional_edges(
         "reviewer",
-        should_continue_research,
-        {"researcher": "researcher", "writer": "writer"},
+        _route_after_review,
+        ["researcher", "writer"],
     )
 
     graph.add_edge("writer", "translator_output")
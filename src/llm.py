@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+from typing import Any
+
 from langchain_ollama import ChatOllama
 
+from src import metrics
+from src.cache import DiskCache, get_cache, make_key
 from src.config import settings
 
 
@@ -11,17 +17,137 @@ class LLMError(Exception):
     """LLM invocation error."""
 
 
+# Sampling temperature for calls that do not ask for one.
+DEFAULT_TEMPERATURE = 0.7
+
+_clients: dict[tuple[str, str, float, str], ChatOllama] = {}
+_clients_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_llm(
+    model: str,
+    *,
+    temperature: float,
+    options: dict[str, Any] | None = None,
+) -> ChatOllama:
+    """Return a shared ChatOllama client for the given configuration.
+
+    Clients are keyed by (model, base_url, temperature, options) and reused,
+    so their HTTP connection pools survive across calls. The registry is
+    bound to the running event loop and starts afresh in a new loop.
+    num_ctx defaults to settings.max_context_length.
+
+    Args:
+        model: The Ollama model name.
+        temperature: The temperature for generation.
+        options: Extra ChatOllama parameters (e.g. num_ctx, num_predict).
+
+    Returns:
+        A ChatOllama client.
+    """
+    global _clients_loop
+
+    loop = asyncio.get_running_loop()
+    if _clients_loop is not loop:
+        _clients.clear()
+        _clients_loop = loop
+
+    # Size the context window to match the prompt budget unless overridden.
+    options = {"num_ctx": settings.max_context_length, **(options or {})}
+    key = (
+        model,
+        settings.ollama_url,
+        temperature,
+        json.dumps(options, sort_keys=True, default=str),
+    )
+    llm = _clients.get(key)
+    if llm is None:
+        llm = ChatOllama(
+            model=model,
+            base_url=settings.ollama_url,
+            temperature=temperature,
+            **options,
+        )
+        _clients[key] = llm
+    return llm
+
+
+async def close_llm_clients() -> None:
+    """Close the HTTP connections of every shared client."""
+    global _clients_loop
+
+    clients = list(_clients.values())
+    _clients.clear()
+    same_loop = _clients_loop is asyncio.get_running_loop()
+    _clients_loop = None
+
+    for llm in clients:
+        async_client = getattr(llm, "_async_client", None)
+        if same_loop and async_client is not None:
+            try:
+                await async_client.close()
+            except Exception:
+                pass
+        sync_client = getattr(llm, "_client", None)
+        if sync_client is not None:
+            try:
+                sync_client.close()
+            except Exception:
+                pass
+
+
+def _response_cache(temperature: float) -> DiskCache | None:
+    """Return the LLM response cache, or None if this call must bypass it.
+
+    Calls above settings.llm_cache_max_temperature bypass the cache because
+    their output is meant to vary between runs. The default threshold of 0
+    caches only greedy calls; call_llm's default temperature samples.
+    """
+    if not settings.enable_llm_cache or settings.llm_cache_ttl <= 0:
+        return None
+    if temperature > settings.llm_cache_max_temperature:
+        return None
+    return get_cache(
+        "llm",
+        ttl=settings.llm_cache_ttl,
+        max_entries=settings.llm_cache_max_entries,
+    )
+
+
+def cacheable_temperature() -> float:
+    """Return the temperature for calls whose responses may be reused.
+
+    With settings.enable_llm_cache on, this is the highest temperature the
+    response cache accepts (settings.llm_cache_max_temperature, 0 by
+    default), so these calls are cached. Otherwise it is DEFAULT_TEMPERATURE.
+    """
+    if settings.enable_llm_cache:
+        return min(DEFAULT_TEMPERATURE, settings.llm_cache_max_temperature)
+    return DEFAULT_TEMPERATURE
+
+
 async def call_llm(
     prompt: str,
     model: str | None = None,
-    temperature: float = 0.7,
+    temperature: float = DEFAULT_TEMPERATURE,
+    options: dict[str, Any] | None = None,
+    use_cache: bool = True,
+    format: str | dict[str, Any] | None = None,
 ) -> str:
     """Call Ollama LLM and return text response.
 
+    When settings.enable_llm_cache is on, responses are cached on disk by
+    (model, prompt, temperature, options).
+
     Args:
         prompt: The prompt to send to the LLM.
         model: The model to use. Defaults to settings.worker_model.
         temperature: The temperature for generation. Defaults to 0.7.
+        options: Extra ChatOllama parameters (e.g. num_ctx, num_predict).
+        use_cache: Whether a cached response may be returned. The fresh
+            response is still stored, replacing any cached one.
+        format: Ollama structured output mode: "json" or a JSON schema the
+            response must conform to.
 
     Returns:
         The LLM response as a string.
@@ -32,18 +158,30 @@ async def call_llm(
     if model is None:
         model = settings.worker_model
 
-    llm = ChatOllama(
-        model=model,
-        base_url=settings.ollama_url,
-        temperature=temperature,
-    )
+    if format is not None:
+        options = {**(options or {}), "format": format}
+
+    cache = _response_cache(temperature)
+    cache_key = make_key(model, prompt, temperature, options or {})
+    if cache is not None and use_cache:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return str(cached)
+
+    llm = get_llm(model, temperature=temperature, options=options)
 
     try:
         response = await llm.ainvoke(prompt)
-        return str(response.content)
+        content = str(response.content)
     except TimeoutError as e:
         raise LLMError(f"LLM call timeout: {e}") from e
     except ConnectionError as e:
         raise LLMError(f"LLM connection error: {e}") from e
     except Exception as e:
         raise LLMError(f"LLM call failed: {e}") from e
+    finally:
+        metrics.increment("llm_calls")
+
+    if cache is not None:
+        cache.set(cache_key, content)
+    return content
@@ -4,17 +4,23 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import sys
+import time
 
+from src import metrics
 from src.config import settings
 from src.graph import build_graph
-from src.llm import call_llm
+from src.llm import call_llm, close_llm_clients
 from src.nodes.planner import planner_node
 from src.prompts.templates import format_summarizer_prompt
-from src.tools.scrape import scrape
+from src.tools.http import close_http_session
+from src.tools.scrape import close_crawler_pool, scrape, start_crawler_pool
 from src.tools.search import search
 from src.tools.translate import (
+    close_translation_executor,
     detect_language,
     normalize_language_code,
+    preload_models,
     translate_from_english,
     translate_to_english,
 )
@@ -38,14 +44,36 @@ async def run_research(task: str) -> str:
         "content": [],
         "current_search_query": "",
         "references": [],
+        "reference_queries": {},
         "scraped_urls": [],
+        "referenced_keys": set(),
+        "scraped_keys": set(),
+        "search_backlog": {},
+        "content_fingerprints": {},
+        "duplicate_sources": {},
         "is_sufficient": False,
+        "review_digest": "",
+        "reviewed_count": 0,
         "report": "",
         "source_language": "",
         "original_task": "",
     }
 
-    result = await graph.ainvoke(initial_state)
+    metrics.reset()
+    started = time.perf_counter()
+    if settings.enable_translation:
+        # Overlap translation model loading with browser startup and planning.
+        preload_models(detect_language(task))
+    await start_crawler_pool()
+    try:
+        result = await graph.ainvoke(initial_state)
+    finally:
+        metrics.increment("wall_clock_seconds", time.perf_counter() - started)
+        await close_crawler_pool()
+        await close_http_session()
+        await close_llm_clients()
+        close_translation_executor()
+
     report: str = result.get("report", "")
     return report
 
@@ -58,7 +86,10 @@ async def demo_search(query: str) -> None:
     """
     print(f"Searching for: {query}")
     print("-" * 40)
-    results = await search(query, num_results=5)
+    try:
+        results = await search(query, num_results=5)
+    finally:
+        await close_http_session()
     if not results:
         print("No results found.")
         return
@@ -200,6 +231,7 @@ def main() -> None:
             return
 
         report = asyncio.run(run_research(args.input))
+        print(metrics.format_metrics(), file=sys.stderr)
 
         if args.output:
             with open(args.output, "w", encoding="utf-8") as f:
@@ -0,0 +1,78 @@
+"""Per-run counters reported at the end of a research run."""
+
+from __future__ import annotations
+
+from src.cache import cache_stats, reset_cache_stats
+
+_counters: dict[str, float] = {}
+
+
+def increment(name: str, value: float = 1) -> None:
+    """Add to a named counter.
+
+    Args:
+        name: Counter name (e.g. "llm_calls").
+        value: Amount to add.
+    """
+    _counters[name] = _counters.get(name, 0) + value
+
+
+def maximum(name: str, value: float) -> None:
+    """Raise a named counter to value if value is larger.
+
+    Args:
+        name: Counter name (e.g. "writer_prompt_tokens_max").
+        value: Observed value.
+    """
+    _counters[name] = max(_counters.get(name, 0), value)
+
+
+def get(name: str) -> float:
+    """Return the current value of a counter (0 if never incremented)."""
+    return _counters.get(name, 0)
+
+
+def snapshot() -> dict[str, float]:
+    """Return a copy of all counters."""
+    return dict(_counters)
+
+
+def reset() -> None:
+    """Zero all counters, including cache hit/miss counters."""
+    _counters.clear()
+    reset_cache_stats()
+
+
+def format_metrics() -> str:
+    """Format counters and cache hit rates for display.
+
+    Returns:
+        A multi-line human-readable summary.
+    """
+    lines = ["Run metrics:"]
+    rates: set[str] = set()
+    for name, value in sorted(_counters.items()):
+        # Counters named <base>_hits and <base>_misses are shown as a hit rate.
+        base, _, kind = name.rpartition("_")
+        if kind in ("hits", "misses"):
+            if base not in rates:
+                rates.add(base)
+                lines.append(
+                    _hit_rate(base, get(f"{base}_hits"), get(f"{base}_misses"))
+                )
+            continue
+        shown = f"{value:.2f}" if isinstance(value, float) else str(value)
+        lines.append(f"  {name}: {shown}")
+
+    for name, stats in sorted(cache_stats().items()):
+        if stats["hits"] + stats["misses"] == 0:
+            continue
+        lines.append(_hit_rate(f"{name} cache", stats["hits"], stats["misses"]))
+
+    return "\n".join(lines)
+
+
+def _hit_rate(label: str, hits: float, misses: float) -> str:
+    """Format one hit/miss line with its hit rate."""
+    rate = 100 * hits / (hits + misses) if hits + misses else 0.0
+    return f"  {label}: {hits:g} hits / {misses:g} misses ({rate:.1f}% hit rate)"
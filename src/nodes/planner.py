@@ -6,8 +6,8 @@ import json
 from typing import Any
 
 from src.config import settings
-from src.llm import LLMError, call_llm
-from src.prompts.templates import format_planner_prompt
+from src.llm import DEFAULT_TEMPERATURE, LLMError, cacheable_temperature, call_llm
+from src.prompts.templates import PLANNER_SCHEMA, format_planner_prompt
 
 MAX_RETRIES = 3
 
@@ -38,7 +38,17 @@ async def planner_node(state: dict[str, Any]) -> dict[str, Any]:
 
     for attempt in range(MAX_RETRIES):
         try:
-            response = await call_llm(prompt, model=settings.planner_model)
+            # The first attempt may be served from the response cache.
+            # Retries sample instead, since a greedy retry would repeat an
+            # unparseable plan, and skip the cache.
+            first = attempt == 0
+            response = await call_llm(
+                prompt,
+                model=settings.planner_model,
+                temperature=cacheable_temperature() if first else DEFAULT_TEMPERATURE,
+                use_cache=first,
+                format=PLANNER_SCHEMA,
+            )
             queries = _parse_queries(response)
 
             if not queries:
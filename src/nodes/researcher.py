@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
 from typing import Any
 
-from src.tools.search import SearchError, search
+from langgraph.types import Send
+
+from src import metrics
+from src.config import settings
+from src.rerank import rerank_results
+from src.tools.search import SearchError, SearchResult, search
+from src.urls import canonicalize_url
 
 MAX_URLS_PER_SEARCH = 5
 
@@ -12,46 +19,150 @@ MAX_URLS_PER_SEARCH = 5
 async def researcher_node(state: dict[str, Any]) -> dict[str, Any]:
     """Execute search queries and collect URLs.
 
+    URLs are deduplicated by their canonical form against the
+    referenced_keys index, so http/https, "www.", trailing-slash and
+    tracking-parameter variants of a known page are skipped.
+
+    Fresh search results are reranked by snippet relevance to the query
+    and task and by domain quality (see src.rerank) before URLs are taken.
+    Unused results are kept in search_backlog, keyed by query, in their
+    ranked order. A plan query already in the backlog (the planner
+    repeated it) is answered from it without a new search, which counts
+    as searches_saved. Once the plan is exhausted, further iterations draw
+    from the backlogs of all queries instead of finding nothing; no search
+    would have been issued there, so they are not counted as saved.
+
     Args:
-        state: The current research state containing plan and steps_completed.
+        state: The current research state containing plan, steps_completed,
+            referenced_keys and search_backlog.
 
     Returns:
-        A dict with current_search_query, references (new URLs), and steps_completed.
+        A dict with current_search_query, references (new URLs),
+        reference_queries (the query each new URL was found by),
+        referenced_keys (their canonical forms), search_backlog (updated
+        entries) and steps_completed.
     """
     plan = state.get("plan", [])
     steps_completed = state.get("steps_completed", 0)
-    existing_references = state.get("references", [])
+    if "referenced_keys" in state:
+        known_keys = state["referenced_keys"]
+    else:
+        known_keys = {canonicalize_url(url) for url in state.get("references", [])}
+    backlog: dict[str, list[dict[str, Any]]] = state.get("search_backlog", {})
 
-    if steps_completed >= len(plan):
-        return {
-            "current_search_query": "",
-            "references": [],
-            "steps_completed": steps_completed,
+    if steps_completed < len(plan):
+        current_query = plan[steps_completed]
+        queued = backlog.get(current_query)
+        if queued:
+            metrics.increment("searches_saved")
+            candidates = {current_query: [SearchResult(**item) for item in queued]}
+        else:
+            try:
+                results = await search(
+                    current_query, num_results=MAX_URLS_PER_SEARCH * 2
+                )
+            except SearchError:
+                return {
+                    "current_search_query": current_query,
+                    "references": [],
+                    "steps_completed": steps_completed + 1,
+                }
+            if settings.rerank_results:
+                task = state.get("task", "")
+                results = rerank_results(results, f"{current_query} {task}")
+            candidates = {current_query: results}
+    else:
+        candidates = {
+            query: [SearchResult(**item) for item in items]
+            for query, items in backlog.items()
+            if items
         }
+        if not candidates:
+            return {
+                "current_search_query": "",
+                "references": [],
+                "steps_completed": steps_completed,
+            }
+        current_query = next(iter(candidates))
 
-    current_query = plan[steps_completed]
+    new_urls, new_keys, leftovers = _take_new_results(candidates, known_keys)
 
-    try:
-        results = await search(current_query, num_results=MAX_URLS_PER_SEARCH * 2)
-    except SearchError:
-        return {
-            "current_search_query": current_query,
-            "references": [],
-            "steps_completed": steps_completed + 1,
-        }
+    return {
+        "current_search_query": current_query,
+        "references": list(new_urls),
+        "reference_queries": new_urls,
+        "referenced_keys": new_keys,
+        "search_backlog": leftovers,
+        "steps_completed": steps_completed + 1,
+    }
+
+
+def _take_new_results(
+    candidates: dict[str, list[SearchResult]], known_keys: set[str]
+) -> tuple[dict[str, str], set[str], dict[str, list[dict[str, Any]]]]:
+    """Pick up to MAX_URLS_PER_SEARCH unseen URLs from ranked result lists.
+
+    Lists are consumed round-robin, so with several queries each contributes
+    its best results first.
 
-    new_urls = []
-    existing_set = set(existing_references)
+    Args:
+        candidates: Ranked results per query.
+        known_keys: Canonical URLs already referenced.
+
+    Returns:
+        The new URLs in order, each mapped to the query it was found by,
+        their canonical forms, and the unused unseen results per query
+        (serialized, in ranked order) for the backlog.
+    """
+    queues = {query: list(results) for query, results in candidates.items()}
+    new_urls: dict[str, str] = {}
+    new_keys: set[str] = set()
 
-    for result in results:
-        if result.url and result.url not in existing_set:
-            new_urls.append(result.url)
-            existing_set.add(result.url)
+    while len(new_urls) < MAX_URLS_PER_SEARCH and any(queues.values()):
+        for query, results in queues.items():
+            while results:
+                result = results.pop(0)
+                key = canonicalize_url(result.url) if result.url else ""
+                if key and key not in known_keys and key not in new_keys:
+                    new_urls[result.url] = query
+                    new_keys.add(key)
+                    break
             if len(new_urls) >= MAX_URLS_PER_SEARCH:
                 break
 
-    return {
-        "current_search_query": current_query,
-        "references": new_urls,
-        "steps_completed": steps_completed + 1,
-    }
+    leftovers = {}
+    for query, results in queues.items():
+        unseen = []
+        for result in results:
+            key = canonicalize_url(result.url) if result.url else ""
+            if key and key not in known_keys and key not in new_keys:
+                unseen.append(asdict(result))
+        leftovers[query] = unseen
+    return new_urls, new_keys, leftovers
+
+
+def dispatch_queries(state: dict[str, Any]) -> str | list[Send]:
+    """Route to the researcher, fanning out over several plan queries.
+
+    With settings.research_fanout above 1, up to that many pending plan
+    queries are searched in parallel, each in its own researcher branch.
+    Their references are merged by the state reducers and the scraper runs
+    once for all of them.
+
+    Args:
+        state: The current research state containing plan and steps_completed.
+
+    Returns:
+        "researcher" for a single query, or one Send per parallel query.
+    """
+    plan = state.get("plan", [])
+    steps_completed = state.get("steps_completed", 0)
+    pending = len(plan) - steps_completed
+    fanout = min(settings.research_fanout, pending)
+
+    if fanout <= 1:
+        return "researcher"
+    return [
+        Send("researcher", {**state, "steps_completed": steps_completed + offset})
+        for offset in range(fanout)
+    ]
@@ -7,7 +7,11 @@ from typing import Any
 
 from src.config import settings
 from src.llm import call_llm
-from src.prompts.templates import format_reviewer_prompt
+from src.prompts.templates import (
+    REVIEWER_SCHEMA,
+    format_reviewer_prompt,
+    select_reviewer_content,
+)
 
 MIN_ITERATIONS = 2
 
@@ -15,16 +19,28 @@ MIN_ITERATIONS = 2
 async def reviewer_node(state: dict[str, Any]) -> dict[str, Any]:
     """Evaluate if gathered information is sufficient.
 
+    The review is incremental: only summaries added since the previous
+    review are sent, together with the running digest the reviewer wrote
+    last time, so the prompt does not grow with the length of the run.
+    Summaries that do not fit the prompt whole are left for the next
+    review, and reviewed_count only advances past the ones that were sent.
+
     Args:
-        state: The current research state with task, content, and steps_completed.
+        state: The current research state with task, content, steps_completed,
+            review_digest and reviewed_count.
 
     Returns:
-        A dict with is_sufficient (bool).
+        A dict with is_sufficient (bool) and, after an LLM review, the
+        updated review_digest and reviewed_count.
     """
     task = state.get("task", "")
     content = state.get("content", [])
     steps_completed = state.get("steps_completed", 0)
+    digest = state.get("review_digest", "")
+    reviewed_count = state.get("reviewed_count", 0)
 
+    # steps_completed counts plan queries searched, so with research_fanout
+    # above 1 one research loop can advance it by several.
     if steps_completed >= settings.max_iterations:
         return {"is_sufficient": True}
 
@@ -32,16 +48,29 @@ async def reviewer_node(state: dict[str, Any]) -> dict[str, Any]:
     if steps_completed < MIN_ITERATIONS:
         return {"is_sufficient": False}
 
-    prompt = format_reviewer_prompt(task, content)
-    response = await call_llm(prompt, model=settings.worker_model)
+    batch = select_reviewer_content(task, content[reviewed_count:], digest)
+    prompt = format_reviewer_prompt(task, batch, digest)
+    response = await call_llm(
+        prompt, model=settings.worker_model, format=REVIEWER_SCHEMA
+    )
 
     try:
         data = json.loads(response)
-        is_sufficient = data.get("sufficient", False)
     except json.JSONDecodeError:
-        is_sufficient = False
+        # Keep reviewed_count so the same content is reviewed again next time.
+        return {"is_sufficient": False}
 
-    return {"is_sufficient": is_sufficient}
+    is_sufficient = data.get("sufficient", False)
+    new_digest = data.get("digest")
+    if not isinstance(new_digest, str) or not new_digest.strip():
+        # Without a digest the new content would be forgotten; review it again.
+        return {"is_sufficient": is_sufficient}
+
+    return {
+        "is_sufficient": is_sufficient,
+        "review_digest": new_digest.strip(),
+        "reviewed_count": reviewed_count + len(batch),
+    }
 
 
 def should_continue_research(state: dict[str, Any]) -> str:
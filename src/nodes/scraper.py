@@ -2,52 +2,418 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import re
+from typing import Any, Literal
 
+from src import metrics
+from src.cache import DiskCache, get_cache, make_key
+from src.chunking import group_by_tokens, split_markdown
 from src.config import settings
-from src.llm import call_llm
-from src.prompts.templates import format_summarizer_prompt
-from src.tools.scrape import scrape_multiple
+from src.fingerprint import content_hash, find_near_duplicate, simhash
+from src.llm import cacheable_temperature, call_llm
+from src.prompts.budget import count_tokens
+from src.prompts.templates import format_combine_prompt, format_summarizer_prompt
+from src.retrieval import select_passages, tokenize
+from src.tools.scrape import ScrapeResult, scrape_stream
+from src.urls import canonicalize_url
 
-MAX_CONTENT_FOR_SUMMARY = 10000
+# Word limits for per-chunk summaries and the final page summary.
+CHUNK_SUMMARY_WORDS = 200
+SUMMARY_WORDS = 500
+
+# Phrases typical of cookie walls, bot checks and error pages. They only
+# mark a page as boilerplate when it is shorter than BOILERPLATE_MAX_CHARS,
+# since real articles often mention cookies in their footer.
+BOILERPLATE_MARKERS = (
+    "accept all cookies",
+    "cookie settings",
+    "we use cookies",
+    "enable javascript",
+    "javascript is disabled",
+    "are you a robot",
+    "verify you are human",
+    "captcha",
+    "access denied",
+    "403 forbidden",
+    "page not found",
+    "404 not found",
+    "subscribe to continue",
+    "sign in to continue",
+)
+BOILERPLATE_MAX_CHARS = 3000
+
+# Pages where links make up more of the text than this are navigation.
+MAX_LINK_TEXT_RATIO = 0.6
+
+# Pages with at least this many terms but none from the query are off-topic.
+OFF_TOPIC_MIN_TERMS = 200
+
+_MARKDOWN_LINK = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+
+Triage = Literal["summarize", "verbatim", "drop"]
 
 
 async def scraper_node(state: dict[str, Any]) -> dict[str, Any]:
     """Scrape URLs and summarize content.
 
+    Scraping and summarization run as a pipeline: each page is queued for
+    summarization as soon as it has been scraped, so browser I/O overlaps
+    with LLM inference. The queue is bounded by settings.summary_queue_size,
+    which keeps only in-flight pages in memory. All LLM calls, including
+    the per-chunk calls for long pages, share settings.llm_concurrency
+    slots. Summaries are returned in the order of the input URLs.
+
+    Pages are triaged first (see _triage): short pages are kept verbatim
+    and boilerplate or off-topic pages are dropped, both without an LLM
+    call. Long pages are narrowed to the passages most relevant to the
+    search query that found them and the task (see _select_relevant).
+    Each page is judged against its own query from reference_queries, since
+    researchers fanned out in parallel each search a different one.
+
+    A page whose SimHash is close to one already summarized in this run
+    (mirrors, AMP pages, syndicated copies) gets no summary of its own; it
+    is recorded in duplicate_sources against the original page's URL.
+    Summaries are also cached on disk by a hash of the normalized text sent
+    for summarization, so identical content at another URL or in a later
+    run is not summarized again.
+
     Args:
-        state: The current research state containing references.
+        state: The current research state containing references,
+            reference_queries, scraped_keys, content_fingerprints,
+            current_search_query and task.
 
     Returns:
-        A dict with content (list of summaries with source URLs) and scraped_urls.
+        A dict with content (list of summaries with source URLs),
+        scraped_urls, scraped_keys, content_fingerprints and
+        duplicate_sources.
     """
     references = state.get("references", [])
-    scraped_urls = set(state.get("scraped_urls", []))
+    if "scraped_keys" in state:
+        scraped_keys = state["scraped_keys"]
+    else:
+        scraped_keys = {canonicalize_url(url) for url in state.get("scraped_urls", [])}
 
-    # Filter out already scraped URLs
-    urls_to_scrape = [url for url in references if url not in scraped_urls]
+    # Skip pages already scraped under any URL variant; parallel
+    # researchers may also have found the same page.
+    pending: dict[str, str] = {}
+    for url in references:
+        key = canonicalize_url(url)
+        if key not in scraped_keys and key not in pending:
+            pending[key] = url
+    urls_to_scrape = list(pending.values())
+    reference_queries = state.get("reference_queries", {})
+    fallback_query = state.get("current_search_query", "")
+    queries = [
+        _relevance_query(reference_queries.get(url, fallback_query), state)
+        for url in urls_to_scrape
+    ]
 
     if not urls_to_scrape:
-        return {"content": [], "scraped_urls": []}
+        return {
+            "content": [],
+            "scraped_urls": [],
+            "scraped_keys": set(),
+            "content_fingerprints": {},
+            "duplicate_sources": {},
+        }
+
+    workers = max(1, settings.llm_concurrency)
+    llm_slots = asyncio.Semaphore(workers)
+    queue: asyncio.Queue[tuple[int, ScrapeResult] | None] = asyncio.Queue(
+        maxsize=max(1, settings.summary_queue_size)
+    )
+    scraped: dict[int, str] = {}
+    summaries: dict[int, str] = {}
+    known_fingerprints = dict(state.get("content_fingerprints", {}))
+    fingerprints: dict[str, int] = {}
+    duplicates: dict[str, str] = {}
+
+    async def produce() -> None:
+        async for index, result in scrape_stream(urls_to_scrape):
+            scraped[index] = result.url
+            if not (result.success and result.markdown):
+                continue
+            decision = _triage(result.markdown, queries[index])
+            if decision == "verbatim":
+                summaries[index] = f"{result.markdown.strip()}\n\nSource: {result.url}"
+            elif decision == "summarize":
+                fingerprint = simhash(result.markdown)
+                original = find_near_duplicate(fingerprint, known_fingerprints)
+                if original is not None:
+                    duplicates[result.url] = original
+                    metrics.increment("near_duplicates")
+                    metrics.increment("llm_calls_avoided")
+                    continue
+                known_fingerprints[result.url] = fingerprint
+                fingerprints[result.url] = fingerprint
+                await queue.put((index, result))
+        for _ in range(workers):
+            await queue.put(None)
+
+    async def consume() -> None:
+        while (item := await queue.get()) is not None:
+            index, result = item
+            summaries[index] = await _summarize(result, queries[index], llm_slots)
+
+    tasks = [asyncio.create_task(produce())]
+    tasks.extend(asyncio.create_task(consume()) for _ in range(workers))
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    return {
+        "content": [summaries[index] for index in sorted(summaries)],
+        "scraped_urls": [scraped[index] for index in sorted(scraped)],
+        "scraped_keys": set(pending),
+        "content_fingerprints": fingerprints,
+        "duplicate_sources": duplicates,
+    }
+
+
+def _relevance_query(search_query: str, state: dict[str, Any]) -> str:
+    """Return the text a page's relevance is judged by: its query and the task."""
+    return " ".join(part for part in (search_query, state.get("task", "")) if part)
+
 
-    scrape_results = await scrape_multiple(urls_to_scrape)
+def _triage(text: str, query: str) -> Triage:
+    """Decide whether a page is worth an LLM summarization call.
 
-    summaries = []
-    newly_scraped = []
-    for result in scrape_results:
-        newly_scraped.append(result.url)
+    Args:
+        text: The page markdown.
+        query: The search query and task.
+
+    Returns:
+        "drop" for boilerplate, navigation and off-topic pages, "verbatim"
+        for pages short enough to keep as they are, otherwise "summarize".
+    """
+    if not settings.scrape_triage:
+        return "summarize"
+
+    stripped = text.strip()
+    lowered = stripped.lower()
+    decision: Triage = "summarize"
+    if len(stripped) < BOILERPLATE_MAX_CHARS and any(
+        marker in lowered for marker in BOILERPLATE_MARKERS
+    ):
+        decision = "drop"
+    elif _link_text_ratio(stripped) > MAX_LINK_TEXT_RATIO:
+        decision = "drop"
+    elif len(stripped) < settings.triage_verbatim_chars:
+        decision = "verbatim"
+    else:
+        page_terms = tokenize(stripped)
+        query_terms = set(tokenize(query))
+        if (
+            query_terms
+            and len(page_terms) >= OFF_TOPIC_MIN_TERMS
+            and query_terms.isdisjoint(page_terms)
+        ):
+            decision = "drop"
+
+    if decision == "drop":
+        metrics.increment("pages_dropped")
+    elif decision == "verbatim":
+        metrics.increment("pages_verbatim")
+    if decision != "summarize":
+        metrics.increment("llm_calls_avoided")
+    return decision
+
+
+def _link_text_ratio(text: str) -> float:
+    """Return the share of non-whitespace characters that are link text."""
+    visible = _MARKDOWN_LINK.sub(r"\1", text)
+    total = sum(1 for ch in visible if not ch.isspace())
+    if total == 0:
+        return 1.0
+    linked = sum(
+        1
+        for match in _MARKDOWN_LINK.finditer(text)
+        for ch in match.group(1)
+        if not ch.isspace()
+    )
+    return linked / total
 
-        if not result.success or not result.markdown:
-            continue
 
-        content_to_summarize = result.markdown
-        if len(content_to_summarize) > MAX_CONTENT_FOR_SUMMARY:
-            content_to_summarize = content_to_summarize[:MAX_CONTENT_FOR_SUMMARY]
+def _summary_cache() -> DiskCache | None:
+    """Return the content-hash summary cache, or None if it is disabled."""
+    if settings.summary_cache_ttl <= 0:
+        return None
+    return get_cache(
+        "summaries",
+        ttl=settings.summary_cache_ttl,
+        max_entries=settings.summary_cache_max_entries,
+    )
+
+
+async def _summarize(
+    result: ScrapeResult, query: str, llm_slots: asyncio.Semaphore
+) -> str:
+    """Summarize a scraped page and attach its source URL.
+
+    The page is first reduced to its passages relevant to query. Summaries
+    are looked up before any LLM call by the worker model, the chunking
+    settings and a hash of the normalized text that would be summarized,
+    so a page narrowed differently for another query gets its own summary.
+
+    Args:
+        result: A successful scrape result.
+        query: Text the summary should be relevant to.
+        llm_slots: Semaphore bounding concurrent LLM calls.
+
+    Returns:
+        The summary followed by a source line.
+    """
+    text = _select_relevant(result.markdown, query)
+    cache = _summary_cache()
+    cache_key = make_key(
+        settings.worker_model,
+        settings.summary_chunk_tokens,
+        settings.summary_max_chunks,
+        content_hash(text),
+    )
+    summary = cache.get(cache_key) if cache is not None else None
+    if summary is not None:
+        metrics.increment("summaries_reused")
+        metrics.increment("llm_calls_avoided")
+    else:
+        summary = await _summarize_text(text, llm_slots)
+        if cache is not None:
+            cache.set(cache_key, summary)
+    return f"{summary}\n\nSource: {result.url}"
 
-        prompt = format_summarizer_prompt(content_to_summarize)
-        summary = await call_llm(prompt, model=settings.worker_model)
 
-        summary_with_source = f"{summary}\n\nSource: {result.url}"
-        summaries.append(summary_with_source)
+async def _summarize_text(text: str, llm_slots: asyncio.Semaphore) -> str:
+    """Summarize page text with as few worker-model calls as it needs.
+
+    Text within settings.summary_chunk_tokens is summarized in one call.
+    Longer text is split into chunks on headings and paragraphs, the chunks
+    are summarized concurrently, and the partial summaries are combined
+    into one. If heading breaks give more than settings.summary_max_chunks
+    chunks, the text is repacked without them. Text that still does not
+    fit is cut, and the tokens lost are counted in summary_tokens_dropped.
+
+    Args:
+        text: The page markdown, already narrowed by _select_relevant.
+        llm_slots: Semaphore bounding concurrent LLM calls.
+
+    Returns:
+        The summary.
+    """
+    chunk_tokens = settings.summary_chunk_tokens
+    if count_tokens(text) <= chunk_tokens:
+        return await _call(format_summarizer_prompt(text, SUMMARY_WORDS), llm_slots)
+
+    max_chunks = max(1, settings.summary_max_chunks)
+    chunks = split_markdown(text, chunk_tokens)
+    if len(chunks) > max_chunks:
+        chunks = split_markdown(text, chunk_tokens, sections=False)
+    if len(chunks) > max_chunks:
+        dropped = sum(count_tokens(chunk) for chunk in chunks[max_chunks:])
+        metrics.increment("summary_tokens_dropped", dropped)
+        chunks = chunks[:max_chunks]
+    metrics.increment("chunked_pages")
+    metrics.increment("summary_chunks", len(chunks))
+
+    partials = list(
+        await asyncio.gather(
+            *(
+                _call(format_summarizer_prompt(chunk, CHUNK_SUMMARY_WORDS), llm_slots)
+                for chunk in chunks
+            )
+        )
+    )
+    return await _reduce(partials, llm_slots)
+
+
+def _selection_budget() -> int:
+    """Return the token budget for passages kept by _select_relevant.
+
+    settings.selection_max_tokens defaults to two summary chunks, well below
+    the scrape() length cap, so the long pages it returns are narrowed to
+    their relevant part. 0, or a budget larger than the chunked
+    summarization path can take, means that capacity instead.
+    """
+    capacity = _summary_capacity()
+    if not settings.chunk_selection or settings.selection_max_tokens <= 0:
+        return capacity
+    return min(settings.selection_max_tokens, capacity)
+
+
+def _summary_capacity() -> int:
+    """Return how many tokens the chunked summarization path can take."""
+    return settings.summary_chunk_tokens * max(1, settings.summary_max_chunks)
+
+
+def _select_relevant(text: str, query: str) -> str:
+    """Keep only the passages of a long page that are relevant to the query.
+
+    Pages within the selection budget (see _selection_budget) are returned
+    unchanged. Longer pages are split into passages of
+    settings.selection_passage_tokens and the best by BM25 score are kept
+    (at most settings.selection_top_k if set), within the budget, in
+    document order. With settings.chunk_selection off, pages are still
+    narrowed this way to what the chunked summarization path can take,
+    rather than losing their tail.
+
+    Args:
+        text: The page markdown.
+        query: The search query and task.
+
+    Returns:
+        The selected text.
+    """
+    if not query:
+        return text
+    budget = _selection_budget()
+    total = count_tokens(text)
+    if total <= budget:
+        return text
+
+    passages = split_markdown(text, settings.selection_passage_tokens)
+    top_k = settings.selection_top_k if settings.chunk_selection else 0
+    selected = "\n\n".join(
+        select_passages(
+            passages,
+            query,
+            top_k=top_k or len(passages),
+            max_tokens=budget,
+        )
+    )
+    metrics.increment("selection_tokens_dropped", total - count_tokens(selected))
+    return selected
+
+
+async def _reduce(partials: list[str], llm_slots: asyncio.Semaphore) -> str:
+    """Combine partial summaries, in several rounds if they do not fit one prompt.
+
+    Args:
+        partials: Summaries of consecutive chunks, in order.
+        llm_slots: Semaphore bounding concurrent LLM calls.
+
+    Returns:
+        The combined summary.
+    """
+    while len(partials) > 1:
+        groups = group_by_tokens(partials, settings.summary_chunk_tokens)
+        partials = list(
+            await asyncio.gather(
+                *(
+                    _call(format_combine_prompt(group, SUMMARY_WORDS), llm_slots)
+                    for group in groups
+                )
+            )
+        )
+    return partials[0]
+
 
-    return {"content": summaries, "scraped_urls": newly_scraped}
+async def _call(prompt: str, llm_slots: asyncio.Semaphore) -> str:
+    """Run one summarization call once an LLM slot is free."""
+    async with llm_slots:
+        return await call_llm(
+            prompt, model=settings.worker_model, temperature=cacheable_temperature()
+        )
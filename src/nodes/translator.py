@@ -6,9 +6,14 @@ from typing import Any
 
 from src.config import settings
 from src.tools.translate import (
+    REVERSE_MODELS,
+    SUPPORTED_LANGUAGES,
     TranslationError,
     detect_language,
+    model_ready,
     normalize_language_code,
+    preload_models,
+    run_translation,
     translate_from_english,
     translate_to_english,
 )
@@ -23,6 +28,9 @@ class TranslatorError(Exception):
 async def translator_input_node(state: dict[str, Any]) -> dict[str, Any]:
     """Detect language and translate task to English if needed.
 
+    Translation runs in the translation executor, off the event loop, once
+    the forward model has finished loading in the background.
+
     Args:
         state: The current research state containing the task.
 
@@ -56,9 +64,15 @@ async def translator_input_node(state: dict[str, Any]) -> dict[str, Any]:
             "task": task,
         }
 
+    # Load the models in the background (run_research may have started this
+    # already); the reverse model keeps loading while research runs.
+    preload_models(source_language)
+
     # Translate to English
     try:
-        result = translate_to_english(task, source_language)
+        if normalized_lang in SUPPORTED_LANGUAGES:
+            await model_ready(SUPPORTED_LANGUAGES[normalized_lang])
+        result = await run_translation(translate_to_english, task, source_language)
         translated_task = result.translated_text
     except TranslationError:
         # Keep original task if translation fails
@@ -74,6 +88,9 @@ async def translator_input_node(state: dict[str, Any]) -> dict[str, Any]:
 async def translator_output_node(state: dict[str, Any]) -> dict[str, Any]:
     """Translate report back to source language if needed.
 
+    Translation runs in the translation executor, off the event loop, once
+    the reverse model preloaded by translator_input_node is ready.
+
     Args:
         state: The current research state containing report and source_language.
 
@@ -95,7 +112,9 @@ async def translator_output_node(state: dict[str, Any]) -> dict[str, Any]:
 
     # Translate report to source language
     try:
-        result = translate_from_english(report, source_language)
+        if normalized_lang in REVERSE_MODELS:
+            await model_ready(REVERSE_MODELS[normalized_lang])
+        result = await run_translation(translate_from_english, report, source_language)
         return {"report": result.translated_text}
     except TranslationError:
         # Keep English report if translation fails
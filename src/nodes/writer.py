@@ -16,8 +16,12 @@ class WriterError(Exception):
 async def writer_node(state: dict[str, Any]) -> dict[str, Any]:
     """Generate the final research report.
 
+    References whose content duplicates another page are listed with the
+    URL of the page whose summary covers them.
+
     Args:
-        state: The current research state with task, content, and references.
+        state: The current research state with task, content, references
+            and duplicate_sources.
 
     Returns:
         A dict with report (str).
@@ -27,7 +31,11 @@ async def writer_node(state: dict[str, Any]) -> dict[str, Any]:
     """
     task = state.get("task", "")
     content = state.get("content", [])
-    references = state.get("references", [])
+    duplicates = state.get("duplicate_sources", {})
+    references = [
+        f"{url} (same content as {duplicates[url]})" if url in duplicates else url
+        for url in state.get("references", [])
+    ]
 
     prompt = format_writer_prompt(task, content, references)
 
@@ -0,0 +1,191 @@
+"""Token budgeting so prompts fit the model context window.
+
+Token counts come from a calibrated character-based estimator rather than
+the model's own tokenizer, which Ollama does not expose. The estimate is
+deliberately on the high side so packed prompts stay within num_ctx.
+"""
+
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+
+from src import metrics
+from src.config import settings
+
+# Average characters per token for ASCII text with the BPE tokenizers used
+# by the Qwen, Llama and DeepSeek families. Non-ASCII characters (CJK in
+# particular) are counted as one token each.
+ASCII_CHARS_PER_TOKEN = 4.0
+
+# Smallest slice of content worth keeping when an item must be shortened.
+MIN_ITEM_TOKENS = 64
+
+# Never leave less than this fraction of the context for the prompt, even
+# when the requested response reserve would take more.
+MIN_PROMPT_FRACTION = 0.5
+
+TRUNCATION_MARKER = " [...]"
+
+
+def _estimate(text: str) -> int:
+    """Estimate the token count of text without caching."""
+    ascii_chars = sum(1 for ch in text if ch.isascii())
+    other_chars = len(text) - ascii_chars
+    return math.ceil(ascii_chars / ASCII_CHARS_PER_TOKEN) + other_chars
+
+
+@lru_cache(maxsize=4096)
+def count_tokens(text: str) -> int:
+    """Estimate the number of tokens in text.
+
+    Results are cached, since the same summaries are counted on every
+    reviewer and writer call.
+
+    Args:
+        text: The text to measure.
+
+    Returns:
+        The estimated token count.
+    """
+    return _estimate(text)
+
+
+def prompt_budget(reserve: int) -> int:
+    """Return the tokens available for a prompt.
+
+    Args:
+        reserve: Tokens kept free for the model's response.
+
+    Returns:
+        settings.max_context_length minus the reserve, but at least
+        MIN_PROMPT_FRACTION of the context.
+    """
+    context = settings.max_context_length
+    return max(context - reserve, int(context * MIN_PROMPT_FRACTION))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Shorten text to at most max_tokens, cutting at a word boundary.
+
+    Args:
+        text: The text to shorten.
+        max_tokens: Maximum estimated tokens of the result.
+
+    Returns:
+        The text unchanged if it fits, otherwise a prefix ending with
+        TRUNCATION_MARKER.
+    """
+    if count_tokens(text) <= max_tokens:
+        return text
+    limit = max_tokens - _estimate(TRUNCATION_MARKER)
+    if limit <= 0:
+        return ""
+
+    # Binary search for the longest prefix that fits.
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if _estimate(text[:mid]) <= limit:
+            low = mid
+        else:
+            high = mid - 1
+
+    prefix = text[:low]
+    cut = prefix.rfind(" ")
+    if cut > low * 0.8:
+        prefix = prefix[:cut]
+    return prefix.rstrip() + TRUNCATION_MARKER
+
+
+def fit_to_budget(items: list[str], budget: int, separator: str = "\n\n") -> list[str]:
+    """Pack items into a token budget.
+
+    If everything fits, items are returned unchanged. Otherwise the budget
+    is shared fairly: items shorter than an equal share are kept whole and
+    the longest ones are truncated to what remains. Earlier items take
+    priority; trailing items are dropped only when each kept item would get
+    fewer than MIN_ITEM_TOKENS.
+
+    Args:
+        items: Content items in priority order.
+        budget: Tokens available for the joined items.
+        separator: String placed between items when joined.
+
+    Returns:
+        The items that fit, some possibly truncated.
+    """
+    sizes = [count_tokens(item) for item in items]
+    sep_tokens = count_tokens(separator)
+    if sum(sizes) + sep_tokens * max(len(items) - 1, 0) <= budget:
+        return list(items)
+
+    kept = len(items)
+    while kept > 1 and budget - sep_tokens * (kept - 1) < kept * MIN_ITEM_TOKENS:
+        kept -= 1
+    available = budget - sep_tokens * max(kept - 1, 0)
+    if available <= 0:
+        return []
+
+    # Water-filling: smallest items first, each capped at an equal share
+    # of whatever budget is left.
+    caps = [0] * kept
+    remaining = available
+    order = sorted(range(kept), key=lambda i: sizes[i])
+    for position, index in enumerate(order):
+        share = remaining // (kept - position)
+        caps[index] = min(sizes[index], share)
+        remaining -= caps[index]
+
+    return [truncate_to_tokens(items[i], caps[i]) for i in range(kept)]
+
+
+def take_whole_items(items: list[str], budget: int, separator: str = "\n") -> list[str]:
+    """Return the longest prefix of items that fits the budget untruncated.
+
+    Used for lists such as URLs where a partial item is useless.
+
+    Args:
+        items: Items in priority order.
+        budget: Tokens available for the joined items.
+        separator: String placed between items when joined.
+
+    Returns:
+        The leading items that fit.
+    """
+    sep_tokens = count_tokens(separator)
+    used = 0
+    kept: list[str] = []
+    for item in items:
+        cost = count_tokens(item) + (sep_tokens if kept else 0)
+        if used + cost > budget:
+            break
+        kept.append(item)
+        used += cost
+    return kept
+
+
+def report_prompt(kind: str, prompt: str, compressed: bool) -> int:
+    """Record the size of a built prompt in the run metrics.
+
+    Besides the run totals, each prompt type gets its own counters
+    (<kind>_prompts, <kind>_prompt_tokens, <kind>_prompts_compressed) and
+    the size of its largest prompt (<kind>_prompt_tokens_max), so the
+    budget of each call site can be checked against max_context_length.
+
+    Args:
+        kind: The prompt type, e.g. "planner" or "writer".
+        prompt: The final prompt text.
+        compressed: Whether content had to be dropped or truncated to fit.
+
+    Returns:
+        The estimated token count of the prompt.
+    """
+    tokens = count_tokens(prompt)
+    for prefix in ("", f"{kind}_"):
+        metrics.increment(f"{prefix}prompts")
+        metrics.increment(f"{prefix}prompt_tokens", tokens)
+        if compressed:
+            metrics.increment(f"{prefix}prompts_compressed")
+    metrics.maximum(f"{kind}_prompt_tokens_max", tokens)
+    return tokens
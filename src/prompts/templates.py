@@ -2,6 +2,17 @@
 
 from __future__ import annotations
 
+from typing import Any
+
+from src.prompts.budget import (
+    count_tokens,
+    fit_to_budget,
+    prompt_budget,
+    report_prompt,
+    take_whole_items,
+    truncate_to_tokens,
+)
+
 PLANNER_PROMPT = """You are a research planner. Given a user query, generate search queries to gather comprehensive information.
 
 User Query: {task}
@@ -16,6 +27,16 @@ Rules:
 - Example: "quantum computer basics", "qubit error correction"
 """
 
+# JSON schemas passed to Ollama's structured output mode so responses
+# always parse into the shape the prompts ask for.
+PLANNER_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "queries": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["queries"],
+}
+
 SUMMARIZER_PROMPT = """Summarize the following content concisely in {max_length} words or less.
 Focus on the key facts and information relevant to research.
 
@@ -23,17 +44,41 @@ Content:
 {content}
 """
 
-REVIEWER_PROMPT = """Evaluate if the following information is sufficient to answer the query.
+COMBINE_PROMPT = """The following are summaries of consecutive parts of one document.
+Combine them into a single concise summary of {max_length} words or less.
+Remove repetition and keep the key facts and information relevant to research.
+
+Partial summaries:
+{summaries}
+"""
+
+REVIEWER_PROMPT = """Evaluate if the information gathered so far is sufficient to answer the query.
 
 Query: {task}
 
-Information gathered:
+Digest of information reviewed earlier:
+{digest}
+
+New information:
 {content}
 
 Respond with a JSON object:
-{{"sufficient": true or false, "reason": "brief explanation"}}
+{{"sufficient": true or false, "reason": "brief explanation", "digest": "updated digest"}}
+
+The digest must merge the earlier digest with the new information into a
+short list of covered points and remaining gaps, at most {digest_words} words.
 """
 
+REVIEWER_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "sufficient": {"type": "boolean"},
+        "reason": {"type": "string"},
+        "digest": {"type": "string"},
+    },
+    "required": ["sufficient", "reason", "digest"],
+}
+
 WRITER_PROMPT = """Write a comprehensive research report based on the gathered information.
 
 Query: {task}
@@ -52,6 +97,20 @@ Write a well-structured report in Markdown format with:
 """
 
 
+# Tokens kept free for each prompt's response within max_context_length.
+PLANNER_RESPONSE_TOKENS = 512
+SUMMARIZER_RESPONSE_TOKENS = 1024
+REVIEWER_RESPONSE_TOKENS = 512
+
+# Length limit for the reviewer's running digest.
+REVIEWER_DIGEST_WORDS = 200
+REVIEWER_DIGEST_TOKENS = 512
+WRITER_RESPONSE_TOKENS = 1536
+
+# Share of the writer budget the reference list may take.
+MAX_REFERENCES_FRACTION = 0.25
+
+
 def format_planner_prompt(task: str) -> str:
     """Format the planner prompt with the given task.
 
@@ -66,12 +125,20 @@ def format_planner_prompt(task: str) -> str:
     """
     if not task or not task.strip():
         raise ValueError("task cannot be empty")
-    return PLANNER_PROMPT.format(task=task)
+    available = prompt_budget(PLANNER_RESPONSE_TOKENS) - count_tokens(
+        PLANNER_PROMPT.format(task="")
+    )
+    fitted = truncate_to_tokens(task, available)
+    prompt = PLANNER_PROMPT.format(task=fitted)
+    report_prompt("planner", prompt, compressed=fitted != task)
+    return prompt
 
 
 def format_summarizer_prompt(content: str, max_length: int = 500) -> str:
     """Format the summarizer prompt with the given content.
 
+    Content that does not fit the token budget is truncated.
+
     Args:
         content: The content to summarize.
         max_length: Maximum length of the summary in words.
@@ -79,26 +146,113 @@ def format_summarizer_prompt(content: str, max_length: int = 500) -> str:
     Returns:
         The formatted prompt string.
     """
-    return SUMMARIZER_PROMPT.format(content=content, max_length=max_length)
+    available = prompt_budget(SUMMARIZER_RESPONSE_TOKENS) - count_tokens(
+        SUMMARIZER_PROMPT.format(content="", max_length=max_length)
+    )
+    fitted = truncate_to_tokens(content, available)
+    prompt = SUMMARIZER_PROMPT.format(content=fitted, max_length=max_length)
+    report_prompt("summarizer", prompt, compressed=fitted != content)
+    return prompt
+
 
+def format_combine_prompt(summaries: list[str], max_length: int = 500) -> str:
+    """Format the prompt that merges partial summaries of one document.
 
-def format_reviewer_prompt(task: str, content: list[str]) -> str:
-    """Format the reviewer prompt with task and gathered content.
+    Partial summaries are packed into the token budget with fit_to_budget().
+
+    Args:
+        summaries: Summaries of consecutive parts of the document, in order.
+        max_length: Maximum length of the combined summary in words.
+
+    Returns:
+        The formatted prompt string.
+    """
+    available = prompt_budget(SUMMARIZER_RESPONSE_TOKENS) - count_tokens(
+        COMBINE_PROMPT.format(summaries="", max_length=max_length)
+    )
+    fitted = fit_to_budget(summaries, available)
+    prompt = COMBINE_PROMPT.format(summaries="\n\n".join(fitted), max_length=max_length)
+    report_prompt("combine", prompt, compressed=fitted != summaries)
+    return prompt
+
+
+def _reviewer_digest(digest: str) -> str:
+    """Return the digest text as shown in the reviewer prompt."""
+    return (
+        truncate_to_tokens(digest, REVIEWER_DIGEST_TOKENS) or "(Nothing reviewed yet)"
+    )
+
+
+def select_reviewer_content(
+    task: str, content: list[str], digest: str = ""
+) -> list[str]:
+    """Return the leading new summaries that fit the reviewer prompt.
+
+    Summaries are taken whole, in order, while they fit the token budget
+    left after the task and digest; the rest wait for the next review. A
+    first summary too large for the budget on its own is truncated, since
+    it could never be sent whole.
 
     Args:
         task: The original research question.
-        content: List of summaries gathered during research.
+        content: Summaries gathered since the last review.
+        digest: The reviewer's digest of earlier content, if any.
+
+    Returns:
+        The summaries to review now, in order.
+    """
+    available = prompt_budget(REVIEWER_RESPONSE_TOKENS) - count_tokens(
+        REVIEWER_PROMPT.format(
+            task=task,
+            digest=_reviewer_digest(digest),
+            content="",
+            digest_words=REVIEWER_DIGEST_WORDS,
+        )
+    )
+    selected = take_whole_items(content, available, separator="\n\n")
+    if content and not selected:
+        selected = [truncate_to_tokens(content[0], available)]
+    return selected
+
+
+def format_reviewer_prompt(task: str, content: list[str], digest: str = "") -> str:
+    """Format the reviewer prompt with task, running digest and new content.
+
+    Only content not yet folded into the digest should be passed, so the
+    prompt size stays roughly constant across iterations. The digest is
+    capped at REVIEWER_DIGEST_TOKENS and the new content is cut down with
+    select_reviewer_content(); callers that track what was reviewed should
+    select the content themselves and pass only that.
+
+    Args:
+        task: The original research question.
+        content: Summaries gathered since the last review.
+        digest: The reviewer's digest of earlier content, if any.
 
     Returns:
         The formatted prompt string.
     """
-    content_text = "\n\n".join(content)
-    return REVIEWER_PROMPT.format(task=task, content=content_text)
+    fitted_digest = truncate_to_tokens(digest, REVIEWER_DIGEST_TOKENS)
+    digest_text = _reviewer_digest(digest)
+    fitted = select_reviewer_content(task, content, digest)
+    prompt = REVIEWER_PROMPT.format(
+        task=task,
+        digest=digest_text,
+        content="\n\n".join(fitted) or "(No new information)",
+        digest_words=REVIEWER_DIGEST_WORDS,
+    )
+    report_prompt(
+        "reviewer", prompt, compressed=fitted != content or fitted_digest != digest
+    )
+    return prompt
 
 
 def format_writer_prompt(task: str, content: list[str], references: list[str]) -> str:
     """Format the writer prompt for final report generation.
 
+    The reference list is capped at MAX_REFERENCES_FRACTION of the token
+    budget and content is packed into the rest with fit_to_budget().
+
     Args:
         task: The original research question.
         content: List of summaries gathered during research.
@@ -107,11 +261,27 @@ def format_writer_prompt(task: str, content: list[str], references: list[str]) -
     Returns:
         The formatted prompt string.
     """
-    content_text = "\n\n".join(content)
+    budget = prompt_budget(WRITER_RESPONSE_TOKENS)
     if references:
-        references_text = "\n".join(f"- {url}" for url in references)
+        lines = take_whole_items(
+            [f"- {url}" for url in references],
+            int(budget * MAX_REFERENCES_FRACTION),
+        )
+        references_text = "\n".join(lines)
     else:
+        lines = []
         references_text = "(No references available)"
-    return WRITER_PROMPT.format(
-        task=task, content=content_text, references=references_text
+
+    available = budget - count_tokens(
+        WRITER_PROMPT.format(task=task, content="", references=references_text)
+    )
+    fitted = fit_to_budget(content, available)
+    prompt = WRITER_PROMPT.format(
+        task=task, content="\n\n".join(fitted), references=references_text
+    )
+    report_prompt(
+        "writer",
+        prompt,
+        compressed=fitted != content or len(lines) < len(references),
     )
+    return prompt
@@ -0,0 +1,103 @@
+"""Rerank search results by snippet relevance and domain quality."""
+
+from __future__ import annotations
+
+from urllib.parse import urlsplit
+
+from src.retrieval import bm25_scores
+from src.tools.search import SearchResult
+
+# Weights of the three signals; relevance dominates, SearXNG's own order
+# breaks ties.
+RELEVANCE_WEIGHT = 1.0
+DOMAIN_WEIGHT = 0.3
+POSITION_WEIGHT = 0.2
+
+# Domains (and their subdomains) that tend to hold primary or reference
+# material, and ones that rarely yield scrapable text worth summarizing.
+PREFERRED_DOMAINS = (
+    "wikipedia.org",
+    "arxiv.org",
+    "nature.com",
+    "sciencedirect.com",
+    "acm.org",
+    "ieee.org",
+    "nih.gov",
+    "python.org",
+    "readthedocs.io",
+    "github.com",
+    "stackoverflow.com",
+)
+PREFERRED_SUFFIXES = (".edu", ".gov", ".ac.jp", ".go.jp", ".ac.uk", ".gov.uk")
+DISCOURAGED_DOMAINS = (
+    "pinterest.com",
+    "facebook.com",
+    "instagram.com",
+    "tiktok.com",
+    "twitter.com",
+    "x.com",
+    "youtube.com",
+    "quora.com",
+    "amazon.com",
+    "ebay.com",
+)
+
+
+def domain_prior(url: str) -> float:
+    """Return a quality prior for the URL's domain.
+
+    Args:
+        url: The result URL.
+
+    Returns:
+        1.0 for preferred domains, -1.0 for discouraged ones, else 0.0.
+    """
+    try:
+        host = (urlsplit(url).hostname or "").rstrip(".")
+    except ValueError:
+        return 0.0
+
+    def matches(domain: str) -> bool:
+        return host == domain or host.endswith(f".{domain}")
+
+    if any(matches(domain) for domain in DISCOURAGED_DOMAINS):
+        return -1.0
+    if any(matches(domain) for domain in PREFERRED_DOMAINS) or host.endswith(
+        PREFERRED_SUFFIXES
+    ):
+        return 1.0
+    return 0.0
+
+
+def rerank_results(results: list[SearchResult], query: str) -> list[SearchResult]:
+    """Order search results by how promising they are to scrape.
+
+    Each result's title and snippet are scored with BM25 against the query
+    (normalized to the best score in the list), then combined with a
+    domain-quality prior and the result's original position.
+
+    Args:
+        results: Results in SearXNG order.
+        query: The search query and task.
+
+    Returns:
+        The same results, best first.
+    """
+    if len(results) < 2:
+        return list(results)
+
+    relevance = bm25_scores(
+        [f"{result.title} {result.snippet}" for result in results], query
+    )
+    best = max(relevance) or 1.0
+    count = len(results)
+
+    def score(index: int) -> float:
+        return (
+            RELEVANCE_WEIGHT * relevance[index] / best
+            + DOMAIN_WEIGHT * domain_prior(results[index].url)
+            + POSITION_WEIGHT * (1 - index / count)
+        )
+
+    order = sorted(range(count), key=lambda i: -score(i))
+    return [results[i] for i in order]
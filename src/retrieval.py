@@ -0,0 +1,119 @@
+"""Lightweight BM25 scoring for selecting relevant passages on the CPU."""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+
+from src.prompts.budget import count_tokens
+
+# Standard Okapi BM25 parameters.
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+_WORD = re.compile(r"[^\W\d_]+|\d+")
+_CJK = re.compile(r"[぀-ヿ㐀-䶿一-鿿가-힯]+")
+
+# Very common English words that carry no relevance signal.
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have how in is it its of on or "
+    "that the this to was were what when where which who why will with".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase terms for scoring.
+
+    Runs of CJK characters have no spaces between words, so they are split
+    into overlapping character bigrams instead.
+
+    Args:
+        text: The text to tokenize.
+
+    Returns:
+        The terms, with stopwords removed.
+    """
+    terms: list[str] = []
+    for word in _WORD.findall(text.lower()):
+        if _CJK.fullmatch(word):
+            terms.extend(word[i : i + 2] for i in range(max(1, len(word) - 1)))
+        elif word not in STOPWORDS:
+            terms.append(word)
+    return terms
+
+
+def bm25_scores(documents: list[str], query: str) -> list[float]:
+    """Score documents against a query with Okapi BM25.
+
+    Document frequencies are computed over the given documents, so scores
+    are relative to this collection (e.g. the chunks of one page).
+
+    Args:
+        documents: The texts to score.
+        query: The query text.
+
+    Returns:
+        One score per document, in order. Higher is more relevant.
+    """
+    query_terms = set(tokenize(query))
+    doc_terms = [Counter(tokenize(document)) for document in documents]
+    if not query_terms or not documents:
+        return [0.0] * len(documents)
+
+    lengths = [sum(terms.values()) for terms in doc_terms]
+    average_length = sum(lengths) / len(lengths) or 1.0
+    n = len(documents)
+
+    idf = {}
+    for term in query_terms:
+        df = sum(1 for terms in doc_terms if term in terms)
+        idf[term] = math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    scores = []
+    for terms, length in zip(doc_terms, lengths, strict=True):
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+        score = 0.0
+        for term in query_terms:
+            tf = terms.get(term, 0)
+            if tf:
+                score += idf[term] * tf * (BM25_K1 + 1) / (tf + norm)
+        scores.append(score)
+    return scores
+
+
+def select_passages(
+    passages: list[str], query: str, *, top_k: int, max_tokens: int
+) -> list[str]:
+    """Keep the passages most relevant to a query within a token budget.
+
+    Passages are taken in order of BM25 score until top_k passages or
+    max_tokens are reached, then returned in their original order so the
+    selection still reads as a document. Passages with no query terms are
+    only used when nothing scores at all.
+
+    Args:
+        passages: The passages of one document, in order.
+        query: The query text.
+        top_k: Maximum number of passages kept.
+        max_tokens: Maximum estimated tokens of the kept passages.
+
+    Returns:
+        The selected passages in document order.
+    """
+    scores = bm25_scores(passages, query)
+    ranked = sorted(range(len(passages)), key=lambda i: -scores[i])
+    if any(score > 0 for score in scores):
+        ranked = [i for i in ranked if scores[i] > 0]
+
+    chosen: list[int] = []
+    used = 0
+    for index in ranked:
+        if len(chosen) >= top_k:
+            break
+        size = count_tokens(passages[index])
+        if chosen and used + size > max_tokens:
+            continue
+        chosen.append(index)
+        used += size
+    return [passages[i] for i in sorted(chosen)]
@@ -0,0 +1,249 @@
+"""Markdown-aware splitting of documents into translatable segments."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+
+# Marian models are trained on sentences; longer segments are split at
+# clause boundaries, then cut, to stay well within their input limit.
+MAX_SEGMENT_CHARS = 400
+
+_FENCE = re.compile(r"^\s*(```|~~~)")
+# Block markup kept in front of a line's text: headings, quotes, list items.
+_LINE_PREFIX = re.compile(
+    r"^\s*(?:#{1,6}\s+|>\s?|[-*+]\s+(?:\[[ xX]\]\s+)?|\d+[.)]\s+)*"
+)
+_TABLE_RULE = re.compile(r"^\s*\|?\s*:?-{3,}:?\s*(?:\|\s*:?-{3,}:?\s*)*\|?\s*$")
+_TABLE_CELL = re.compile(r"(\|)")
+# Inline spans copied verbatim: code, link targets and brackets, URLs,
+# citation markers such as [1] or [2, 3], HTML tags and emphasis markers.
+# Code and bare URLs end the sentence around them; the others stay in it
+# as placeholders (see _BREAKING).
+_PROTECTED = re.compile(
+    r"`[^`\n]+`"
+    r"|\]\([^)\s]*\)"
+    r"|!?\[(?=[^\]\n]*\]\()"
+    r"|https?://[^\s<>()\[\]]+"
+    r"|\[\d+(?:\s*[,\-–]\s*\d+)*\]"
+    r"|<[^>\n]+>"
+    r"|\*\*|__"
+)
+_BREAKING = ("`", "http://", "https://")
+# Placeholder for the n-th protected span of a segment. Matched leniently
+# on the way back, since models may change its case or spacing.
+_PLACEHOLDER = "<x{}>"
+_PLACEHOLDER_BACK = re.compile(r"<\s*x\s*(\d+)\s*>", re.IGNORECASE)
+_SENTENCE_BREAK = re.compile(r"((?<=[.!?])\s+(?=\S)|(?<=[。！？]))")
+_CLAUSE_BREAK = re.compile(r"(?<=[,;:、，；])")
+_HAS_WORD = re.compile(r"[^\W\d_]")
+_CJK_CHAR = re.compile(
+    r"[\u3000-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uff00-\uffef]"
+)
+
+
+@dataclass
+class SegmentedText:
+    """A document split into pieces, some of which are to be translated.
+
+    Joining all pieces reproduces the document. Pieces at segment_indices
+    hold translatable text; the others hold markup, whitespace, code and
+    URLs that are copied unchanged. Inline markup and citation markers
+    within a sentence are replaced in its segment by placeholders (<x0>,
+    <x1>, ...) and the spans they stand for are kept in placeholders.
+    """
+
+    pieces: list[str] = field(default_factory=list)
+    segment_indices: list[int] = field(default_factory=list)
+    placeholders: list[list[str]] = field(default_factory=list)
+
+    @property
+    def segments(self) -> list[str]:
+        """Return the translatable segments in document order."""
+        return [self.pieces[i] for i in self.segment_indices]
+
+    def join(self, translations: list[str]) -> str:
+        """Reassemble the document with the segments replaced.
+
+        Args:
+            translations: One translation per segment, in order.
+
+        Returns:
+            The document with markup and protected spans unchanged. Spans
+            whose placeholder a translation lost are appended to it.
+        """
+        pieces = list(self.pieces)
+        for index, translation, spans in zip(
+            self.segment_indices, translations, self.placeholders, strict=True
+        ):
+            pieces[index] = _restore(translation, spans, keep_missing=True)
+        # CJK sentences follow each other without a space; their
+        # translations into a spaced language need one.
+        segments = set(self.segment_indices)
+        for index in self.segment_indices:
+            before, after = pieces[index - 1][-1:], pieces[index][:1]
+            if index - 1 in segments and _spaced(before) and _spaced(after):
+                pieces[index] = f" {pieces[index]}"
+        return "".join(pieces)
+
+    def _verbatim(self, text: str) -> None:
+        if text:
+            self.pieces.append(text)
+
+    def _segment(self, text: str, spans: list[str]) -> None:
+        # Number the segment's own placeholders from 0, so the same sentence
+        # reads the same wherever it occurs.
+        own: list[str] = []
+
+        def renumber(match: re.Match[str]) -> str:
+            own.append(spans[int(match.group(1))])
+            return _PLACEHOLDER.format(len(own) - 1)
+
+        self.segment_indices.append(len(self.pieces))
+        self.pieces.append(_PLACEHOLDER_BACK.sub(renumber, text))
+        self.placeholders.append(own)
+
+
+def segment_markdown(text: str) -> SegmentedText:
+    """Split markdown into sentence-level segments for translation.
+
+    Fenced code blocks and table rules are kept whole; headings, quotes and
+    list markers stay in front of their text; inline code and URLs are cut
+    out of the surrounding sentence. Emphasis markers, link brackets and
+    targets, citation markers and HTML tags stay in the sentence as
+    placeholders. The remaining text is split into sentences, and
+    sentences longer than MAX_SEGMENT_CHARS into clauses.
+
+    Args:
+        text: The markdown document.
+
+    Returns:
+        The segmented document.
+    """
+    document = SegmentedText()
+    in_fence = False
+    lines = text.split("\n")
+    for number, line in enumerate(lines):
+        if _FENCE.match(line):
+            in_fence = not in_fence
+            document._verbatim(line)
+        elif in_fence or _TABLE_RULE.match(line):
+            document._verbatim(line)
+        elif line.lstrip().startswith("|"):
+            for cell in _TABLE_CELL.split(line):
+                if cell == "|":
+                    document._verbatim(cell)
+                else:
+                    _add_inline(document, cell)
+        else:
+            prefix = _LINE_PREFIX.match(line)
+            end = prefix.end() if prefix else 0
+            document._verbatim(line[:end])
+            _add_inline(document, line[end:])
+        if number < len(lines) - 1:
+            document._verbatim("\n")
+    return document
+
+
+def _add_inline(document: SegmentedText, text: str) -> None:
+    """Add one line of inline text, masking or cutting out protected spans."""
+    masked = ""
+    spans: list[str] = []
+    position = 0
+    for match in _PROTECTED.finditer(text):
+        span = match.group()
+        masked += text[position : match.start()]
+        if span.startswith(_BREAKING):
+            _add_sentences(document, masked, spans)
+            document._verbatim(span)
+            masked, spans = "", []
+        else:
+            masked += _PLACEHOLDER.format(len(spans))
+            spans.append(span)
+        position = match.end()
+    _add_sentences(document, masked + text[position:], spans)
+
+
+def _add_sentences(document: SegmentedText, text: str, spans: list[str]) -> None:
+    """Add masked text as sentence segments, keeping spacing verbatim.
+
+    Args:
+        document: The document to add to.
+        text: Plain text with placeholders for the protected spans.
+        spans: The spans the placeholders in text stand for.
+    """
+    for part in _SENTENCE_BREAK.split(text):
+        stripped = part.strip()
+        if not stripped or not _HAS_WORD.search(_PLACEHOLDER_BACK.sub("", stripped)):
+            document._verbatim(_restore(part, spans))
+            continue
+        start = part.index(stripped)
+        document._verbatim(part[:start])
+        pieces = _split_long(stripped)
+        for index, piece in enumerate(pieces):
+            if index and _spaced(pieces[index - 1][-1]):
+                document._verbatim(" ")
+            document._segment(piece, spans)
+        document._verbatim(part[start + len(stripped) :])
+
+
+def _restore(text: str, spans: list[str], *, keep_missing: bool = False) -> str:
+    """Replace placeholders in text with the spans they stand for.
+
+    Args:
+        text: Text with placeholders, e.g. a segment's translation.
+        spans: The spans, indexed by placeholder number.
+        keep_missing: Whether to append spans whose placeholder is absent,
+            so a model dropping one does not lose e.g. a citation.
+
+    Returns:
+        The text with the spans put back.
+    """
+    used: set[int] = set()
+
+    def replace(match: re.Match[str]) -> str:
+        number = int(match.group(1))
+        if number >= len(spans):
+            return match.group()
+        used.add(number)
+        return spans[number]
+
+    restored = _PLACEHOLDER_BACK.sub(replace, text)
+    if keep_missing:
+        missing = [span for number, span in enumerate(spans) if number not in used]
+        if missing:
+            restored = f"{restored} {''.join(missing)}"
+    return restored
+
+
+def _split_long(sentence: str) -> list[str]:
+    """Split a sentence longer than MAX_SEGMENT_CHARS at clause boundaries."""
+    if len(sentence) <= MAX_SEGMENT_CHARS:
+        return [sentence]
+
+    pieces: list[str] = []
+    current = ""
+    for clause in _CLAUSE_BREAK.split(sentence):
+        clause = clause.strip()
+        if not clause:
+            continue
+        joiner = " " if current and _spaced(clause[0]) else ""
+        if len(current) + len(joiner) + len(clause) <= MAX_SEGMENT_CHARS:
+            current = f"{current}{joiner}{clause}"
+            continue
+        if current:
+            pieces.append(current)
+        while len(clause) > MAX_SEGMENT_CHARS:
+            cut = clause.rfind(" ", 0, MAX_SEGMENT_CHARS)
+            cut = cut if cut > 0 else MAX_SEGMENT_CHARS
+            pieces.append(clause[:cut].strip())
+            clause = clause[cut:].strip()
+        current = clause
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def _spaced(char: str) -> bool:
+    """Return whether a character belongs to a script that separates words."""
+    return bool(char) and not _CJK_CHAR.match(char)
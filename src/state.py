@@ -2,8 +2,138 @@
 
 from __future__ import annotations
 
-import operator
-from typing import Annotated, TypedDict
+from collections.abc import Iterable
+from typing import Annotated, Any, Self, SupportsIndex, TypedDict, overload
+
+
+class UniqueList(list[str]):
+    """A list of strings that skips items it already holds.
+
+    Membership is tracked in a set, so `in` checks and appends are O(1).
+    Nodes read it as a plain list. Every list operation that adds, replaces
+    or removes items keeps the set in step; operations that would add a
+    duplicate keep the first occurrence instead.
+    """
+
+    def __init__(self, items: Iterable[str] = ()) -> None:
+        """Create the list from items, dropping duplicates."""
+        super().__init__()
+        self._members: set[str] = set()
+        self.extend(items)
+
+    def __contains__(self, item: object) -> bool:
+        """Check membership in O(1)."""
+        return item in self._members
+
+    def append(self, item: str) -> None:
+        """Append item unless it is already present."""
+        if item not in self._members:
+            self._members.add(item)
+            super().append(item)
+
+    def extend(self, items: Iterable[str]) -> None:
+        """Append each item that is not already present."""
+        for item in items:
+            self.append(item)
+
+    def __iadd__(self, items: Iterable[str]) -> Self:  # type: ignore[override,misc]
+        """Extend in place with the items not already present."""
+        self.extend(items)
+        return self
+
+    def __imul__(self, count: SupportsIndex) -> Self:
+        """Repeating a list of unique items leaves it unchanged (or empty)."""
+        if count.__index__() <= 0:
+            self.clear()
+        return self
+
+    def insert(self, index: SupportsIndex, item: str) -> None:
+        """Insert item at index unless it is already present."""
+        if item not in self._members:
+            self._members.add(item)
+            super().insert(index, item)
+
+    @overload
+    def __setitem__(self, index: SupportsIndex, item: str) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, item: Iterable[str]) -> None: ...
+
+    def __setitem__(self, index: SupportsIndex | slice, item: Any) -> None:
+        """Replace items, then drop any duplicates the new items introduced."""
+        items = list(self)
+        items[index] = item
+        self._replace(items)
+
+    def __delitem__(self, index: SupportsIndex | slice) -> None:
+        """Delete items and forget them."""
+        super().__delitem__(index)
+        self._members = set(self)
+
+    def remove(self, item: str) -> None:
+        """Remove item, raising ValueError if it is not present."""
+        super().remove(item)
+        self._members.discard(item)
+
+    def pop(self, index: SupportsIndex = -1) -> str:
+        """Remove and return the item at index."""
+        item = super().pop(index)
+        self._members.discard(item)
+        return item
+
+    def clear(self) -> None:
+        """Remove all items."""
+        super().clear()
+        self._members.clear()
+
+    def _replace(self, items: Iterable[str]) -> None:
+        """Replace the contents with items, keeping first occurrences."""
+        super().clear()
+        self._members = set()
+        self.extend(items)
+
+    def copy(self) -> UniqueList:
+        """Return a shallow copy without rehashing the items."""
+        duplicate = UniqueList()
+        list.extend(duplicate, self)
+        duplicate._members = self._members.copy()
+        return duplicate
+
+    def __reduce__(self) -> tuple[type[UniqueList], tuple[list[str]]]:
+        """Pickle and deepcopy as the class applied to the plain items."""
+        return (UniqueList, (list(self),))
+
+
+def _add_unique(old: list[str], new: list[str]) -> list[str]:
+    """Reducer that appends new items not already present, keeping order.
+
+    The existing value is copied rather than mutated, so earlier snapshots
+    of the state stay intact. Plain lists (e.g. restored from a checkpoint)
+    are converted once.
+    """
+    merged = old.copy() if isinstance(old, UniqueList) else UniqueList(old)
+    merged.extend(new)
+    return merged
+
+
+def _latest(_old: str, new: str) -> str:
+    """Reducer that keeps the most recent value."""
+    return new
+
+
+def _merge(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
+    """Reducer that merges dict updates into the existing dict."""
+    return {**old, **new}
+
+
+def _union(old: set[str], new: set[str]) -> set[str]:
+    """Reducer that adds new members to a set."""
+    return old | new
+
+
+def _maximum(old: int, new: int) -> int:
+    """Reducer that keeps the larger value, so parallel branches don't conflict."""
+    return max(old, new)
 
 
 class ResearchState(TypedDict):
@@ -12,12 +142,23 @@ class ResearchState(TypedDict):
     Attributes:
         task: The original user query/research question (may be translated to English).
         plan: List of search queries derived from the task.
-        steps_completed: Number of research iterations completed.
-        content: Accumulated summaries from scraped pages (uses Annotated for appending).
+        steps_completed: Number of plan queries processed (max of parallel updates).
+        content: Accumulated summaries from scraped pages (appended without duplicates).
         current_search_query: The query being processed in the current iteration.
-        references: List of source URLs for citations.
-        scraped_urls: List of URLs that have already been scraped (to avoid duplicates).
+        references: List of source URLs for citations (appended without duplicates).
+        reference_queries: The search query that found each reference, keyed by
+            URL, so pages are judged against their own query under fan-out.
+        scraped_urls: List of URLs that have already been scraped (appended without
+            duplicates).
+        referenced_keys: Canonical URLs of every reference (dedup index).
+        scraped_keys: Canonical URLs of every scraped page (dedup index).
+        search_backlog: Unused search results per query, in ranked order.
+        content_fingerprints: SimHash of each summarized page, keyed by URL.
+        duplicate_sources: URLs whose content duplicates an already summarized
+            page, mapped to that page's URL.
         is_sufficient: Flag indicating if gathered information is sufficient.
+        review_digest: Reviewer's running digest of the content reviewed so far.
+        reviewed_count: Number of content items already folded into the digest.
         report: The final generated research report.
         source_language: ISO 639-1 language code of the original task (e.g., "ja", "en").
         original_task: The original user query before translation.
@@ -25,12 +166,20 @@ class ResearchState(TypedDict):
 
     task: str
     plan: list[str]
-    steps_completed: int
-    content: Annotated[list[str], operator.add]
-    current_search_query: str
-    references: Annotated[list[str], operator.add]
-    scraped_urls: Annotated[list[str], operator.add]
+    steps_completed: Annotated[int, _maximum]
+    content: Annotated[list[str], _add_unique]
+    current_search_query: Annotated[str, _latest]
+    references: Annotated[list[str], _add_unique]
+    reference_queries: Annotated[dict[str, str], _merge]
+    scraped_urls: Annotated[list[str], _add_unique]
+    referenced_keys: Annotated[set[str], _union]
+    scraped_keys: Annotated[set[str], _union]
+    search_backlog: Annotated[dict[str, list[dict[str, Any]]], _merge]
+    content_fingerprints: Annotated[dict[str, int], _merge]
+    duplicate_sources: Annotated[dict[str, str], _merge]
     is_sufficient: bool
+    review_digest: str
+    reviewed_count: int
     report: str
     source_language: str
     original_task: str
@@ -0,0 +1,56 @@
+"""Shared aiohttp session for outbound HTTP requests."""
+
+from __future__ import annotations
+
+import asyncio
+
+import aiohttp
+
+from src.config import settings
+
+# Seconds to keep resolved host names and idle keep-alive connections.
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 30.0
+
+_session: aiohttp.ClientSession | None = None
+_session_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _create_connector() -> aiohttp.TCPConnector:
+    """Create the pooled connector used by the shared session."""
+    return aiohttp.TCPConnector(
+        limit=settings.http_pool_limit,
+        limit_per_host=settings.http_pool_limit_per_host,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+    )
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Return the shared session, creating it on first use.
+
+    The session is bound to the running event loop; a new one is created
+    when called from a different loop (e.g. a later asyncio.run()).
+
+    Returns:
+        A pooled aiohttp.ClientSession with keep-alive enabled.
+    """
+    global _session, _session_loop
+
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession(connector=_create_connector())
+        _session_loop = loop
+    return _session
+
+
+async def close_http_session() -> None:
+    """Close the shared session, if it is open in the running loop."""
+    global _session, _session_loop
+
+    session, _session = _session, None
+    loop, _session_loop = _session_loop, None
+    if session is None or session.closed:
+        return
+    if loop is asyncio.get_running_loop():
+        await session.close()
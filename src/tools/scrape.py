@@ -3,11 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from typing import Any
 from urllib.parse import urlparse
 
+import aiohttp
 from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
 
+from src.cache import CacheEntry, DiskCache, get_cache, make_key
+from src.config import settings
+from src.tools.http import get_http_session
+from src.urls import canonicalize_url
+
 
 @dataclass
 class ScrapeResult:
@@ -26,6 +37,195 @@ class ScrapeError(Exception):
     pass
 
 
+@dataclass
+class _PooledCrawler:
+    """A browser owned by the pool, with its usage bookkeeping."""
+
+    crawler: AsyncWebCrawler
+    pages_served: int = 0
+    healthy: bool = True
+
+
+def _browser_connected(crawler: AsyncWebCrawler) -> bool:
+    """Check whether a crawler's Playwright browser is still connected.
+
+    crawl4ai sets ``ready`` once at start and never clears it, so a browser
+    that crashed or lost its connection between scrapes is only visible
+    through the underlying Playwright Browser.
+    """
+    manager = getattr(
+        getattr(crawler, "crawler_strategy", None), "browser_manager", None
+    )
+    if manager is None:
+        return True
+    browser = getattr(manager, "browser", None)
+    return browser is not None and bool(browser.is_connected())
+
+
+class CrawlerPool:
+    """Bounded pool of long-lived headless browsers.
+
+    Browsers are launched lazily on first borrow and kept running between
+    scrapes. A browser is recycled (closed and replaced on the next borrow)
+    once it has served ``max_pages_per_browser`` pages, when a scrape on it
+    raised, or when its browser process has exited or disconnected.
+    """
+
+    def __init__(self, size: int, max_pages_per_browser: int) -> None:
+        """Initialize the pool.
+
+        Args:
+            size: Maximum number of browsers alive (and borrowed) at once.
+            max_pages_per_browser: Pages a browser may serve before recycling.
+
+        Raises:
+            ValueError: If size or max_pages_per_browser is not positive.
+        """
+        if size < 1:
+            raise ValueError("size must be positive")
+        if max_pages_per_browser < 1:
+            raise ValueError("max_pages_per_browser must be positive")
+
+        self.size = size
+        self.max_pages_per_browser = max_pages_per_browser
+        self._slots = asyncio.Semaphore(size)
+        self._idle: list[_PooledCrawler] = []
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        """Whether the pool has been shut down."""
+        return self._closed
+
+    def _is_healthy(self, member: _PooledCrawler) -> bool:
+        """Check whether a browser can serve another page."""
+        return (
+            member.healthy
+            and member.pages_served < self.max_pages_per_browser
+            and getattr(member.crawler, "ready", True) is not False
+            and _browser_connected(member.crawler)
+        )
+
+    async def _launch(self) -> _PooledCrawler:
+        """Start a new headless browser."""
+        crawler = AsyncWebCrawler(config=BrowserConfig(headless=True))
+        await crawler.start()
+        return _PooledCrawler(crawler=crawler)
+
+    async def _retire(self, member: _PooledCrawler) -> None:
+        """Close a browser, ignoring errors from an already-dead process."""
+        try:
+            await member.crawler.close()
+        except Exception:
+            pass
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[AsyncWebCrawler]:
+        """Borrow a browser for the duration of the context.
+
+        Waits while all browsers are borrowed.
+
+        Yields:
+            A started AsyncWebCrawler.
+
+        Raises:
+            ScrapeError: If the pool has been closed.
+        """
+        if self._closed:
+            raise ScrapeError("crawler pool is closed")
+
+        async with self._slots:
+            member: _PooledCrawler | None = None
+            while self._idle:
+                candidate = self._idle.pop()
+                if self._is_healthy(candidate):
+                    member = candidate
+                    break
+                await self._retire(candidate)
+
+            if member is None:
+                member = await self._launch()
+
+            try:
+                yield member.crawler
+            except BaseException:
+                member.healthy = False
+                raise
+            finally:
+                member.pages_served += 1
+                if self._closed or not self._is_healthy(member):
+                    await self._retire(member)
+                else:
+                    self._idle.append(member)
+
+    async def close(self) -> None:
+        """Close all idle browsers; borrowed ones close when returned."""
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for member in idle:
+            await self._retire(member)
+
+
+_pool: CrawlerPool | None = None
+
+
+async def start_crawler_pool(
+    size: int | None = None,
+    max_pages_per_browser: int | None = None,
+) -> CrawlerPool:
+    """Create the shared crawler pool used by scrape().
+
+    Calling this while a pool is already running returns the existing pool.
+
+    Args:
+        size: Number of browsers. Defaults to settings.browser_pool_size.
+        max_pages_per_browser: Pages per browser before recycling.
+            Defaults to settings.browser_max_pages.
+
+    Returns:
+        The shared CrawlerPool.
+    """
+    global _pool
+
+    if _pool is not None and not _pool.closed:
+        return _pool
+
+    _pool = CrawlerPool(
+        size=size if size is not None else settings.browser_pool_size,
+        max_pages_per_browser=(
+            max_pages_per_browser
+            if max_pages_per_browser is not None
+            else settings.browser_max_pages
+        ),
+    )
+    return _pool
+
+
+async def close_crawler_pool() -> None:
+    """Shut down the shared crawler pool, if one is running."""
+    global _pool
+
+    pool, _pool = _pool, None
+    if pool is not None:
+        await pool.close()
+
+
+@asynccontextmanager
+async def _borrow_crawler() -> AsyncIterator[AsyncWebCrawler]:
+    """Borrow a browser from the shared pool, or launch a one-off browser.
+
+    Yields:
+        A started AsyncWebCrawler.
+    """
+    if _pool is not None and not _pool.closed:
+        async with _pool.acquire() as crawler:
+            yield crawler
+        return
+
+    async with AsyncWebCrawler(config=BrowserConfig(headless=True)) as crawler:
+        yield crawler
+
+
 def _validate_url(url: str) -> None:
     """Validate URL format.
 
@@ -45,6 +245,95 @@ def _validate_url(url: str) -> None:
         raise ValueError("url must have a valid domain")
 
 
+def _page_cache() -> DiskCache | None:
+    """Return the scraped page cache, or None if caching is disabled."""
+    if settings.page_cache_ttl <= 0:
+        return None
+    return get_cache("pages", max_bytes=settings.page_cache_max_mb * 1024 * 1024)
+
+
+def _page_key(url: str) -> str:
+    """Return the cache key for a URL, shared by its canonical variants."""
+    return make_key("page", canonicalize_url(url))
+
+
+def _content_key(markdown: str) -> str:
+    """Return the content-addressed key for extracted markdown."""
+    return make_key("content", hashlib.sha256(markdown.encode("utf-8")).hexdigest())
+
+
+def _load_cached_page(cache: DiskCache, url: str) -> CacheEntry | None:
+    """Look up a cached page, resolving its content-addressed markdown.
+
+    Returns:
+        An entry whose value holds url, markdown, etag and last_modified,
+        or None if the page (or its evicted content) is not cached.
+    """
+    entry = cache.get_entry(_page_key(url))
+    if entry is None:
+        return None
+    content = cache.get_entry(entry.value["content"])
+    if content is None:
+        return None
+    entry.value = {**entry.value, "markdown": content.value}
+    return entry
+
+
+def _store_page(
+    cache: DiskCache, url: str, result: ScrapeResult, validators: dict[str, str]
+) -> None:
+    """Store a scraped page; identical markdown is stored only once."""
+    content_key = _content_key(result.markdown)
+    if cache.get_entry(content_key) is None:
+        cache.set(content_key, result.markdown)
+    cache.set(
+        _page_key(url),
+        {
+            "url": result.url,
+            "content": content_key,
+            "etag": validators.get("etag"),
+            "last_modified": validators.get("last-modified"),
+        },
+    )
+
+
+def _cached_result(page: dict[str, Any], max_content_length: int) -> ScrapeResult:
+    """Build a ScrapeResult from a cached page."""
+    markdown = page["markdown"]
+    if len(markdown) > max_content_length:
+        markdown = markdown[:max_content_length] + "\n\n[Content truncated]"
+    return ScrapeResult(url=page["url"], markdown=markdown, success=True)
+
+
+async def _revalidate(url: str, page: dict[str, Any]) -> bool | None:
+    """Ask the origin whether a cached page is still current.
+
+    Sends a conditional GET using the stored ETag / Last-Modified.
+
+    Returns:
+        True if the server answered 304 Not Modified, False if the page
+        changed or has no validators, None if the server was too slow or
+        unreachable.
+    """
+    headers = {}
+    if page.get("etag"):
+        headers["If-None-Match"] = page["etag"]
+    if page.get("last_modified"):
+        headers["If-Modified-Since"] = page["last_modified"]
+    if not headers:
+        return False
+
+    try:
+        async with get_http_session().get(
+            url,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=settings.page_cache_revalidate_timeout),
+        ) as response:
+            return response.status == 304
+    except (TimeoutError, aiohttp.ClientError):
+        return None
+
+
 async def scrape(
     url: str,
     *,
@@ -53,6 +342,15 @@ async def scrape(
 ) -> ScrapeResult:
     """Scrape a URL and return markdown content.
 
+    Uses a browser from the shared crawler pool when one has been started
+    with start_crawler_pool(); otherwise launches a browser for this call.
+
+    Extracted markdown is cached on disk. A cached page younger than
+    settings.page_cache_ttl is returned directly; an older one is
+    revalidated with a conditional request before falling back to a full
+    render. With settings.page_cache_serve_stale, the stale copy is served
+    when revalidation times out or the render fails.
+
     Args:
         url: The URL to scrape.
         timeout: Request timeout in seconds.
@@ -66,11 +364,55 @@ async def scrape(
     """
     _validate_url(url)
 
-    browser_config = BrowserConfig(headless=True)
+    cache = _page_cache()
+    cached = _load_cached_page(cache, url) if cache is not None else None
+
+    if cache is not None and cached is not None:
+        if cached.age <= settings.page_cache_ttl:
+            cache.hits += 1
+            return _cached_result(cached.value, max_content_length)
+
+        revalidated = await _revalidate(url, cached.value)
+        if revalidated:
+            # Not modified: restart the freshness window.
+            record = {k: v for k, v in cached.value.items() if k != "markdown"}
+            cache.set(_page_key(url), record)
+        if revalidated or (revalidated is None and settings.page_cache_serve_stale):
+            cache.hits += 1
+            return _cached_result(cached.value, max_content_length)
+
+    if cache is not None:
+        cache.misses += 1
+
+    result, validators = await _crawl(
+        url, timeout=timeout, max_content_length=max_content_length
+    )
+
+    if cache is not None:
+        if result.success:
+            _store_page(cache, url, result, validators)
+        elif cached is not None and settings.page_cache_serve_stale:
+            return _cached_result(cached.value, max_content_length)
+
+    return result
+
+
+async def _crawl(
+    url: str,
+    *,
+    timeout: float,
+    max_content_length: int,
+) -> tuple[ScrapeResult, dict[str, str]]:
+    """Render a URL in a headless browser and extract markdown.
+
+    Returns:
+        The ScrapeResult and the response's lower-cased cache validator
+        headers (etag, last-modified) when available.
+    """
     run_config = CrawlerRunConfig()
 
     try:
-        async with AsyncWebCrawler(config=browser_config) as crawler:
+        async with _borrow_crawler() as crawler:
             result = await asyncio.wait_for(
                 crawler.arun(url=url, config=run_config),
                 timeout=timeout,
@@ -82,7 +424,7 @@ async def scrape(
                     markdown="",
                     success=False,
                     error_message=result.error_message or "Unknown error",
-                )
+                ), {}
 
             if hasattr(result.markdown, "raw_markdown"):
                 markdown = result.markdown.raw_markdown
@@ -92,11 +434,20 @@ async def scrape(
             if len(markdown) > max_content_length:
                 markdown = markdown[:max_content_length] + "\n\n[Content truncated]"
 
+            headers = getattr(result, "response_headers", None)
+            validators = {}
+            if isinstance(headers, dict):
+                validators = {
+                    key.lower(): str(value)
+                    for key, value in headers.items()
+                    if key.lower() in ("etag", "last-modified")
+                }
+
             return ScrapeResult(
                 url=result.url or url,
                 markdown=markdown,
                 success=True,
-            )
+            ), validators
 
     except TimeoutError:
         return ScrapeResult(
@@ -104,45 +455,179 @@ async def scrape(
             markdown="",
             success=False,
             error_message=f"Scrape timeout after {timeout}s",
-        )
+        ), {}
     except Exception as e:
         return ScrapeResult(
             url=url,
             markdown="",
             success=False,
             error_message=str(e),
-        )
+        ), {}
 
 
-async def scrape_multiple(
+_MEMINFO = "/proc/meminfo"
+
+
+def _available_memory_mb() -> int | None:
+    """Return the currently available physical memory in MiB.
+
+    Reads MemAvailable from /proc/meminfo, which counts reclaimable page
+    cache as available. Where that is missing, falls back to the free page
+    count from sysconf, which does not.
+
+    Returns:
+        Available memory, or None if the platform does not report it.
+    """
+    try:
+        with open(_MEMINFO, encoding="ascii") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+
+    try:
+        pages = os.sysconf("SC_AVPHYS_PAGES")
+        page_size = os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, OSError, ValueError):
+        return None
+    if pages <= 0 or page_size <= 0:
+        return None
+    return pages * page_size // (1024 * 1024)
+
+
+def _effective_concurrency(requested: int) -> int:
+    """Cap the requested concurrency by the memory available for pages.
+
+    Args:
+        requested: Desired number of concurrent scrapes.
+
+    Returns:
+        Number of scrapes to run at once (at least 1).
+    """
+    limit = max(1, requested)
+    available = _available_memory_mb()
+    per_page = settings.scrape_memory_per_page_mb
+    if available is not None and per_page > 0:
+        limit = min(limit, max(1, available // per_page))
+    return limit
+
+
+def _domain_of(url: str) -> str:
+    """Return the host used for per-domain concurrency limits."""
+    return urlparse(url).netloc.lower()
+
+
+async def scrape_stream(
     urls: list[str],
     *,
     timeout: float = 30.0,
     max_content_length: int = 50000,
-) -> list[ScrapeResult]:
-    """Scrape multiple URLs sequentially.
+    concurrency: int | None = None,
+    per_domain_limit: int | None = None,
+) -> AsyncIterator[tuple[int, ScrapeResult]]:
+    """Scrape multiple URLs and yield each result as soon as it completes.
 
-    Processes URLs one at a time to manage memory.
-    Failed URLs are returned with success=False.
+    At most ``concurrency`` URLs are in flight at once (further capped by
+    available memory), with at most ``per_domain_limit`` per host. URLs
+    whose host is saturated wait while URLs for other hosts go ahead. New
+    scrapes are only started as earlier ones finish, so a slow consumer
+    holds back the producer instead of letting pages pile up in memory.
 
     Args:
         urls: List of URLs to scrape.
         timeout: Timeout per URL.
         max_content_length: Maximum characters per result.
+        concurrency: Maximum concurrent scrapes.
+            Defaults to settings.scrape_concurrency.
+        per_domain_limit: Maximum concurrent scrapes per host.
+            Defaults to settings.scrape_per_domain_limit.
 
-    Returns:
-        List of ScrapeResult objects (one per URL).
+    Yields:
+        Tuples of (index into urls, ScrapeResult) in completion order.
     """
     if not urls:
-        return []
+        return
+
+    if concurrency is None:
+        concurrency = settings.scrape_concurrency
+    if per_domain_limit is None:
+        per_domain_limit = settings.scrape_per_domain_limit
+
+    concurrency = _effective_concurrency(concurrency)
+    per_domain_limit = max(1, per_domain_limit)
+
+    waiting = list(enumerate(urls))
+    active_per_domain: dict[str, int] = {}
+    in_flight: dict[asyncio.Task[ScrapeResult], tuple[int, str]] = {}
+
+    def launch_ready() -> None:
+        position = 0
+        while len(in_flight) < concurrency and position < len(waiting):
+            index, url = waiting[position]
+            domain = _domain_of(url)
+            if active_per_domain.get(domain, 0) >= per_domain_limit:
+                position += 1
+                continue
+            waiting.pop(position)
+            active_per_domain[domain] = active_per_domain.get(domain, 0) + 1
+            task = asyncio.create_task(
+                scrape(url, timeout=timeout, max_content_length=max_content_length)
+            )
+            in_flight[task] = (index, domain)
 
-    results = []
-    for url in urls:
-        result = await scrape(
-            url,
-            timeout=timeout,
-            max_content_length=max_content_length,
-        )
-        results.append(result)
+    launch_ready()
+    try:
+        while in_flight:
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            finished = []
+            for task in done:
+                index, domain = in_flight.pop(task)
+                active_per_domain[domain] -= 1
+                finished.append((index, task))
+            launch_ready()
+            for index, task in sorted(finished, key=lambda item: item[0]):
+                yield index, task.result()
+    finally:
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+
+
+async def scrape_multiple(
+    urls: list[str],
+    *,
+    timeout: float = 30.0,
+    max_content_length: int = 50000,
+    concurrency: int | None = None,
+    per_domain_limit: int | None = None,
+) -> list[ScrapeResult]:
+    """Scrape multiple URLs, concurrently when configured.
+
+    Collects scrape_stream() into a list. A concurrency of 1 processes URLs
+    one at a time, which keeps memory use lowest. Failed URLs are returned
+    with success=False.
 
-    return results
+    Args:
+        urls: List of URLs to scrape.
+        timeout: Timeout per URL.
+        max_content_length: Maximum characters per result.
+        concurrency: Maximum concurrent scrapes.
+            Defaults to settings.scrape_concurrency.
+        per_domain_limit: Maximum concurrent scrapes per host.
+            Defaults to settings.scrape_per_domain_limit.
+
+    Returns:
+        List of ScrapeResult objects in the same order as urls.
+    """
+    results: dict[int, ScrapeResult] = {}
+    async for index, result in scrape_stream(
+        urls,
+        timeout=timeout,
+        max_content_length=max_content_length,
+        concurrency=concurrency,
+        per_domain_limit=per_domain_limit,
+    ):
+        results[index] = result
+
+    return [results[index] for index in range(len(urls))]
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 
 import aiohttp
 
-from src.config import Settings
+from src.cache import DiskCache, get_cache, make_key
+from src.config import settings
+from src.tools.http import get_http_session
 
 
 @dataclass
@@ -25,6 +27,22 @@ class SearchError(Exception):
     pass
 
 
+def _normalize_query(query: str) -> str:
+    """Normalize a query for cache lookup (case and whitespace insensitive)."""
+    return " ".join(query.lower().split())
+
+
+def _search_cache() -> DiskCache | None:
+    """Return the search result cache, or None if caching is disabled."""
+    if settings.search_cache_ttl <= 0:
+        return None
+    return get_cache(
+        "search",
+        ttl=settings.search_cache_ttl,
+        max_entries=settings.search_cache_max_entries,
+    )
+
+
 async def search(
     query: str,
     *,
@@ -33,6 +51,13 @@ async def search(
 ) -> list[SearchResult]:
     """Search using SearXNG and return results.
 
+    Requests go through the shared pooled session from src.tools.http, so
+    repeated searches reuse keep-alive connections to SearXNG. Responses are
+    cached on disk by normalized query for settings.search_cache_ttl seconds
+    (0 disables the cache). Errors and empty result lists are never cached,
+    since SearXNG also answers with no results when its engines are rate
+    limited or unresponsive.
+
     Args:
         query: The search query string.
         num_results: Maximum number of results to return.
@@ -48,7 +73,6 @@ async def search(
     if not query or not query.strip():
         raise ValueError("query must not be empty")
 
-    settings = Settings()
     base_url = settings.searxng_url
 
     params = {
@@ -56,33 +80,44 @@ async def search(
         "format": "json",
     }
 
+    cache = _search_cache()
+    cache_key = make_key(base_url, _normalize_query(query), params["format"])
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return [SearchResult(**item) for item in cached[:num_results]]
+
+    session = get_http_session()
+
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{base_url}/search",
-                params=params,
-                timeout=aiohttp.ClientTimeout(total=timeout),
-            ) as response:
-                if response.status >= 400:
-                    raise SearchError(f"Search failed with status {response.status}")
-
-                try:
-                    data = await response.json()
-                except Exception as e:
-                    raise SearchError(f"Failed to parse response: {e}") from e
-
-                results = []
-                for item in data.get("results", [])[:num_results]:
-                    results.append(
-                        SearchResult(
-                            title=item.get("title", ""),
-                            url=item.get("url", ""),
-                            snippet=item.get("content", ""),
-                            engine=item.get("engine"),
-                        )
+        async with session.get(
+            f"{base_url}/search",
+            params=params,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            if response.status >= 400:
+                raise SearchError(f"Search failed with status {response.status}")
+
+            try:
+                data = await response.json()
+            except Exception as e:
+                raise SearchError(f"Failed to parse response: {e}") from e
+
+            results = []
+            for item in data.get("results", []):
+                results.append(
+                    SearchResult(
+                        title=item.get("title", ""),
+                        url=item.get("url", ""),
+                        snippet=item.get("content", ""),
+                        engine=item.get("engine"),
                     )
+                )
+
+            if cache is not None and results:
+                cache.set(cache_key, [asdict(result) for result in results])
 
-                return results
+            return results[:num_results]
 
     except TimeoutError as e:
         raise SearchError(f"Search timeout after {timeout}s") from e
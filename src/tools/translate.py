@@ -2,13 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+import threading
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from functools import lru_cache
-from typing import TYPE_CHECKING
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from langdetect import detect
 from langdetect.lang_detect_exception import LangDetectException
 
+from src import metrics
+from src.cache import DiskCache, get_cache, make_key
+from src.config import settings
+from src.segmentation import segment_markdown
+
 if TYPE_CHECKING:
     from transformers import MarianMTModel, MarianTokenizer
 
@@ -35,6 +48,23 @@ REVERSE_MODELS: dict[str, str] = {
     "ru": "Helsinki-NLP/opus-mt-en-ru",
 }
 
+# Inference backends selectable with settings.translation_backend:
+# "transformers" runs the fp32 MarianMTModel, "int8" the same model with its
+# linear layers dynamically quantized to int8 by torch, and "ctranslate2"
+# an int8 CTranslate2 conversion (requires the ctranslate2 extra).
+TRANSLATION_BACKENDS = ("transformers", "int8", "ctranslate2")
+
+# In-memory tier of the translation memory: (model, segment) -> translation.
+_memory: OrderedDict[tuple[str, str], str] = OrderedDict()
+_memory_lock = threading.Lock()
+
+_executor: ThreadPoolExecutor | None = None
+_loader: ThreadPoolExecutor | None = None
+_preloads: dict[tuple[str, str], Future[None]] = {}
+_preloads_lock = threading.Lock()
+_queue: asyncio.Semaphore | None = None
+_queue_loop: asyncio.AbstractEventLoop | None = None
+
 
 class TranslationError(Exception):
     """Translation failed."""
@@ -98,6 +128,11 @@ def _load_model(model_name: str) -> tuple[MarianTokenizer, MarianMTModel]:
     Returns:
         Tuple of (tokenizer, model).
     """
+    return _load_pretrained(model_name)
+
+
+def _load_pretrained(model_name: str) -> tuple[MarianTokenizer, MarianMTModel]:
+    """Load a Marian tokenizer and model from the Hugging Face cache."""
     from transformers import MarianMTModel, MarianTokenizer
 
     tokenizer = MarianTokenizer.from_pretrained(model_name)
@@ -105,6 +140,256 @@ def _load_model(model_name: str) -> tuple[MarianTokenizer, MarianMTModel]:
     return tokenizer, model
 
 
+@dataclass
+class _MarianBackend:
+    """Translate with a transformers MarianMTModel (fp32 or quantized)."""
+
+    tokenizer: MarianTokenizer
+    model: MarianMTModel
+
+    def translate_batch(self, texts: list[str]) -> list[str]:
+        """Translate a batch of texts with one padded generate() call."""
+        inputs = self.tokenizer(
+            texts, return_tensors="pt", padding=True, truncation=True
+        )
+        generated = self.model.generate(**inputs)
+        decoded = self.tokenizer.batch_decode(generated, skip_special_tokens=True)  # type: ignore[no-untyped-call]
+        return [str(text) for text in decoded]
+
+
+@dataclass
+class _CTranslate2Backend:
+    """Translate with an int8 CTranslate2 conversion of a Marian model."""
+
+    tokenizer: MarianTokenizer
+    translator: Any
+
+    def translate_batch(self, texts: list[str]) -> list[str]:
+        """Translate a batch of texts with one translate_batch() call."""
+        sources = [
+            self.tokenizer.convert_ids_to_tokens(
+                self.tokenizer.encode(text, truncation=True)
+            )
+            for text in texts
+        ]
+        results = self.translator.translate_batch(sources)
+        return [
+            str(
+                self.tokenizer.decode(  # type: ignore[no-untyped-call]
+                    self.tokenizer.convert_tokens_to_ids(result.hypotheses[0]),
+                    skip_special_tokens=True,
+                )
+            )
+            for result in results
+        ]
+
+
+def _get_backend(model_name: str) -> _MarianBackend | _CTranslate2Backend:
+    """Return the inference backend selected by settings.translation_backend.
+
+    Falls back to the transformers backend, counting
+    translation_backend_fallbacks, when the optimized backend's packages
+    are not installed.
+
+    Raises:
+        TranslationError: If the backend name is unknown.
+    """
+    backend = settings.translation_backend
+    if backend not in TRANSLATION_BACKENDS:
+        raise TranslationError(f"Unknown translation backend: {backend}")
+    if backend != "transformers":
+        try:
+            return _load_optimized(model_name, backend)
+        except ImportError:
+            metrics.increment("translation_backend_fallbacks")
+    return _MarianBackend(*_load_model(model_name))
+
+
+@lru_cache(maxsize=4)
+def _load_optimized(
+    model_name: str, backend: str
+) -> _MarianBackend | _CTranslate2Backend:
+    """Load and cache a quantized backend for a model.
+
+    Args:
+        model_name: The Hugging Face model name.
+        backend: "int8" or "ctranslate2".
+
+    Returns:
+        The loaded backend.
+
+    Raises:
+        ImportError: If the backend's packages are not installed.
+    """
+    if backend == "int8":
+        import torch
+
+        tokenizer, model = _load_pretrained(model_name)
+        quantized = torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+        )
+        return _MarianBackend(tokenizer, quantized)
+
+    import ctranslate2
+    from transformers import MarianTokenizer
+
+    path = (
+        Path(settings.cache_dir).expanduser()
+        / "ctranslate2"
+        / model_name.replace("/", "--")
+    )
+    if not (path / "model.bin").exists():
+        converter = ctranslate2.converters.TransformersConverter(model_name)
+        converter.convert(str(path), quantization="int8", force=True)
+    translator = ctranslate2.Translator(
+        str(path),
+        device="cpu",
+        compute_type="int8",
+        intra_threads=torch_threads(),
+    )
+    return _CTranslate2Backend(MarianTokenizer.from_pretrained(model_name), translator)
+
+
+def _translate(text: str, model_name: str) -> str:
+    """Translate a markdown document segment by segment.
+
+    The document is split into sentences (see src.segmentation), so long
+    reports are no longer cut at the model's input limit, and markup, code,
+    URLs and citation markers are carried over unchanged.
+
+    Args:
+        text: The markdown document.
+        model_name: The Hugging Face model name.
+
+    Returns:
+        The translated document.
+    """
+    document = segment_markdown(text)
+    segments = document.segments
+    if not segments:
+        return text
+    return document.join(translate_segments(segments, model_name))
+
+
+def translate_segments(segments: list[str], model_name: str) -> list[str]:
+    """Translate independent segments in padded batches.
+
+    Identical segments are translated once, and segments found in the
+    translation memory are not translated at all. The rest are sorted by
+    length so each batch pads to similar lengths, and each batch of
+    settings.translation_batch_size segments takes one call of the backend
+    selected by settings.translation_backend.
+
+    Args:
+        segments: The texts to translate.
+        model_name: The Hugging Face model name.
+
+    Returns:
+        One translation per segment, in order.
+
+    Raises:
+        TranslationError: If the configured backend is unknown.
+    """
+    # Quantized backends translate slightly differently; keep them apart.
+    backend = settings.translation_backend
+    model_id = model_name if backend == "transformers" else f"{model_name}:{backend}"
+
+    translations: dict[str, str] = {}
+    pending: list[str] = []
+    for segment in dict.fromkeys(segments):
+        remembered = _recall(model_id, segment)
+        if remembered is None:
+            pending.append(segment)
+        else:
+            translations[segment] = remembered
+    metrics.increment("translation_segments", len(segments))
+    if not pending:
+        return [translations[segment] for segment in segments]
+
+    translator = _get_backend(model_name)
+    pending.sort(key=len)
+    batch_size = max(1, settings.translation_batch_size)
+    for start in range(0, len(pending), batch_size):
+        batch = pending[start : start + batch_size]
+        decoded = translator.translate_batch(batch)
+        for segment, translation in zip(batch, decoded, strict=True):
+            translations[segment] = translation
+            _remember(model_id, segment, translation)
+        metrics.increment("translation_batches")
+
+    return [translations[segment] for segment in segments]
+
+
+def _memory_key(segment: str) -> str:
+    """Normalize a segment for translation memory lookups.
+
+    Unicode compatibility forms (e.g. full-width letters) and runs of
+    whitespace are folded, so re-typed queries match earlier ones.
+    """
+    return " ".join(unicodedata.normalize("NFKC", segment).split())
+
+
+def _translation_cache() -> DiskCache | None:
+    """Return the on-disk translation memory, or None if it is disabled."""
+    if settings.translation_cache_ttl <= 0:
+        return None
+    return get_cache(
+        "translations",
+        ttl=settings.translation_cache_ttl,
+        max_entries=settings.translation_cache_max_entries,
+    )
+
+
+def _recall(model_name: str, segment: str) -> str | None:
+    """Look up a segment in the in-memory, then the on-disk translation memory.
+
+    Disk hits are promoted to the in-memory tier. In-memory hits and misses
+    are counted as translation_memory_hits/_misses; the disk tier is
+    reported with the other caches.
+    """
+    key = (model_name, _memory_key(segment))
+    with _memory_lock:
+        translation = _memory.get(key)
+        if translation is not None:
+            _memory.move_to_end(key)
+    if translation is not None:
+        metrics.increment("translation_memory_hits")
+        return translation
+    metrics.increment("translation_memory_misses")
+
+    cache = _translation_cache()
+    translation = cache.get(make_key(*key)) if cache is not None else None
+    if translation is not None:
+        _remember_in_memory(key, translation)
+    return translation
+
+
+def _remember(model_name: str, segment: str, translation: str) -> None:
+    """Store a translation in both tiers of the translation memory."""
+    key = (model_name, _memory_key(segment))
+    _remember_in_memory(key, translation)
+    cache = _translation_cache()
+    if cache is not None:
+        cache.set(make_key(*key), translation)
+
+
+def _remember_in_memory(key: tuple[str, str], translation: str) -> None:
+    """Store a translation in the LRU-bounded in-memory tier."""
+    if settings.translation_memory_size <= 0:
+        return
+    with _memory_lock:
+        _memory[key] = translation
+        _memory.move_to_end(key)
+        while len(_memory) > settings.translation_memory_size:
+            _memory.popitem(last=False)
+
+
+def clear_translation_memory() -> None:
+    """Empty the in-memory tier of the translation memory."""
+    with _memory_lock:
+        _memory.clear()
+
+
 def translate_to_english(text: str, source_language: str) -> TranslationResult:
     """Translate text from source language to English.
 
@@ -132,15 +417,7 @@ def translate_to_english(text: str, source_language: str) -> TranslationResult:
     if normalized_lang not in SUPPORTED_LANGUAGES:
         raise TranslationError(f"Unsupported language: {source_language}")
 
-    model_name = SUPPORTED_LANGUAGES[normalized_lang]
-    tokenizer, model = _load_model(model_name)
-
-    # Tokenize and translate
-    inputs = tokenizer(text, return_tensors="pt", padding=True, truncation=True)
-    translated = model.generate(**inputs)
-    translated_text = str(
-        tokenizer.decode(translated[0], skip_special_tokens=True)  # type: ignore[no-untyped-call]
-    )
+    translated_text = _translate(text, SUPPORTED_LANGUAGES[normalized_lang])
 
     return TranslationResult(
         original_text=text,
@@ -177,15 +454,7 @@ def translate_from_english(text: str, target_language: str) -> TranslationResult
     if normalized_lang not in REVERSE_MODELS:
         raise TranslationError(f"Unsupported target language: {target_language}")
 
-    model_name = REVERSE_MODELS[normalized_lang]
-    tokenizer, model = _load_model(model_name)
-
-    # Tokenize and translate
-    inputs = tokenizer(text, return_tensors="pt", padding=True, truncation=True)
-    translated = model.generate(**inputs)
-    translated_text = str(
-        tokenizer.decode(translated[0], skip_special_tokens=True)  # type: ignore[no-untyped-call]
-    )
+    translated_text = _translate(text, REVERSE_MODELS[normalized_lang])
 
     return TranslationResult(
         original_text=text,
@@ -193,3 +462,171 @@ def translate_from_english(text: str, target_language: str) -> TranslationResult
         source_language="en",
         target_language=target_language,
     )
+
+
+def torch_threads() -> int:
+    """Return the intra-op thread count for translation workers.
+
+    Uses settings.translation_threads when set; otherwise the CPU cores are
+    shared evenly between the translation workers, so concurrent
+    translations do not oversubscribe the CPU.
+    """
+    if settings.translation_threads > 0:
+        return settings.translation_threads
+    workers = max(1, settings.translation_workers)
+    return max(1, (os.cpu_count() or 1) // workers)
+
+
+def _init_worker(threads: int) -> None:
+    """Set torch's intra-op thread count in a new translation worker."""
+    try:
+        import torch
+    except ImportError:
+        return
+    torch.set_num_threads(threads)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the translation executor, creating it on first use."""
+    global _executor
+
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=max(1, settings.translation_workers),
+            thread_name_prefix="translate",
+            initializer=_init_worker,
+            initargs=(torch_threads(),),
+        )
+    return _executor
+
+
+def _get_queue() -> asyncio.Semaphore:
+    """Return the semaphore bounding running and queued translations.
+
+    The semaphore is bound to the running event loop; a new one is created
+    when called from a different loop (e.g. a later asyncio.run()).
+    """
+    global _queue, _queue_loop
+
+    loop = asyncio.get_running_loop()
+    if _queue is None or _queue_loop is not loop:
+        _queue = asyncio.Semaphore(
+            max(1, settings.translation_workers)
+            + max(0, settings.translation_queue_size)
+        )
+        _queue_loop = loop
+    return _queue
+
+
+async def run_translation[T](func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking translation call in the translation executor.
+
+    Model loading and generate() hold a CPU core for seconds, so they run in
+    dedicated worker threads (torch releases the GIL) and the event loop
+    keeps serving searches and scrapes meanwhile. At most
+    settings.translation_workers calls run and settings.translation_queue_size
+    wait in the executor; further callers wait here without blocking.
+
+    Args:
+        func: The blocking function, e.g. translate_to_english.
+        *args: Arguments passed to func.
+
+    Returns:
+        The result of func.
+    """
+    async with _get_queue():
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_executor(), partial(func, *args))
+
+
+def preload_models(language: str) -> None:
+    """Start loading the translation models for a language in the background.
+
+    The forward model (language -> English) is loaded first and the reverse
+    model after it, on a single loader thread, so the task can be
+    translated as soon as possible while the reverse model loads during
+    research. Does nothing for English, unsupported languages or when
+    settings.translation_preload is off.
+
+    Args:
+        language: ISO 639-1 language code, e.g. as returned by detect_language.
+    """
+    if not settings.translation_preload:
+        return
+    normalized = normalize_language_code(language)
+    for models in (SUPPORTED_LANGUAGES, REVERSE_MODELS):
+        if normalized != "en" and normalized in models:
+            _preload(models[normalized])
+
+
+def _preload(model_name: str) -> Future[None]:
+    """Return the future loading a model, submitting the load if needed."""
+    global _loader
+
+    key = (model_name, settings.translation_backend)
+    with _preloads_lock:
+        future = _preloads.get(key)
+        if future is None:
+            if _loader is None:
+                _loader = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix="translate-load",
+                    initializer=_init_worker,
+                    initargs=(torch_threads(),),
+                )
+            future = _loader.submit(_warm_up, model_name)
+            _preloads[key] = future
+    return future
+
+
+def _warm_up(model_name: str) -> None:
+    """Load a model's backend and run one short translation through it.
+
+    The first generate() call pays one-off initialization costs, which
+    are better paid here than on the user's task.
+    """
+    _get_backend(model_name).translate_batch(["Hello."])
+
+
+async def model_ready(model_name: str) -> None:
+    """Wait for a background load of a model started by preload_models.
+
+    Returns at once if no load was started; translation then loads the
+    model inline. A failed load is forgotten so the next call retries.
+
+    Args:
+        model_name: The Hugging Face model name.
+
+    Raises:
+        Exception: Whatever the background load raised.
+    """
+    key = (model_name, settings.translation_backend)
+    with _preloads_lock:
+        future = _preloads.get(key)
+    if future is None:
+        return
+    try:
+        await asyncio.wrap_future(future)
+    except Exception:
+        with _preloads_lock:
+            if _preloads.get(key) is future:
+                del _preloads[key]
+        raise
+
+
+def close_translation_executor() -> None:
+    """Shut down the translation and loader threads, dropping queued calls.
+
+    Models already loaded stay cached for the next run.
+    """
+    global _executor, _loader, _queue, _queue_loop
+
+    executor, _executor = _executor, None
+    loader, _loader = _loader, None
+    _queue = None
+    _queue_loop = None
+    with _preloads_lock:
+        _preloads.clear()
+    for pool in (executor, loader):
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
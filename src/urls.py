@@ -0,0 +1,71 @@
+"""URL canonicalization for deduplicating references and cached pages."""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track the visitor and never change the page.
+TRACKING_PARAMS = frozenset(
+    {
+        "fbclid",
+        "gclid",
+        "dclid",
+        "msclkid",
+        "yclid",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "_ga",
+        "ref_src",
+    }
+)
+TRACKING_PREFIXES = ("utm_",)
+
+_REPEATED_SLASHES = re.compile(r"/{2,}")
+
+
+@lru_cache(maxsize=4096)
+def canonicalize_url(url: str) -> str:
+    """Return a canonical form of an http(s) URL for deduplication.
+
+    Variants that almost always serve the same page map to one string:
+    http and https, a leading "www.", default ports, trailing and repeated
+    slashes, fragments, tracking parameters (utm_*, fbclid, ...) and the
+    order of query parameters. The canonical form identifies a page; fetch
+    the original URL, since not every site serves https. Results are
+    cached, as the same references are checked on every iteration.
+
+    Args:
+        url: The URL to canonicalize.
+
+    Returns:
+        The canonical URL, or the stripped input if it is not http(s) or
+        cannot be parsed.
+    """
+    url = url.strip()
+    try:
+        parsed = urlsplit(url)
+        port = parsed.port
+    except ValueError:
+        return url
+    if parsed.scheme.lower() not in ("http", "https") or not parsed.hostname:
+        return url
+
+    host = parsed.hostname.rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    if port is not None and port not in (80, 443):
+        host = f"{host}:{port}"
+
+    path = _REPEATED_SLASHES.sub("/", parsed.path)
+    path = path.rstrip("/") or "/"
+
+    params = sorted(
+        (key, value)
+        for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS
+        and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    return urlunsplit(("https", host, path, urlencode(params), ""))
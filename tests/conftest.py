@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock
 
@@ -11,6 +13,43 @@ if TYPE_CHECKING:
     pass
 
 
+# ============================================================
+# Isolation Fixtures
+# ============================================================
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[Path]:
+    """Point on-disk caches at a per-test directory."""
+    from src.cache import close_caches
+    from src.config import settings
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(settings, "cache_dir", str(cache_dir))
+    yield cache_dir
+    close_caches()
+
+
+@pytest.fixture(autouse=True)
+def isolated_translation_memory() -> Iterator[None]:
+    """Start each test with an empty in-memory translation memory."""
+    from src.tools.translate import clear_translation_memory
+
+    clear_translation_memory()
+    yield
+    clear_translation_memory()
+
+
+@pytest.fixture(autouse=True)
+def no_translation_preload(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep tests from loading real translation models in the background."""
+    from src.config import settings
+
+    monkeypatch.setattr(settings, "translation_preload", False)
+
+
 # ============================================================
 # Configuration Fixtures
 # ============================================================
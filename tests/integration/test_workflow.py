@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from typing import Any
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.graph import build_graph
+from src.tools.scrape import ScrapeResult
 from src.tools.search import SearchResult
 
 
+async def _empty_stream() -> AsyncIterator[tuple[int, ScrapeResult]]:
+    """Return a scrape_stream() stand-in that yields nothing."""
+    return
+    yield
+
+
 @pytest.fixture
 def initial_state() -> dict[str, Any]:
     """Return a valid initial state for the graph."""
@@ -44,7 +52,7 @@ class TestFullWorkflow:
             patch("src.nodes.planner.call_llm", new_callable=AsyncMock) as mock_planner,
             patch("src.nodes.researcher.search", new_callable=AsyncMock) as mock_search,
             patch(
-                "src.nodes.scraper.scrape_multiple", new_callable=AsyncMock
+                "src.nodes.scraper.scrape_stream", new_callable=MagicMock
             ) as mock_scrape,
             patch(
                 "src.nodes.scraper.call_llm", new_callable=AsyncMock
@@ -56,7 +64,7 @@ class TestFullWorkflow:
         ):
             mock_planner.return_value = '{"queries": ["python async", "asyncio tutorial"]}'
             mock_search.return_value = search_results
-            mock_scrape.return_value = []  # No content from scraping
+            mock_scrape.return_value = _empty_stream()  # No content from scraping
             mock_scraper_llm.return_value = "Summary of content"
             mock_reviewer.return_value = '{"sufficient": true}'
             mock_writer.return_value = "# Report\n\nAsync programming explained."
@@ -102,6 +110,54 @@ class TestFullWorkflow:
             # Steps: 0->1->2 (MIN_ITER), call1->3, call2->4, call3 (sufficient)
             assert result["steps_completed"] == 4
 
+    @pytest.mark.asyncio
+    async def test_workflow_fans_out_plan_queries(
+        self, initial_state: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """With a fan-out, plan queries should be searched in one parallel step."""
+        from src.config import settings
+
+        monkeypatch.setattr(settings, "research_fanout", 4)
+
+        async def fake_search(query: str, **kwargs: Any) -> list[SearchResult]:
+            return [
+                SearchResult(
+                    title=query, url=f"https://example.com/{query}", snippet=""
+                ),
+                SearchResult(
+                    title="shared", url="https://example.com/shared", snippet=""
+                ),
+            ]
+
+        with (
+            patch("src.nodes.planner.call_llm", new_callable=AsyncMock) as mock_planner,
+            patch(
+                "src.nodes.researcher.search", side_effect=fake_search
+            ) as mock_search,
+            patch(
+                "src.nodes.scraper.scrape_stream", new_callable=MagicMock
+            ) as mock_scrape,
+            patch(
+                "src.nodes.reviewer.call_llm", new_callable=AsyncMock
+            ) as mock_reviewer,
+            patch("src.nodes.writer.call_llm", new_callable=AsyncMock) as mock_writer,
+        ):
+            mock_planner.return_value = '{"queries": ["q1", "q2", "q3", "q4"]}'
+            mock_scrape.return_value = _empty_stream()
+            mock_reviewer.return_value = '{"sufficient": true}'
+            mock_writer.return_value = "# Report"
+
+            graph = build_graph()
+            result = await graph.ainvoke(initial_state)
+
+            queries = {call.args[0] for call in mock_search.call_args_list}
+            assert queries == {"q1", "q2", "q3", "q4"}
+            assert result["steps_completed"] == 4
+            # The scraper runs once for all branches, with duplicates removed
+            mock_scrape.assert_called_once()
+            urls = mock_scrape.call_args.args[0]
+            assert len(urls) == len(set(urls)) == 5
+
     @pytest.mark.asyncio
     async def test_workflow_respects_max_iterations(
         self, initial_state: dict[str, Any]
@@ -173,7 +229,7 @@ class TestWorkflowEdgeCases:
             patch("src.nodes.planner.call_llm", new_callable=AsyncMock) as mock_planner,
             patch("src.nodes.researcher.search", new_callable=AsyncMock) as mock_search,
             patch(
-                "src.nodes.scraper.scrape_multiple", new_callable=AsyncMock
+                "src.nodes.scraper.scrape_stream", new_callable=MagicMock
             ) as mock_scrape,
             patch(
                 "src.nodes.scraper.call_llm", new_callable=AsyncMock
@@ -185,7 +241,7 @@ class TestWorkflowEdgeCases:
         ):
             mock_planner.return_value = '{"queries": ["q1", "q2"]}'
             mock_search.return_value = search_results
-            mock_scrape.return_value = []
+            mock_scrape.return_value = _empty_stream()
             mock_scraper_llm.return_value = "Summary of content"
             mock_reviewer.return_value = '{"sufficient": true}'
             mock_writer.return_value = "# Report"
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -129,6 +129,51 @@ class TestPlannerNode:
             or "task" in str(exc_info.value).lower()
         )
 
+    async def test_planner_requests_structured_output(self) -> None:
+        """planner_node should constrain the response to the planner schema."""
+        from src.nodes.planner import planner_node
+        from src.prompts.templates import PLANNER_SCHEMA
+
+        with patch("src.nodes.planner.call_llm") as mock_llm:
+            mock_llm.return_value = '{"queries": ["query 1"]}'
+
+            await planner_node({"task": "Test task"})
+
+            assert mock_llm.call_args[1]["format"] == PLANNER_SCHEMA
+
+    async def test_repeated_task_served_from_llm_cache(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """With the LLM cache on, replanning a task should not call the model."""
+        from src.config import settings
+        from src.nodes.planner import planner_node
+
+        monkeypatch.setattr(settings, "enable_llm_cache", True)
+        with patch("src.llm.ChatOllama") as mock_chat:
+            mock_chat.return_value.ainvoke = AsyncMock(
+                return_value=MagicMock(content='{"queries": ["query 1"]}')
+            )
+
+            first = await planner_node({"task": "Test task"})
+            second = await planner_node({"task": "Test task"})
+
+            assert first == second == {"plan": ["query 1"]}
+            assert mock_chat.return_value.ainvoke.await_count == 1
+
+    async def test_planner_retries_sample_without_cache(self) -> None:
+        """Retries should skip the cache and sample at the default temperature."""
+        from src.llm import DEFAULT_TEMPERATURE
+        from src.nodes.planner import planner_node
+
+        with patch("src.nodes.planner.call_llm") as mock_llm:
+            mock_llm.side_effect = ["not json", '{"queries": ["query 1"]}']
+
+            await planner_node({"task": "Test task"})
+
+            retry = mock_llm.call_args_list[1][1]
+            assert retry["temperature"] == DEFAULT_TEMPERATURE
+            assert retry["use_cache"] is False
+
     async def test_planner_whitespace_task_raises(self) -> None:
         """planner_node should raise ValueError for whitespace-only task."""
         from src.nodes.planner import planner_node
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from unittest.mock import patch
 
+import pytest
+
 from src.tools.search import SearchResult
 
 
@@ -160,3 +162,242 @@ class TestResearcherNode:
             result = await researcher_node(state)
 
             assert result["current_search_query"] == "second query"
+
+    async def test_researcher_records_query_per_url(self) -> None:
+        """Each new URL should be mapped to the query that found it."""
+        from src.nodes.researcher import researcher_node
+
+        with patch("src.nodes.researcher.search") as mock_search:
+            mock_search.return_value = [
+                SearchResult(title="A", url="https://a.example/", snippet=""),
+                SearchResult(title="B", url="https://b.example/", snippet=""),
+            ]
+            state = {"plan": ["q1", "q2"], "steps_completed": 1, "references": []}
+
+            result = await researcher_node(state)
+
+            assert result["reference_queries"] == {
+                "https://a.example/": "q2",
+                "https://b.example/": "q2",
+            }
+
+    async def test_researcher_skips_url_variants_of_known_pages(self) -> None:
+        """researcher_node should treat URL variants of a known page as seen."""
+        from src.nodes.researcher import researcher_node
+
+        with patch("src.nodes.researcher.search") as mock_search:
+            mock_search.return_value = [
+                SearchResult(
+                    title="Variant",
+                    url="http://www.example.com/1/?utm_source=feed",
+                    snippet="",
+                ),
+                SearchResult(title="Same", url="https://example.com/2", snippet=""),
+                SearchResult(
+                    title="Again", url="https://example.com/2#top", snippet=""
+                ),
+            ]
+            state = {
+                "plan": ["query"],
+                "steps_completed": 0,
+                "references": ["https://example.com/1"],
+                "referenced_keys": {"https://example.com/1"},
+            }
+
+            result = await researcher_node(state)
+
+            assert result["references"] == ["https://example.com/2"]
+            assert result["referenced_keys"] == {"https://example.com/2"}
+
+    async def test_researcher_reranks_search_results(self) -> None:
+        """URLs should be chosen by snippet relevance, not SearXNG order."""
+        from src.nodes.researcher import MAX_URLS_PER_SEARCH, researcher_node
+
+        results = [
+            SearchResult(title=f"Ad {i}", url=f"https://ads.example/{i}", snippet="")
+            for i in range(MAX_URLS_PER_SEARCH)
+        ]
+        results.append(
+            SearchResult(
+                title="Surface codes",
+                url="https://qec.example/",
+                snippet="quantum error correction with surface codes",
+            )
+        )
+        with patch("src.nodes.researcher.search") as mock_search:
+            mock_search.return_value = results
+            state = {
+                "plan": ["surface code"],
+                "task": "quantum error correction",
+                "steps_completed": 0,
+                "references": [],
+            }
+
+            result = await researcher_node(state)
+
+            assert result["references"][0] == "https://qec.example/"
+            assert result["search_backlog"]["surface code"][0]["title"] == "Ad 4"
+
+    async def test_researcher_keeps_search_order_without_rerank(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """With RERANK_RESULTS disabled, SearXNG's order should be used."""
+        from src.config import settings
+        from src.nodes.researcher import MAX_URLS_PER_SEARCH, researcher_node
+
+        monkeypatch.setattr(settings, "rerank_results", False)
+        results = [
+            SearchResult(title=f"Ad {i}", url=f"https://ads.example/{i}", snippet="")
+            for i in range(MAX_URLS_PER_SEARCH)
+        ]
+        results.append(
+            SearchResult(
+                title="Surface codes", url="https://qec.example/", snippet="surface"
+            )
+        )
+        with patch("src.nodes.researcher.search") as mock_search:
+            mock_search.return_value = results
+            state = {"plan": ["surface code"], "steps_completed": 0, "references": []}
+
+            result = await researcher_node(state)
+
+            assert "https://qec.example/" not in result["references"]
+
+
+class TestSearchBacklog:
+    """Tests for the per-query backlog of unused search results."""
+
+    @staticmethod
+    def _results(count: int) -> list[SearchResult]:
+        return [
+            SearchResult(title=f"R{i}", url=f"https://example.com/{i}", snippet="")
+            for i in range(count)
+        ]
+
+    async def test_leftover_results_are_kept_in_rank_order(self) -> None:
+        """Results beyond the per-search limit should go to the backlog."""
+        from src.nodes.researcher import MAX_URLS_PER_SEARCH, researcher_node
+
+        with patch("src.nodes.researcher.search") as mock_search:
+            mock_search.return_value = self._results(MAX_URLS_PER_SEARCH + 3)
+            state = {"plan": ["q1"], "steps_completed": 0, "references": []}
+
+            result = await researcher_node(state)
+
+            leftovers = result["search_backlog"]["q1"]
+            assert [item["url"] for item in leftovers] == [
+                f"https://example.com/{i}"
+                for i in range(MAX_URLS_PER_SEARCH, MAX_URLS_PER_SEARCH + 3)
+            ]
+            assert leftovers[0]["title"] == f"R{MAX_URLS_PER_SEARCH}"
+
+    async def test_backlogged_query_skips_search(self) -> None:
+        """A query with a backlog should be answered without searching."""
+        from src import metrics
+        from src.nodes.researcher import researcher_node
+
+        metrics.reset()
+        with patch("src.nodes.researcher.search") as mock_search:
+            state = {
+                "plan": ["q1", "q1"],
+                "steps_completed": 1,
+                "references": [],
+                "search_backlog": {
+                    "q1": [
+                        {"title": "R", "url": "https://example.com/r", "snippet": ""}
+                    ]
+                },
+            }
+
+            result = await researcher_node(state)
+
+            mock_search.assert_not_called()
+            assert result["references"] == ["https://example.com/r"]
+            assert result["search_backlog"] == {"q1": []}
+            assert result["steps_completed"] == 2
+            assert metrics.get("searches_saved") == 1
+
+    async def test_exhausted_plan_draws_from_backlog(self) -> None:
+        """After the plan runs out, iterations should use backlogged results."""
+        from src import metrics
+        from src.nodes.researcher import researcher_node
+
+        metrics.reset()
+        backlog = {
+            "q1": [
+                {"title": "A1", "url": "https://a.example/1", "snippet": ""},
+                {"title": "A2", "url": "https://a.example/2", "snippet": ""},
+            ],
+            "q2": [
+                {"title": "B1", "url": "https://b.example/1", "snippet": ""},
+                {"title": "Seen", "url": "https://seen.example/", "snippet": ""},
+            ],
+        }
+        with patch("src.nodes.researcher.search") as mock_search:
+            state = {
+                "plan": ["q1", "q2"],
+                "steps_completed": 2,
+                "references": ["https://seen.example/"],
+                "referenced_keys": {"https://seen.example/"},
+                "search_backlog": backlog,
+            }
+
+            result = await researcher_node(state)
+
+            mock_search.assert_not_called()
+            # Round-robin across queries keeps each query's best results first
+            assert result["references"] == [
+                "https://a.example/1",
+                "https://b.example/1",
+                "https://a.example/2",
+            ]
+            assert result["reference_queries"] == {
+                "https://a.example/1": "q1",
+                "https://b.example/1": "q2",
+                "https://a.example/2": "q1",
+            }
+            assert result["search_backlog"] == {"q1": [], "q2": []}
+            assert result["steps_completed"] == 3
+            # Nothing would have been searched here, so nothing was saved
+            assert metrics.get("searches_saved") == 0
+
+
+class TestDispatchQueries:
+    """Tests for the dispatch_queries router."""
+
+    def test_sequential_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """With a fan-out of 1 the router should return the researcher node."""
+        from src.config import settings
+        from src.nodes.researcher import dispatch_queries
+
+        monkeypatch.setattr(settings, "research_fanout", 1)
+        state = {"plan": ["q1", "q2", "q3"], "steps_completed": 0}
+
+        assert dispatch_queries(state) == "researcher"
+
+    def test_fans_out_pending_queries(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """With a fan-out above 1 the router should send one branch per query."""
+        from src.config import settings
+        from src.nodes.researcher import dispatch_queries
+
+        monkeypatch.setattr(settings, "research_fanout", 3)
+        state = {"plan": ["q1", "q2", "q3", "q4"], "steps_completed": 1}
+
+        sends = dispatch_queries(state)
+
+        assert [send.node for send in sends] == ["researcher"] * 3
+        assert [send.arg["steps_completed"] for send in sends] == [1, 2, 3]
+
+    def test_fan_out_limited_by_remaining_queries(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The router should not send more branches than queries remain."""
+        from src.config import settings
+        from src.nodes.researcher import dispatch_queries
+
+        monkeypatch.setattr(settings, "research_fanout", 4)
+        state = {"plan": ["q1", "q2", "q3"], "steps_completed": 1}
+
+        sends = dispatch_queries(state)
+
+        assert len(sends) == 2
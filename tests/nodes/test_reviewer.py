@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from unittest.mock import patch
 
+import pytest
+
 
 class TestReviewerNode:
     """Tests for the reviewer_node function."""
@@ -145,6 +147,92 @@ class TestReviewerNode:
             call_kwargs = mock_llm.call_args[1]
             assert call_kwargs["model"] == settings.worker_model
 
+    async def test_reviewer_requests_structured_output(self) -> None:
+        """reviewer_node should constrain the response to the reviewer schema."""
+        from src.nodes.reviewer import reviewer_node
+        from src.prompts.templates import REVIEWER_SCHEMA
+
+        with patch("src.nodes.reviewer.call_llm") as mock_llm:
+            mock_llm.return_value = '{"sufficient": true, "reason": "ok"}'
+            state = {
+                "task": "Test task",
+                "content": ["Content"],
+                "steps_completed": 2,  # Must meet MIN_ITERATIONS
+            }
+
+            await reviewer_node(state)
+
+            assert mock_llm.call_args[1]["format"] == REVIEWER_SCHEMA
+
+
+class TestIncrementalReview:
+    """Tests for the reviewer's running digest."""
+
+    async def test_reviewer_sends_only_new_content(self) -> None:
+        """reviewer_node should send the digest and only unreviewed summaries."""
+        from src.nodes.reviewer import reviewer_node
+
+        with patch("src.nodes.reviewer.call_llm") as mock_llm:
+            mock_llm.return_value = (
+                '{"sufficient": false, "reason": "gaps", "digest": "- A, B, C"}'
+            )
+            state = {
+                "task": "Test task",
+                "content": ["Old summary A", "Old summary B", "New summary C"],
+                "steps_completed": 3,
+                "review_digest": "- A, B",
+                "reviewed_count": 2,
+            }
+
+            result = await reviewer_node(state)
+
+            prompt = mock_llm.call_args[0][0]
+            assert "- A, B" in prompt
+            assert "New summary C" in prompt
+            assert "Old summary A" not in prompt
+            assert result["review_digest"] == "- A, B, C"
+            assert result["reviewed_count"] == 3
+
+    async def test_reviewer_leaves_unsent_content_for_next_review(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Summaries that did not fit the prompt should not count as reviewed."""
+        from src.config import settings
+        from src.nodes.reviewer import reviewer_node
+
+        monkeypatch.setattr(settings, "max_context_length", 2048)
+        content = [f"Summary {i}: " + "detail " * 300 for i in range(6)]
+
+        with patch("src.nodes.reviewer.call_llm") as mock_llm:
+            mock_llm.return_value = (
+                '{"sufficient": false, "reason": "gaps", "digest": "- covered"}'
+            )
+            state = {"task": "Test task", "content": content, "steps_completed": 2}
+
+            result = await reviewer_node(state)
+
+            prompt = mock_llm.call_args[0][0]
+            reviewed = result["reviewed_count"]
+            assert 0 < reviewed < len(content)
+            assert all(item in prompt for item in content[:reviewed])
+            assert f"Summary {reviewed}:" not in prompt
+
+    async def test_reviewer_keeps_position_without_digest(self) -> None:
+        """Without a digest in the response, content should be reviewed again."""
+        from src.nodes.reviewer import reviewer_node
+
+        with patch("src.nodes.reviewer.call_llm") as mock_llm:
+            mock_llm.return_value = '{"sufficient": false, "reason": "gaps"}'
+            state = {
+                "task": "Test task",
+                "content": ["Summary"],
+                "steps_completed": 2,
+            }
+
+            result = await reviewer_node(state)
+
+            assert result == {"is_sufficient": False}
+
 
 class TestShouldContinueResearch:
     """Tests for the should_continue_research function."""
@@ -2,11 +2,37 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Callable
+from typing import Any
 from unittest.mock import patch
 
+import pytest
+
 from src.tools.scrape import ScrapeResult
 
 
+def _stream_results(
+    results: list[ScrapeResult],
+) -> Callable[..., AsyncIterator[tuple[int, ScrapeResult]]]:
+    """Return a fake scrape_stream() that yields the given results in order."""
+
+    async def fake_stream(
+        urls: list[str], **kwargs: Any
+    ) -> AsyncIterator[tuple[int, ScrapeResult]]:
+        for index, result in enumerate(results):
+            yield index, result
+
+    return fake_stream
+
+
+@pytest.fixture(autouse=True)
+def _no_triage(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Summarize every page, so tests can use short placeholder content."""
+    from src.config import settings
+
+    monkeypatch.setattr(settings, "scrape_triage", False)
+
+
 class TestScraperNode:
     """Tests for the scraper_node function."""
 
@@ -15,16 +41,18 @@ class TestScraperNode:
         from src.nodes.scraper import scraper_node
 
         with (
-            patch("src.nodes.scraper.scrape_multiple") as mock_scrape,
+            patch("src.nodes.scraper.scrape_stream") as mock_scrape,
             patch("src.nodes.scraper.call_llm") as mock_llm,
         ):
-            mock_scrape.return_value = [
-                ScrapeResult(
-                    url="https://example.com/1",
-                    markdown="Content from page 1",
-                    success=True,
-                )
-            ]
+            mock_scrape.side_effect = _stream_results(
+                [
+                    ScrapeResult(
+                        url="https://example.com/1",
+                        markdown="Content from page 1",
+                        success=True,
+                    )
+                ]
+            )
             mock_llm.return_value = "Summary of content"
             state = {
                 "references": ["https://example.com/1"],
@@ -40,21 +68,23 @@ class TestScraperNode:
         from src.nodes.scraper import scraper_node
 
         with (
-            patch("src.nodes.scraper.scrape_multiple") as mock_scrape,
+            patch("src.nodes.scraper.scrape_stream") as mock_scrape,
             patch("src.nodes.scraper.call_llm") as mock_llm,
         ):
-            mock_scrape.return_value = [
-                ScrapeResult(
-                    url="https://example.com/1",
-                    markdown="Content 1",
-                    success=True,
-                ),
-                ScrapeResult(
-                    url="https://example.com/2",
-                    markdown="Content 2",
-                    success=True,
-                ),
-            ]
+            mock_scrape.side_effect = _stream_results(
+                [
+                    ScrapeResult(
+                        url="https://example.com/1",
+                        markdown="Content 1",
+                        success=True,
+                    ),
+                    ScrapeResult(
+                        url="https://example.com/2",
+                        markdown="Content 2",
+                        success=True,
+                    ),
+                ]
+            )
             mock_llm.side_effect = ["Summary 1", "Summary 2"]
             state = {
                 "references": ["https://example.com/1", "https://example.com/2"],
@@ -72,16 +102,18 @@ class TestScraperNode:
         from src.nodes.scraper import scraper_node
 
         with (
-            patch("src.nodes.scraper.scrape_multiple") as mock_scrape,
+            patch("src.nodes.scraper.scrape_stream") as mock_scrape,
             patch("src.nodes.scraper.call_llm") as mock_llm,
         ):
-            mock_scrape.return_value = [
-                ScrapeResult(
-                    url="https://example.com/1",
-                    markdown="Content",
-                    success=True,
-                )
-            ]
+            mock_scrape.side_effect = _stream_results(
+                [
+                    ScrapeResult(
+                        url="https://example.com/1",
+                        markdown="Content",
+                        success=True,
+                    )
+                ]
+            )
             mock_llm.return_value = "Summary"
             state = {
                 "references": ["https://example.com/1"],
@@ -98,22 +130,24 @@ class TestScraperNode:
         from src.nodes.scraper import scraper_node
 
         with (
-            patch("src.nodes.scraper.scrape_multiple") as mock_scrape,
+            patch("src.nodes.scraper.scrape_stream") as mock_scrape,
             patch("src.nodes.scraper.call_llm") as mock_llm,
         ):
-            mock_scrape.return_value = [
-                ScrapeResult(
-                    url="https://example.com/1",
-                    markdown="",
-                    success=False,
-                    error_message="Connection failed",
-                ),
-                ScrapeResult(
-                    url="https://example.com/2",
-                    markdown="Valid content",
-                    success=True,
-                ),
-            ]
+            mock_scrape.side_effect = _stream_results(
+                [
+                    ScrapeResult(
+                        url="https://example.com/1",
+                        markdown="",
+                        success=False,
+                        error_message="Connection failed",
+                    ),
+                    ScrapeResult(
+                        url="https://example.com/2",
+                        markdown="Valid content",
+                        success=True,
+                    ),
+                ]
+            )
             mock_llm.return_value = "Summary"
             state = {
                 "references": ["https://example.com/1", "https://example.com/2"],
@@ -125,48 +159,275 @@ class TestScraperNode:
             assert mock_llm.call_count == 1
             assert len(result["content"]) == 1
 
-    async def test_scraper_truncates_long_content(self) -> None:
-        """scraper_node should truncate long content before summarizing."""
-        from src.nodes.scraper import MAX_CONTENT_FOR_SUMMARY, scraper_node
+    async def test_scraper_summarizes_long_content_in_chunks(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Long pages should be summarized chunk by chunk, then combined."""
+        from src.config import settings
+        from src.nodes.scraper import scraper_node
+        from src.prompts.budget import count_tokens
+
+        monkeypatch.setattr(settings, "summary_chunk_tokens", 200)
+        monkeypatch.setattr(settings, "summary_max_chunks", 8)
+        sections = [f"# Section {i}\n\n" + f"fact{i} " * 150 for i in range(4)]
 
         with (
-            patch("src.nodes.scraper.scrape_multiple") as mock_scrape,
+            patch("src.nodes.scraper.scrape_stream") as mock_scrape,
             patch("src.nodes.scraper.call_llm") as mock_llm,
         ):
-            long_content = "A" * (MAX_CONTENT_FOR_SUMMARY + 1000)
-            mock_scrape.return_value = [
-                ScrapeResult(
-                    url="https://example.com/1",
-                    markdown=long_content,
-                    success=True,
-                )
-            ]
-            mock_llm.return_value = "Summary"
+            mock_scrape.side_effect = _stream_results(
+                [
+                    ScrapeResult(
+                        url="https://example.com/1",
+                        markdown="\n\n".join(sections),
+                        success=True,
+                    )
+                ]
+            )
+            mock_llm.return_value = "Partial"
             state = {
                 "references": ["https://example.com/1"],
                 "current_search_query": "test",
             }
 
+            result = await scraper_node(state)
+
+            prompts = [call.args[0] for call in mock_llm.call_args_list]
+            # Every section reaches the model; nothing is cut off at the end
+            for i in range(4):
+                assert any(f"fact{i}" in prompt for prompt in prompts)
+            assert "partial summaries" in prompts[-1].lower()
+            assert all(count_tokens(prompt) < 400 for prompt in prompts[:-1])
+            assert result["content"] == ["Partial\n\nSource: https://example.com/1"]
+
+    async def test_sectioned_page_reaches_model_in_full(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Heading breaks beyond summary_max_chunks should not cut off sections."""
+        from src import metrics
+        from src.config import settings
+        from src.nodes.scraper import scraper_node
+
+        monkeypatch.setattr(settings, "chunk_selection", False)
+        sections = [
+            f"## Heading {i}\n\n" + f"fact{i} " * 170 + "end." for i in range(38)
+        ]
+        markdown = "\n\n".join(sections)
+        assert len(markdown) <= 50000
+
+        with (
+            patch("src.nodes.scraper.scrape_stream") as mock_scrape,
+            patch("src.nodes.scraper.call_llm") as mock_llm,
+        ):
+            mock_scrape.side_effect = _stream_results(
+                [
+                    ScrapeResult(
+                        url="https://example.com/1", markdown=markdown, success=True
+                    )
+                ]
+            )
+            mock_llm.return_value = "Partial"
+            metrics.reset()
+            state = {
+                "references": ["https://example.com/1"],
+                "current_search_query": "test",
+            }
+
+            await scraper_node(state)
+
+            prompts = [call.args[0] for call in mock_llm.call_args_list]
+            for i in range(38):
+                assert any(f"## Heading {i}\n" in prompt for prompt in prompts)
+            assert metrics.get("summary_chunks") <= settings.summary_max_chunks
+            assert metrics.get("summary_tokens_dropped") == 0
+
+    async def test_text_beyond_max_chunks_is_counted(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Text that cannot fit summary_max_chunks should be counted as dropped."""
+        from src import metrics
+        from src.config import settings
+        from src.nodes.scraper import scraper_node
+
+        monkeypatch.setattr(settings, "summary_chunk_tokens", 200)
+        monkeypatch.setattr(settings, "summary_max_chunks", 2)
+        paragraphs = [f"Paragraph {i} " + "word " * 100 for i in range(6)]
+
+        with (
+            patch("src.nodes.scraper.scrape_stream") as mock_scrape,
+            patch("src.nodes.scraper.call_llm") as mock_llm,
+        ):
+            mock_scrape.side_effect = _stream_results(
+                [
+                    ScrapeResult(
+                        url="https://example.com/1",
+                        markdown="\n\n".join(paragraphs),
+                        success=True,
+                    )
+                ]
+            )
+            mock_llm.return_value = "Partial"
+            metrics.reset()
+
+            await scraper_node({"references": ["https://example.com/1"]})
+
+            assert metrics.get("summary_chunks") == 2
+            assert metrics.get("summary_tokens_dropped") > 0
+
+    async def test_scraper_selects_relevant_passages(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Long pages should be narrowed to passages relevant to the query."""
+        from src.config import settings
+        from src.nodes.scraper import scraper_node
+
+        monkeypatch.setattr(settings, "selection_passage_tokens", 100)
+        monkeypatch.setattr(settings, "selection_max_tokens", 300)
+        monkeypatch.setattr(settings, "selection_top_k", 3)
+        paragraphs = [f"Filler paragraph {i} " + "lorem " * 60 for i in range(20)]
+        paragraphs[7] = "Qubit error correction uses surface codes."
+
+        with (
+            patch("src.nodes.scraper.scrape_stream") as mock_scrape,
+            patch("src.nodes.scraper.call_llm") as mock_llm,
+        ):
+            mock_scrape.side_effect = _stream_results(
+                [
+                    ScrapeResult(
+                        url="https://example.com/1",
+                        markdown="\n\n".join(paragraphs),
+                        success=True,
+                    )
+                ]
+            )
+            mock_llm.return_value = "Summary"
+            state = {
+                "references": ["https://example.com/1"],
+                "current_search_query": "qubit error correction",
+                "task": "How do quantum computers correct errors?",
+            }
+
+            await scraper_node(state)
+
+            assert mock_llm.call_count == 1
+            prompt = mock_llm.call_args[0][0]
+            assert "surface codes" in prompt
+            assert prompt.count("Filler paragraph") < 3
+
+    async def test_selection_narrows_scraped_pages_at_defaults(self) -> None:
+        """At default settings, a scrape-length page is narrowed, then chunked."""
+        from src import metrics
+        from src.config import settings
+        from src.nodes.scraper import scraper_node
+        from src.prompts.budget import count_tokens
+
+        paragraphs = [
+            f"Paragraph {i} on qubit error correction. " + f"detail{i} " * 120
+            for i in range(40)
+        ]
+        markdown = "\n\n".join(paragraphs)
+        assert settings.chunk_selection
+        assert len(markdown) <= 50000
+
+        with (
+            patch("src.nodes.scraper.scrape_stream") as mock_scrape,
+            patch("src.nodes.scraper.call_llm") as mock_llm,
+        ):
+            mock_scrape.side_effect = _stream_results(
+                [
+                    ScrapeResult(
+                        url="https://example.com/1", markdown=markdown, success=True
+                    )
+                ]
+            )
+            mock_llm.return_value = "Partial"
+            metrics.reset()
+            state = {
+                "references": ["https://example.com/1"],
+                "current_search_query": "qubit error correction",
+            }
+
+            await scraper_node(state)
+
+            prompts = [call.args[0] for call in mock_llm.call_args_list]
+            assert metrics.get("chunked_pages") == 1
+            assert metrics.get("selection_tokens_dropped") > 0
+            assert sum(map(count_tokens, prompts)) < count_tokens(markdown) / 2
+            assert "partial summaries" in prompts[-1].lower()
+
+    async def test_summary_calls_served_from_llm_cache(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """With the LLM cache on, resummarizing a page should not call the model."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from src.config import settings
+        from src.nodes.scraper import scraper_node
+
+        monkeypatch.setattr(settings, "enable_llm_cache", True)
+        monkeypatch.setattr(settings, "summary_cache_ttl", 0)
+        result = ScrapeResult(
+            url="https://example.com/1", markdown="Page content", success=True
+        )
+
+        with (
+            patch("src.nodes.scraper.scrape_stream") as mock_scrape,
+            patch("src.llm.ChatOllama") as mock_chat,
+        ):
+            mock_scrape.side_effect = _stream_results([result])
+            mock_chat.return_value.ainvoke = AsyncMock(
+                return_value=MagicMock(content="Summary")
+            )
+            state = {"references": ["https://example.com/1"]}
+
+            await scraper_node(state)
+            mock_scrape.side_effect = _stream_results([result])
+            second = await scraper_node(state)
+
+            assert second["content"] == ["Summary\n\nSource: https://example.com/1"]
+            assert mock_chat.return_value.ainvoke.await_count == 1
+
+    async def test_scraper_short_content_uses_single_call(self) -> None:
+        """Pages within the chunk size should be summarized in one call."""
+        from src.nodes.scraper import scraper_node
+
+        with (
+            patch("src.nodes.scraper.scrape_stream") as mock_scrape,
+            patch("src.nodes.scraper.call_llm") as mock_llm,
+        ):
+            mock_scrape.side_effect = _stream_results(
+                [
+                    ScrapeResult(
+                        url="https://example.com/1",
+                        markdown="Short page",
+                        success=True,
+                    )
+                ]
+            )
+            mock_llm.return_value = "Summary"
+            state = {"references": ["https://example.com/1"]}
+
             await scraper_node(state)
 
-            call_args = mock_llm.call_args[0][0]
-            assert len(call_args) <= MAX_CONTENT_FOR_SUMMARY + 500
+            assert mock_llm.call_count == 1
 
     async def test_scraper_returns_content_list(self) -> None:
         """scraper_node should return content as a list."""
         from src.nodes.scraper import scraper_node
 
         with (
-            patch("src.nodes.scraper.scrape_multiple") as mock_scrape,
+            patch("src.nodes.scraper.scrape_stream") as mock_scrape,
             patch("src.nodes.scraper.call_llm") as mock_llm,
         ):
-            mock_scrape.return_value = [
-                ScrapeResult(
-                    url="https://example.com/1",
-                    markdown="Content",
-                    success=True,
-                )
-            ]
+            mock_scrape.side_effect = _stream_results(
+                [
+                    ScrapeResult(
+                        url="https://example.com/1",
+                        markdown="Content",
+                        success=True,
+                    )
+                ]
+            )
             mock_llm.return_value = "Summary"
             state = {
                 "references": ["https://example.com/1"],
@@ -182,8 +443,8 @@ class TestScraperNode:
         """scraper_node should handle empty URL list."""
         from src.nodes.scraper import scraper_node
 
-        with patch("src.nodes.scraper.scrape_multiple") as mock_scrape:
-            mock_scrape.return_value = []
+        with patch("src.nodes.scraper.scrape_stream") as mock_scrape:
+            mock_scrape.side_effect = _stream_results([])
             state = {
                 "references": [],
                 "current_search_query": "test",
@@ -199,16 +460,18 @@ class TestScraperNode:
         from src.nodes.scraper import scraper_node
 
         with (
-            patch("src.nodes.scraper.scrape_multiple") as mock_scrape,
+            patch("src.nodes.scraper.scrape_stream") as mock_scrape,
             patch("src.nodes.scraper.call_llm") as mock_llm,
         ):
-            mock_scrape.return_value = [
-                ScrapeResult(
-                    url="https://example.com/1",
-                    markdown="Content",
-                    success=True,
-                )
-            ]
+            mock_scrape.side_effect = _stream_results(
+                [
+                    ScrapeResult(
+                        url="https://example.com/1",
+                        markdown="Content",
+                        success=True,
+                    )
+                ]
+            )
             mock_llm.return_value = "Summary"
             state = {
                 "references": ["https://example.com/1"],
@@ -225,16 +488,18 @@ class TestScraperNode:
         from src.nodes.scraper import scraper_node
 
         with (
-            patch("src.nodes.scraper.scrape_multiple") as mock_scrape,
+            patch("src.nodes.scraper.scrape_stream") as mock_scrape,
             patch("src.nodes.scraper.call_llm") as mock_llm,
         ):
-            mock_scrape.return_value = [
-                ScrapeResult(
-                    url="https://example.com/new",
-                    markdown="New content",
-                    success=True,
-                )
-            ]
+            mock_scrape.side_effect = _stream_results(
+                [
+                    ScrapeResult(
+                        url="https://example.com/new",
+                        markdown="New content",
+                        success=True,
+                    )
+                ]
+            )
             mock_llm.return_value = "Summary"
             state = {
                 "references": [
@@ -252,21 +517,55 @@ class TestScraperNode:
             assert len(result["content"]) == 1
             assert "https://example.com/new" in result["scraped_urls"]
 
+    async def test_scraper_skips_variants_of_scraped_urls(self) -> None:
+        """scraper_node should not re-scrape a page under another URL variant."""
+        from src.nodes.scraper import scraper_node
+
+        with (
+            patch("src.nodes.scraper.scrape_stream") as mock_scrape,
+            patch("src.nodes.scraper.call_llm") as mock_llm,
+        ):
+            mock_scrape.side_effect = _stream_results(
+                [
+                    ScrapeResult(
+                        url="https://example.com/new", markdown="New", success=True
+                    )
+                ]
+            )
+            mock_llm.return_value = "Summary"
+            state = {
+                "references": [
+                    "https://example.com/old",
+                    "http://www.example.com/old/",
+                    "https://example.com/new",
+                    "https://example.com/new?utm_campaign=x",
+                ],
+                "scraped_urls": ["https://example.com/old"],
+                "scraped_keys": {"https://example.com/old"},
+            }
+
+            result = await scraper_node(state)
+
+            assert mock_scrape.call_args[0][0] == ["https://example.com/new"]
+            assert result["scraped_keys"] == {"https://example.com/new"}
+
     async def test_scraper_includes_source_in_summary(self) -> None:
         """scraper_node should include source URL in summary."""
         from src.nodes.scraper import scraper_node
 
         with (
-            patch("src.nodes.scraper.scrape_multiple") as mock_scrape,
+            patch("src.nodes.scraper.scrape_stream") as mock_scrape,
             patch("src.nodes.scraper.call_llm") as mock_llm,
         ):
-            mock_scrape.return_value = [
-                ScrapeResult(
-                    url="https://example.com/test-page",
-                    markdown="Content",
-                    success=True,
-                )
-            ]
+            mock_scrape.side_effect = _stream_results(
+                [
+                    ScrapeResult(
+                        url="https://example.com/test-page",
+                        markdown="Content",
+                        success=True,
+                    )
+                ]
+            )
             mock_llm.return_value = "This is a summary of the content"
             state = {
                 "references": ["https://example.com/test-page"],
@@ -276,3 +575,379 @@ class TestScraperNode:
             result = await scraper_node(state)
 
             assert "https://example.com/test-page" in result["content"][0]
+
+
+class TestScraperPipeline:
+    """Tests for overlapping scraping and summarization."""
+
+    async def test_summarization_starts_before_scraping_finishes(self) -> None:
+        """The first page should be summarized while later pages are scraped."""
+        import asyncio
+
+        from src.nodes.scraper import scraper_node
+
+        first_summarized = asyncio.Event()
+
+        async def slow_stream(
+            urls: list[str], **kwargs: Any
+        ) -> AsyncIterator[tuple[int, ScrapeResult]]:
+            yield 0, ScrapeResult(url=urls[0], markdown="Page 1", success=True)
+            # The second page only "finishes" once the first has been summarized.
+            await asyncio.wait_for(first_summarized.wait(), timeout=1.0)
+            yield 1, ScrapeResult(url=urls[1], markdown="Page 2", success=True)
+
+        async def fake_llm(prompt: str, **kwargs: Any) -> str:
+            first_summarized.set()
+            return "Summary"
+
+        with (
+            patch("src.nodes.scraper.scrape_stream", side_effect=slow_stream),
+            patch("src.nodes.scraper.call_llm", side_effect=fake_llm),
+        ):
+            state = {
+                "references": ["https://example.com/1", "https://example.com/2"],
+                "current_search_query": "test",
+            }
+
+            result = await scraper_node(state)
+
+        assert len(result["content"]) == 2
+
+    async def test_content_follows_input_order(self) -> None:
+        """Summaries should be ordered by URL position, not completion time."""
+        from src.nodes.scraper import scraper_node
+
+        async def reversed_stream(
+            urls: list[str], **kwargs: Any
+        ) -> AsyncIterator[tuple[int, ScrapeResult]]:
+            for index in reversed(range(len(urls))):
+                yield (
+                    index,
+                    ScrapeResult(
+                        url=urls[index], markdown=f"Page {index}", success=True
+                    ),
+                )
+
+        async def fake_llm(prompt: str, **kwargs: Any) -> str:
+            return "Summary of " + prompt.rsplit("Page ", 1)[1].strip()
+
+        with (
+            patch("src.nodes.scraper.scrape_stream", side_effect=reversed_stream),
+            patch("src.nodes.scraper.call_llm", side_effect=fake_llm),
+        ):
+            urls = [f"https://example.com/{i}" for i in range(3)]
+            result = await scraper_node({"references": urls})
+
+        assert [c.split("\n")[0] for c in result["content"]] == [
+            "Summary of 0",
+            "Summary of 1",
+            "Summary of 2",
+        ]
+        assert result["scraped_urls"] == urls
+
+    async def test_llm_error_propagates(self) -> None:
+        """An LLM failure should stop the pipeline and propagate unchanged."""
+        from src.llm import LLMError
+        from src.nodes.scraper import scraper_node
+
+        with (
+            patch("src.nodes.scraper.scrape_stream") as mock_scrape,
+            patch("src.nodes.scraper.call_llm") as mock_llm,
+        ):
+            mock_scrape.side_effect = _stream_results(
+                [
+                    ScrapeResult(
+                        url=f"https://example.com/{i}",
+                        markdown="Content",
+                        success=True,
+                    )
+                    for i in range(5)
+                ]
+            )
+            mock_llm.side_effect = LLMError("Ollama is down")
+
+            with pytest.raises(LLMError):
+                await scraper_node(
+                    {"references": [f"https://example.com/{i}" for i in range(5)]}
+                )
+
+
+class TestTriage:
+    """Tests for pre-summarization triage."""
+
+    @pytest.fixture(autouse=True)
+    def _enable_triage(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from src.config import settings
+
+        monkeypatch.setattr(settings, "scrape_triage", True)
+        monkeypatch.setattr(settings, "triage_verbatim_chars", 500)
+
+    def test_short_page_is_kept_verbatim(self) -> None:
+        """Pages under the size threshold should skip summarization."""
+        from src.nodes.scraper import _triage
+
+        assert _triage("Qubits are two-level quantum systems.", "qubit") == "verbatim"
+
+    def test_cookie_wall_is_dropped(self) -> None:
+        """Short pages with boilerplate markers should be dropped."""
+        from src.nodes.scraper import _triage
+
+        page = "We use cookies to improve your experience. Accept all cookies?"
+
+        assert _triage(page, "qubit") == "drop"
+
+    def test_link_heavy_page_is_dropped(self) -> None:
+        """Navigation pages made mostly of links should be dropped."""
+        from src.nodes.scraper import _triage
+
+        page = " | ".join(f"[Section {i}](https://example.com/{i})" for i in range(60))
+
+        assert _triage(page, "qubit") == "drop"
+
+    def test_off_topic_page_is_dropped(self) -> None:
+        """Long pages sharing no terms with the query should be dropped."""
+        from src.nodes.scraper import _triage
+
+        page = "Recipe for tomato soup with basil and garlic. " * 40
+
+        assert _triage(page, "qubit error correction") == "drop"
+
+    def test_relevant_long_page_is_summarized(self) -> None:
+        """Long on-topic pages should go to the summarizer."""
+        from src.nodes.scraper import _triage
+
+        page = "Qubit error correction with surface codes. " * 40
+
+        assert _triage(page, "qubit error correction") == "summarize"
+
+    async def test_pages_are_judged_by_their_own_query(self) -> None:
+        """Each page should be triaged against the query that found it."""
+        from src.nodes.scraper import scraper_node
+
+        qubit_page = "Qubits and error correction. " + "qubit coherence " * 150
+        tomato_page = "Growing tomatoes at home. " + "tomato soil " * 150
+
+        with (
+            patch("src.nodes.scraper.scrape_stream") as mock_scrape,
+            patch("src.nodes.scraper.call_llm") as mock_llm,
+        ):
+            mock_scrape.side_effect = _stream_results(
+                [
+                    ScrapeResult(
+                        url="https://q.example/", markdown=qubit_page, success=True
+                    ),
+                    ScrapeResult(
+                        url="https://t.example/", markdown=tomato_page, success=True
+                    ),
+                ]
+            )
+            mock_llm.return_value = "Summary"
+            state = {
+                "references": ["https://q.example/", "https://t.example/"],
+                "reference_queries": {
+                    "https://q.example/": "qubit coherence",
+                    "https://t.example/": "tomato soil",
+                },
+                "current_search_query": "tomato soil",
+            }
+
+            result = await scraper_node(state)
+
+            assert mock_llm.call_count == 2
+            assert len(result["content"]) == 2
+
+    async def test_scraper_counts_avoided_llm_calls(self) -> None:
+        """scraper_node should skip the LLM for triaged pages and count them."""
+        from src import metrics
+        from src.nodes.scraper import scraper_node
+
+        metrics.reset()
+        with (
+            patch("src.nodes.scraper.scrape_stream") as mock_scrape,
+            patch("src.nodes.scraper.call_llm") as mock_llm,
+        ):
+            mock_scrape.side_effect = _stream_results(
+                [
+                    ScrapeResult(
+                        url="https://example.com/stub",
+                        markdown="Qubits are two-level quantum systems.",
+                        success=True,
+                    ),
+                    ScrapeResult(
+                        url="https://example.com/wall",
+                        markdown="Please enable JavaScript to continue.",
+                        success=True,
+                    ),
+                    ScrapeResult(
+                        url="https://example.com/article",
+                        markdown="Qubit error correction with surface codes. " * 40,
+                        success=True,
+                    ),
+                ]
+            )
+            mock_llm.return_value = "Summary"
+            state = {
+                "references": [
+                    "https://example.com/stub",
+                    "https://example.com/wall",
+                    "https://example.com/article",
+                ],
+                "current_search_query": "qubit error correction",
+            }
+
+            result = await scraper_node(state)
+
+            assert mock_llm.call_count == 1
+            assert result["content"] == [
+                "Qubits are two-level quantum systems.\n\n"
+                "Source: https://example.com/stub",
+                "Summary\n\nSource: https://example.com/article",
+            ]
+            assert len(result["scraped_urls"]) == 3
+            assert metrics.get("llm_calls_avoided") == 2
+            assert metrics.get("pages_verbatim") == 1
+            assert metrics.get("pages_dropped") == 1
+
+
+class TestDuplicateContent:
+    """Tests for content-hash and near-duplicate summary reuse."""
+
+    ARTICLE = " ".join(f"term{(i * 7919) % 499}" for i in range(600))
+
+    async def test_near_duplicate_is_recorded_not_summarized(self) -> None:
+        """A mirror of a summarized page should be recorded against the original."""
+        from src.nodes.scraper import scraper_node
+
+        with (
+            patch("src.nodes.scraper.scrape_stream") as mock_scrape,
+            patch("src.nodes.scraper.call_llm") as mock_llm,
+        ):
+            mock_scrape.side_effect = _stream_results(
+                [
+                    ScrapeResult(
+                        url="https://example.com/article",
+                        markdown=self.ARTICLE,
+                        success=True,
+                    ),
+                    ScrapeResult(
+                        url="https://amp.example.com/article",
+                        markdown="# Article\n\n" + self.ARTICLE + "\n\nShare this.",
+                        success=True,
+                    ),
+                ]
+            )
+            mock_llm.return_value = "Summary"
+            state = {
+                "references": [
+                    "https://example.com/article",
+                    "https://amp.example.com/article",
+                ]
+            }
+
+            result = await scraper_node(state)
+
+            assert mock_llm.call_count == 1
+            assert result["content"] == [
+                "Summary\n\nSource: https://example.com/article"
+            ]
+            assert result["duplicate_sources"] == {
+                "https://amp.example.com/article": "https://example.com/article"
+            }
+            assert list(result["content_fingerprints"]) == [
+                "https://example.com/article"
+            ]
+
+    async def test_duplicate_of_earlier_iteration_is_recorded(self) -> None:
+        """Fingerprints from earlier iterations should be checked too."""
+        from src.fingerprint import simhash
+        from src.nodes.scraper import scraper_node
+
+        with (
+            patch("src.nodes.scraper.scrape_stream") as mock_scrape,
+            patch("src.nodes.scraper.call_llm") as mock_llm,
+        ):
+            mock_scrape.side_effect = _stream_results(
+                [
+                    ScrapeResult(
+                        url="https://mirror.example.org/a",
+                        markdown=self.ARTICLE,
+                        success=True,
+                    )
+                ]
+            )
+            state = {
+                "references": ["https://mirror.example.org/a"],
+                "content_fingerprints": {
+                    "https://example.com/article": simhash(self.ARTICLE)
+                },
+            }
+
+            result = await scraper_node(state)
+
+            mock_llm.assert_not_called()
+            assert result["duplicate_sources"] == {
+                "https://mirror.example.org/a": "https://example.com/article"
+            }
+
+    async def test_summary_reused_across_runs_by_content_hash(self) -> None:
+        """Identical content seen in an earlier run should reuse its summary."""
+        from src import metrics
+        from src.nodes.scraper import scraper_node
+
+        metrics.reset()
+        with (
+            patch("src.nodes.scraper.scrape_stream") as mock_scrape,
+            patch("src.nodes.scraper.call_llm") as mock_llm,
+        ):
+            mock_llm.return_value = "Summary"
+            for url in ("https://example.com/a", "https://example.org/b"):
+                mock_scrape.side_effect = _stream_results(
+                    [ScrapeResult(url=url, markdown=self.ARTICLE, success=True)]
+                )
+                result = await scraper_node({"references": [url]})
+
+            assert mock_llm.call_count == 1
+            assert result["content"] == ["Summary\n\nSource: https://example.org/b"]
+            assert metrics.get("summaries_reused") == 1
+
+    async def test_summary_not_shared_between_queries(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A page narrowed to different passages per query needs two summaries."""
+        from src.config import settings
+        from src.nodes.scraper import scraper_node
+
+        monkeypatch.setattr(settings, "selection_passage_tokens", 100)
+        monkeypatch.setattr(settings, "selection_max_tokens", 300)
+        paragraphs = [f"Filler paragraph {i} " + "lorem " * 60 for i in range(20)]
+        paragraphs[3] = "Qubit error correction uses surface codes."
+        paragraphs[15] = "Market history shows repeated speculative bubbles."
+        page = "\n\n".join(paragraphs)
+
+        with (
+            patch("src.nodes.scraper.scrape_stream") as mock_scrape,
+            patch("src.nodes.scraper.call_llm") as mock_llm,
+        ):
+            mock_llm.side_effect = ["Qubit summary", "Market summary"]
+            contents = []
+            for query in ("qubit error correction", "market history"):
+                mock_scrape.side_effect = _stream_results(
+                    [
+                        ScrapeResult(
+                            url="https://example.com/a", markdown=page, success=True
+                        )
+                    ]
+                )
+                state = {
+                    "references": ["https://example.com/a"],
+                    "current_search_query": query,
+                }
+                contents.append((await scraper_node(state))["content"])
+
+            assert mock_llm.call_count == 2
+            assert "surface codes" in mock_llm.call_args_list[0].args[0]
+            assert "speculative bubbles" in mock_llm.call_args_list[1].args[0]
+            assert contents == [
+                ["Qubit summary\n\nSource: https://example.com/a"],
+                ["Market summary\n\nSource: https://example.com/a"],
+            ]
@@ -80,6 +80,45 @@ class TestTranslatorInputNode:
             assert result["source_language"] == "en"
 
 
+class TestTranslatorModelPreload:
+    """Tests for background model loading in the translator nodes."""
+
+    @pytest.mark.asyncio
+    async def test_input_node_waits_for_preloaded_model(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The input node should translate once the forward model is loaded."""
+        import functools
+
+        from src.config import settings
+        from src.nodes.translator import translator_input_node
+        from src.tools import translate
+
+        loaded: list[str] = []
+        tokenizer, model = MagicMock(), MagicMock()
+        tokenizer.batch_decode.return_value = ["Hello"]
+
+        def load(name: str):
+            loaded.append(name)
+            return tokenizer, model
+
+        monkeypatch.setattr(settings, "translation_preload", True)
+        # Cached like the real loader, so translating reuses the loaded model.
+        monkeypatch.setattr(translate, "_load_model", functools.cache(load))
+        try:
+            with patch("src.nodes.translator.detect_language", return_value="ja"):
+                result = await translator_input_node({"task": "こんにちは"})
+            await translate.model_ready(translate.REVERSE_MODELS["ja"])
+        finally:
+            translate.close_translation_executor()
+
+        assert result["task"] == "Hello"
+        assert loaded == [
+            translate.SUPPORTED_LANGUAGES["ja"],
+            translate.REVERSE_MODELS["ja"],
+        ]
+
+
 class TestTranslatorOutputNode:
     """Tests for translator_output_node function."""
 
@@ -86,6 +86,32 @@ class TestWriterNode:
             assert "https://example.com/page1" in call_args
             assert "https://example.com/page2" in call_args
 
+    async def test_writer_marks_duplicate_references(self) -> None:
+        """References with duplicated content should point at the original page."""
+        from src.nodes.writer import writer_node
+
+        with patch("src.nodes.writer.call_llm") as mock_llm:
+            mock_llm.return_value = "Report"
+            state = {
+                "task": "Test task",
+                "content": ["Summary\n\nSource: https://example.com/article"],
+                "references": [
+                    "https://example.com/article",
+                    "https://amp.example.com/article",
+                ],
+                "duplicate_sources": {
+                    "https://amp.example.com/article": "https://example.com/article"
+                },
+            }
+
+            await writer_node(state)
+
+            call_args = mock_llm.call_args[0][0]
+            assert (
+                "- https://amp.example.com/article "
+                "(same content as https://example.com/article)"
+            ) in call_args
+
     async def test_writer_handles_empty_content(self) -> None:
         """writer_node should handle empty content list."""
         from src.nodes.writer import writer_node
@@ -0,0 +1,181 @@
+"""Tests for prompt token budgeting."""
+
+from __future__ import annotations
+
+import pytest
+
+from src import metrics
+from src.config import settings
+from src.prompts.budget import (
+    MIN_ITEM_TOKENS,
+    TRUNCATION_MARKER,
+    count_tokens,
+    fit_to_budget,
+    prompt_budget,
+    take_whole_items,
+    truncate_to_tokens,
+)
+from src.prompts.templates import format_reviewer_prompt, format_writer_prompt
+
+
+class TestCountTokens:
+    """Tests for the token estimator."""
+
+    def test_ascii_text_uses_chars_per_token(self) -> None:
+        """ASCII text should be estimated at about four characters per token."""
+        assert count_tokens("a" * 400) == 100
+
+    def test_cjk_text_counts_one_token_per_char(self) -> None:
+        """Non-ASCII characters should be counted as one token each."""
+        assert count_tokens("量子計算") == 4
+
+    def test_empty_text_is_zero(self) -> None:
+        """Empty text should have no tokens."""
+        assert count_tokens("") == 0
+
+
+class TestPromptBudget:
+    """Tests for prompt_budget."""
+
+    def test_subtracts_reserve(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The budget should be the context length minus the reserve."""
+        monkeypatch.setattr(settings, "max_context_length", 4096)
+
+        assert prompt_budget(1000) == 3096
+
+    def test_keeps_half_the_context(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A reserve larger than half the context should not starve the prompt."""
+        monkeypatch.setattr(settings, "max_context_length", 2048)
+
+        assert prompt_budget(1536) == 1024
+
+
+class TestTruncateToTokens:
+    """Tests for truncate_to_tokens."""
+
+    def test_short_text_unchanged(self) -> None:
+        """Text within the limit should be returned as is."""
+        assert truncate_to_tokens("short text", 100) == "short text"
+
+    def test_long_text_fits_limit(self) -> None:
+        """Truncated text should fit the limit and end with the marker."""
+        text = " ".join(["word"] * 1000)
+
+        result = truncate_to_tokens(text, 50)
+
+        assert count_tokens(result) <= 50
+        assert result.endswith(TRUNCATION_MARKER)
+        assert result.startswith("word word")
+
+    def test_cuts_at_word_boundary(self) -> None:
+        """Truncation should not split a word."""
+        text = " ".join(["abcdefgh"] * 100)
+
+        result = truncate_to_tokens(text, 30)
+
+        words = result.removesuffix(TRUNCATION_MARKER).split(" ")
+        assert all(word == "abcdefgh" for word in words)
+
+
+class TestFitToBudget:
+    """Tests for fit_to_budget."""
+
+    def test_items_that_fit_are_unchanged(self) -> None:
+        """Items within the budget should be returned unchanged."""
+        items = ["first summary", "second summary"]
+
+        assert fit_to_budget(items, 1000) == items
+
+    def test_short_items_kept_whole_long_items_truncated(self) -> None:
+        """Short items should survive whole while long ones share the rest."""
+        short = "short summary"
+        long_a = "a " * 2000
+        long_b = "b " * 2000
+
+        result = fit_to_budget([long_a, short, long_b], 600)
+
+        assert result[1] == short
+        assert result[0].endswith(TRUNCATION_MARKER)
+        assert result[2].endswith(TRUNCATION_MARKER)
+        assert count_tokens("\n\n".join(result)) <= 600
+
+    def test_drops_trailing_items_when_budget_is_tiny(self) -> None:
+        """Trailing items should be dropped before shares fall below the minimum."""
+        items = ["x " * 500 for _ in range(10)]
+
+        result = fit_to_budget(items, MIN_ITEM_TOKENS * 3 + 10)
+
+        assert len(result) == 3
+        assert count_tokens("\n\n".join(result)) <= MIN_ITEM_TOKENS * 3 + 10
+
+
+class TestTakeWholeItems:
+    """Tests for take_whole_items."""
+
+    def test_keeps_prefix_without_truncating(self) -> None:
+        """Only whole items that fit should be kept."""
+        items = [f"- https://example.com/{i:04d}" for i in range(100)]
+
+        result = take_whole_items(items, 50)
+
+        assert result == items[: len(result)]
+        assert 0 < len(result) < len(items)
+        assert count_tokens("\n".join(result)) <= 50
+
+
+class TestPromptBuilders:
+    """Tests for budget enforcement in the prompt builders."""
+
+    def test_reviewer_prompt_fits_context(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """format_reviewer_prompt should stay within max_context_length."""
+        monkeypatch.setattr(settings, "max_context_length", 2048)
+        content = [f"Summary {i}: " + "detail " * 400 for i in range(20)]
+
+        prompt = format_reviewer_prompt("What is AI?", content)
+
+        assert count_tokens(prompt) <= 2048
+        assert "What is AI?" in prompt
+
+    def test_writer_prompt_fits_context(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """format_writer_prompt should stay within max_context_length."""
+        monkeypatch.setattr(settings, "max_context_length", 4096)
+        content = ["finding " * 800 for _ in range(10)]
+        references = [f"https://example.com/page/{i}" for i in range(500)]
+
+        prompt = format_writer_prompt("What is AI?", content, references)
+
+        assert count_tokens(prompt) <= 4096
+        assert "https://example.com/page/0" in prompt
+
+    def test_builders_report_prompt_tokens(self) -> None:
+        """Prompt builders should record their token usage in the run metrics."""
+        metrics.reset()
+
+        prompt = format_reviewer_prompt("What is AI?", ["Some content"])
+
+        assert metrics.get("prompts") == 1
+        assert metrics.get("prompt_tokens") == count_tokens(prompt)
+        assert metrics.get("prompts_compressed") == 0
+
+    def test_prompt_tokens_recorded_per_prompt_type(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Each prompt type should report its own count, total and peak size."""
+        monkeypatch.setattr(settings, "max_context_length", 2048)
+        metrics.reset()
+
+        small = format_reviewer_prompt("What is AI?", ["Some content"])
+        large = format_reviewer_prompt("What is AI?", ["detail " * 4000])
+        writer = format_writer_prompt("What is AI?", ["Finding"], [])
+
+        assert metrics.get("reviewer_prompts") == 2
+        assert metrics.get("reviewer_prompt_tokens") == count_tokens(
+            small
+        ) + count_tokens(large)
+        assert metrics.get("reviewer_prompt_tokens_max") == count_tokens(large)
+        assert metrics.get("reviewer_prompts_compressed") == 1
+        assert metrics.get("writer_prompts") == 1
+        assert metrics.get("writer_prompt_tokens") == count_tokens(writer)
+        assert metrics.get("prompts") == 3
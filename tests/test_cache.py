@@ -0,0 +1,129 @@
+"""Tests for the on-disk cache."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.cache import DiskCache, cache_stats, get_cache, make_key
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Iterator[DiskCache]:
+    """Return an empty cache in a temporary directory."""
+    disk_cache = DiskCache(tmp_path / "test.sqlite3", ttl=60, max_entries=3)
+    yield disk_cache
+    disk_cache.close()
+
+
+class TestMakeKey:
+    """Tests for make_key."""
+
+    def test_same_parts_same_key(self) -> None:
+        """Equal parts should produce equal keys."""
+        assert make_key("a", 1, {"x": 2}) == make_key("a", 1, {"x": 2})
+
+    def test_different_parts_different_key(self) -> None:
+        """Different parts should produce different keys."""
+        assert make_key("a", 1) != make_key("a", 2)
+
+
+class TestDiskCache:
+    """Tests for DiskCache."""
+
+    def test_get_missing_returns_none(self, cache: DiskCache) -> None:
+        """A missing key should be a miss."""
+        assert cache.get("missing") is None
+        assert cache.misses == 1
+
+    def test_set_then_get_roundtrip(self, cache: DiskCache) -> None:
+        """Stored JSON values should be returned unchanged."""
+        cache.set("key", {"results": [1, 2, 3], "text": "日本語"})
+
+        assert cache.get("key") == {"results": [1, 2, 3], "text": "日本語"}
+        assert cache.hits == 1
+
+    def test_values_persist_across_instances(self, tmp_path: Path) -> None:
+        """A reopened cache should see previously stored values."""
+        first = DiskCache(tmp_path / "persist.sqlite3")
+        first.set("key", "value")
+        first.close()
+
+        second = DiskCache(tmp_path / "persist.sqlite3")
+        try:
+            assert second.get("key") == "value"
+        finally:
+            second.close()
+
+    def test_expired_entry_is_a_miss(self, cache: DiskCache) -> None:
+        """Entries older than the TTL should not be returned by get()."""
+        with patch("src.cache.time.time", return_value=1000.0):
+            cache.set("key", "value")
+        with patch("src.cache.time.time", return_value=1061.0):
+            assert cache.get("key") is None
+            entry = cache.get_entry("key")
+
+        assert entry is not None
+        assert entry.value == "value"
+
+    def test_evicts_least_recently_used(self, cache: DiskCache) -> None:
+        """Exceeding max_entries should evict the least recently used entry."""
+        for i, key in enumerate(["a", "b", "c"]):
+            with patch("src.cache.time.time", return_value=1000.0 + i):
+                cache.set(key, key)
+        with patch("src.cache.time.time", return_value=1010.0):
+            cache.get_entry("a")
+        with patch("src.cache.time.time", return_value=1011.0):
+            cache.set("d", "d")
+
+        assert len(cache) == 3
+        assert cache.get_entry("b") is None
+        assert cache.get_entry("a") is not None
+        assert cache.evictions == 1
+
+    def test_evicts_to_byte_limit(self, tmp_path: Path) -> None:
+        """Exceeding max_bytes should evict old entries until the total fits."""
+        disk_cache = DiskCache(tmp_path / "bytes.sqlite3", max_bytes=3000)
+        try:
+            for i in range(5):
+                with patch("src.cache.time.time", return_value=1000.0 + i):
+                    disk_cache.set(f"key{i}", os.urandom(600).hex())
+
+            assert len(disk_cache) < 5
+            assert disk_cache.get_entry("key4") is not None
+        finally:
+            disk_cache.close()
+
+    def test_clear_removes_everything(self, cache: DiskCache) -> None:
+        """clear() should remove all entries."""
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.clear()
+
+        assert len(cache) == 0
+
+
+class TestGetCache:
+    """Tests for the named cache registry."""
+
+    def test_same_name_returns_same_cache(self) -> None:
+        """Repeated lookups should share one open cache."""
+        assert get_cache("shared") is get_cache("shared")
+
+    def test_cache_lives_in_cache_dir(self, isolated_cache_dir: Path) -> None:
+        """Caches should be created under settings.cache_dir."""
+        cache = get_cache("located")
+
+        assert cache.path == isolated_cache_dir / "located.sqlite3"
+
+    def test_cache_stats_reports_counters(self) -> None:
+        """cache_stats() should report counters per cache name."""
+        cache = get_cache("counted")
+        cache.get("missing")
+
+        assert cache_stats()["counted"]["misses"] == 1
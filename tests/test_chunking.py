@@ -0,0 +1,82 @@
+"""Tests for markdown chunking."""
+
+from __future__ import annotations
+
+from src.chunking import group_by_tokens, split_markdown
+from src.prompts.budget import count_tokens
+
+
+class TestSplitMarkdown:
+    """Tests for split_markdown."""
+
+    def test_short_text_is_one_chunk(self) -> None:
+        """Text within the limit should come back as a single chunk."""
+        assert split_markdown("# Title\n\nShort paragraph.", 100) == [
+            "# Title\n\nShort paragraph."
+        ]
+
+    def test_blank_text_has_no_chunks(self) -> None:
+        """Blank text should produce no chunks."""
+        assert split_markdown("  \n\n ", 100) == []
+
+    def test_chunks_respect_token_limit(self) -> None:
+        """Every chunk should fit the limit and no words should be lost."""
+        text = "\n\n".join(f"Paragraph {i} " + "word " * 60 for i in range(20))
+
+        chunks = split_markdown(text, 150)
+
+        assert len(chunks) > 1
+        assert all(count_tokens(chunk) <= 150 for chunk in chunks)
+        assert " ".join(chunks).split() == text.split()
+
+    def test_heading_starts_new_chunk(self) -> None:
+        """A heading should start a new chunk once the current one is half full."""
+        text = "# One\n\n" + "alpha " * 70 + "\n\n# Two\n\n" + "beta " * 10
+
+        chunks = split_markdown(text, 150)
+
+        assert chunks[1].startswith("# Two")
+
+    def test_without_sections_chunks_are_packed(self) -> None:
+        """Without sections, headings should not leave chunks part-filled."""
+        text = "\n\n".join(f"## Part {i}\n\n" + "word " * 40 for i in range(6))
+
+        chunks = split_markdown(text, 200, sections=False)
+
+        assert len(chunks) < len(split_markdown(text, 200))
+        assert all(count_tokens(chunk) <= 200 for chunk in chunks)
+        assert " ".join(chunks).split() == text.split()
+
+    def test_splits_oversized_paragraph(self) -> None:
+        """A single paragraph larger than the limit should be split."""
+        chunks = split_markdown("word " * 1000, 100)
+
+        assert all(count_tokens(chunk) <= 100 for chunk in chunks)
+
+    def test_splits_text_without_spaces(self) -> None:
+        """Text without separators (e.g. CJK) should be cut by length."""
+        chunks = split_markdown("量" * 500, 100)
+
+        assert all(count_tokens(chunk) <= 100 for chunk in chunks)
+        assert "".join(chunks) == "量" * 500
+
+
+class TestGroupByTokens:
+    """Tests for group_by_tokens."""
+
+    def test_groups_fit_limit(self) -> None:
+        """Groups should stay within the limit and keep item order."""
+        items = [f"item {i} " + "x " * 40 for i in range(10)]
+
+        groups = group_by_tokens(items, 100)
+
+        assert [item for group in groups for item in group] == items
+        assert all(len(group) >= 2 for group in groups)
+
+    def test_groups_always_pair_large_items(self) -> None:
+        """Each group should take at least two items so reduction progresses."""
+        items = ["y " * 400 for _ in range(4)]
+
+        groups = group_by_tokens(items, 100)
+
+        assert [len(group) for group in groups] == [2, 2]
@@ -116,3 +116,46 @@ class TestTranslationConfig:
 
         settings = Settings()
         assert settings.translation_device == "cuda"
+
+    def test_translation_executor_from_env(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Config should read the translation executor sizes from environment."""
+        monkeypatch.setenv("TRANSLATION_WORKERS", "2")
+        monkeypatch.setenv("TRANSLATION_THREADS", "3")
+        monkeypatch.setenv("TRANSLATION_QUEUE_SIZE", "8")
+
+        from src.config import Settings
+
+        settings = Settings()
+        assert settings.translation_workers == 2
+        assert settings.translation_threads == 3
+        assert settings.translation_queue_size == 8
+
+
+class TestCacheConfig:
+    """Tests for cache configuration."""
+
+    def test_default_cache_dir(self) -> None:
+        """Caches should default to the user cache directory."""
+        from src.config import Settings
+
+        settings = Settings()
+        assert settings.cache_dir == "~/.cache/local-deep-research"
+
+    def test_cache_settings_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Config should read cache settings from environment."""
+        monkeypatch.setenv("CACHE_DIR", "/tmp/ldr-cache")
+        monkeypatch.setenv("SEARCH_CACHE_TTL", "0")
+        monkeypatch.setenv("PAGE_CACHE_SERVE_STALE", "false")
+        monkeypatch.setenv("ENABLE_LLM_CACHE", "true")
+        monkeypatch.setenv("LLM_CACHE_MAX_TEMPERATURE", "0.2")
+
+        from src.config import Settings
+
+        settings = Settings()
+        assert settings.cache_dir == "/tmp/ldr-cache"
+        assert settings.search_cache_ttl == 0
+        assert settings.page_cache_serve_stale is False
+        assert settings.enable_llm_cache is True
+        assert settings.llm_cache_max_temperature == 0.2
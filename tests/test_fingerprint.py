@@ -0,0 +1,61 @@
+"""Tests for content fingerprints."""
+
+from __future__ import annotations
+
+from src.fingerprint import (
+    content_hash,
+    find_near_duplicate,
+    hamming_distance,
+    normalize_text,
+    simhash,
+)
+
+# A long page of varied words, as real articles are.
+ARTICLE = " ".join(f"term{(i * 7919) % 499}" for i in range(600))
+
+
+class TestNormalizeText:
+    """Tests for normalize_text."""
+
+    def test_drops_markup_case_and_link_targets(self) -> None:
+        """Formatting differences should not affect the normalized text."""
+        assert normalize_text("## Hello, [World](https://a.example/x)!") == (
+            "hello world"
+        )
+
+
+class TestContentHash:
+    """Tests for content_hash."""
+
+    def test_same_words_hash_alike(self) -> None:
+        """Pages differing only in markup should share a hash."""
+        assert content_hash("**Hello** world") == content_hash("hello\n\nWORLD")
+
+    def test_different_text_hashes_differ(self) -> None:
+        """Different words should give different hashes."""
+        assert content_hash("hello world") != content_hash("hello there")
+
+
+class TestSimHash:
+    """Tests for simhash and near-duplicate lookup."""
+
+    def test_near_duplicate_is_close(self) -> None:
+        """A lightly edited copy should be within the near-duplicate distance."""
+        edited = ARTICLE.replace("term0 ", "Final ", 1) + " Share this."
+
+        assert hamming_distance(simhash(ARTICLE), simhash(edited)) <= 3
+
+    def test_unrelated_text_is_far(self) -> None:
+        """Unrelated texts should have distant fingerprints."""
+        other = " ".join(f"Recipe step {i} adds basil to the soup." for i in range(40))
+
+        assert hamming_distance(simhash(ARTICLE), simhash(other)) > 3
+
+    def test_find_near_duplicate_returns_original_url(self) -> None:
+        """find_near_duplicate should return the matching URL."""
+        known = {"https://example.com/original": simhash(ARTICLE)}
+
+        assert find_near_duplicate(simhash(ARTICLE + " Print view."), known) == (
+            "https://example.com/original"
+        )
+        assert find_near_duplicate(simhash("Something else entirely"), known) is None
@@ -94,6 +94,215 @@ class TestCallLLM:
 
             assert "connection" in str(exc_info.value).lower()
 
+    async def test_call_llm_forwards_format(self) -> None:
+        """call_llm should pass the structured output format to ChatOllama."""
+        from src.llm import call_llm
+
+        schema = {"type": "object", "properties": {"ok": {"type": "boolean"}}}
+
+        with patch("src.llm.ChatOllama") as mock_chat:
+            mock_instance = MagicMock()
+            mock_instance.ainvoke = AsyncMock(return_value=MagicMock(content="{}"))
+            mock_chat.return_value = mock_instance
+
+            await call_llm("Test prompt", format=schema)
+
+            assert mock_chat.call_args[1]["format"] == schema
+
+    async def test_call_llm_sets_num_ctx_from_settings(self) -> None:
+        """call_llm should size the context window to max_context_length."""
+        from src.config import settings
+        from src.llm import call_llm
+
+        with patch("src.llm.ChatOllama") as mock_chat:
+            mock_instance = MagicMock()
+            mock_instance.ainvoke = AsyncMock(return_value=MagicMock(content="ok"))
+            mock_chat.return_value = mock_instance
+
+            await call_llm("Test prompt")
+
+            assert mock_chat.call_args[1]["num_ctx"] == settings.max_context_length
+
+
+class TestLLMClientRegistry:
+    """Tests for reusing ChatOllama clients across calls."""
+
+    async def test_same_config_reuses_client(self) -> None:
+        """Calls with the same configuration should share one client."""
+        from src.llm import call_llm
+
+        mock_response = MagicMock()
+        mock_response.content = "Response"
+
+        with patch("src.llm.ChatOllama") as mock_chat:
+            mock_instance = MagicMock()
+            mock_instance.ainvoke = AsyncMock(return_value=mock_response)
+            mock_chat.return_value = mock_instance
+
+            await call_llm("First", model="m:1b")
+            await call_llm("Second", model="m:1b")
+
+            mock_chat.assert_called_once()
+            assert mock_instance.ainvoke.await_count == 2
+
+    async def test_different_config_uses_separate_clients(self) -> None:
+        """Temperature and options should be part of the client key."""
+        from src.llm import get_llm
+
+        with patch("src.llm.ChatOllama") as mock_chat:
+            mock_chat.side_effect = lambda **kwargs: MagicMock()
+
+            base = get_llm("m:1b", temperature=0.7)
+            colder = get_llm("m:1b", temperature=0.0)
+            bigger = get_llm("m:1b", temperature=0.7, options={"num_ctx": 8192})
+
+            assert len({id(base), id(colder), id(bigger)}) == 3
+            assert mock_chat.call_args.kwargs["num_ctx"] == 8192
+
+    def test_new_event_loop_gets_fresh_clients(self) -> None:
+        """Clients should not leak across event loops."""
+        import asyncio
+
+        from src.llm import get_llm
+
+        async def lookup() -> object:
+            return get_llm("m:1b", temperature=0.7)
+
+        with patch("src.llm.ChatOllama") as mock_chat:
+            mock_chat.side_effect = lambda **kwargs: MagicMock()
+
+            first = asyncio.run(lookup())
+            second = asyncio.run(lookup())
+
+            assert first is not second
+
+    async def test_close_llm_clients_closes_connections(self) -> None:
+        """Closing should close each client's HTTP connections."""
+        from src.llm import close_llm_clients, get_llm
+
+        with patch("src.llm.ChatOllama") as mock_chat:
+            mock_instance = MagicMock()
+            mock_instance._async_client.close = AsyncMock()
+            mock_chat.return_value = mock_instance
+
+            get_llm("m:1b", temperature=0.7)
+            await close_llm_clients()
+            get_llm("m:1b", temperature=0.7)
+
+            mock_instance._async_client.close.assert_awaited_once()
+            mock_instance._client.close.assert_called_once()
+            assert mock_chat.call_count == 2
+
+
+class TestLLMResponseCache:
+    """Tests for the on-disk LLM response cache."""
+
+    @pytest.fixture
+    def cache_enabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Enable the LLM cache for a test."""
+        from src.config import settings
+
+        monkeypatch.setattr(settings, "enable_llm_cache", True)
+
+    @pytest.fixture
+    def mock_chat(self) -> MagicMock:
+        """Patch ChatOllama with a client returning numbered responses."""
+        responses = iter(f"Response {i}" for i in range(100))
+
+        async def ainvoke(prompt: str) -> MagicMock:
+            return MagicMock(content=next(responses))
+
+        with patch("src.llm.ChatOllama") as mock_chat:
+            mock_chat.return_value.ainvoke = AsyncMock(side_effect=ainvoke)
+            yield mock_chat
+
+    async def test_disabled_by_default(self, mock_chat: MagicMock) -> None:
+        """Without ENABLE_LLM_CACHE every call should reach the model."""
+        from src.llm import call_llm
+
+        first = await call_llm("Prompt")
+        second = await call_llm("Prompt")
+
+        assert first != second
+
+    async def test_repeated_prompt_served_from_cache(
+        self, cache_enabled: None, mock_chat: MagicMock
+    ) -> None:
+        """The same prompt and parameters should be answered from the cache."""
+        from src.llm import call_llm
+
+        first = await call_llm("Prompt", model="m:1b", temperature=0.0)
+        second = await call_llm("Prompt", model="m:1b", temperature=0.0)
+
+        assert first == second
+        assert mock_chat.return_value.ainvoke.await_count == 1
+
+    async def test_key_includes_model_and_temperature(
+        self,
+        cache_enabled: None,
+        mock_chat: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Different models or temperatures should not share entries."""
+        from src.config import settings
+        from src.llm import call_llm
+
+        monkeypatch.setattr(settings, "llm_cache_max_temperature", 0.5)
+        await call_llm("Prompt", model="m:1b", temperature=0.0)
+        await call_llm("Prompt", model="m:3b", temperature=0.0)
+        await call_llm("Prompt", model="m:1b", temperature=0.5)
+
+        assert mock_chat.return_value.ainvoke.await_count == 3
+
+    async def test_high_temperature_bypasses_cache(
+        self, cache_enabled: None, mock_chat: MagicMock
+    ) -> None:
+        """Calls above the temperature threshold should never be cached."""
+        from src.llm import call_llm
+
+        first = await call_llm("Prompt", temperature=1.0)
+        second = await call_llm("Prompt", temperature=1.0)
+
+        assert first != second
+
+    async def test_default_temperature_bypasses_cache(
+        self, cache_enabled: None, mock_chat: MagicMock
+    ) -> None:
+        """Calls at call_llm's default, sampled temperature should not be cached."""
+        from src.llm import call_llm
+
+        first = await call_llm("Prompt")
+        second = await call_llm("Prompt")
+
+        assert first != second
+        assert mock_chat.return_value.ainvoke.await_count == 2
+
+    async def test_use_cache_false_refreshes_entry(
+        self, cache_enabled: None, mock_chat: MagicMock
+    ) -> None:
+        """use_cache=False should call the model and replace the cached value."""
+        from src.llm import call_llm
+
+        await call_llm("Prompt", temperature=0.0)
+        refreshed = await call_llm("Prompt", temperature=0.0, use_cache=False)
+        cached = await call_llm("Prompt", temperature=0.0)
+
+        assert cached == refreshed
+        assert mock_chat.return_value.ainvoke.await_count == 2
+
+    async def test_counts_model_calls(
+        self, cache_enabled: None, mock_chat: MagicMock
+    ) -> None:
+        """Only calls that reach the model should count as llm_calls."""
+        from src import metrics
+        from src.llm import call_llm
+
+        metrics.reset()
+        await call_llm("Prompt", temperature=0.0)
+        await call_llm("Prompt", temperature=0.0)
+
+        assert metrics.get("llm_calls") == 1
+
 
 class TestLLMError:
     """Tests for the LLMError exception class."""
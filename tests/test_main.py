@@ -6,6 +6,8 @@ import sys
 from io import StringIO
 from unittest.mock import AsyncMock, patch
 
+import pytest
+
 from src.main import main
 
 
@@ -149,6 +151,40 @@ class TestFullResearchMode:
         assert call_args["report"] == ""
         assert result == "Research Report"
 
+    def test_run_research_records_wall_clock_time(self) -> None:
+        """run_research should record the elapsed wall-clock time of the run."""
+        import asyncio
+
+        from src import metrics
+        from src.main import run_research
+
+        mock_graph = AsyncMock()
+        mock_graph.ainvoke.return_value = {"report": "Research Report"}
+
+        with patch("src.main.build_graph", return_value=mock_graph):
+            asyncio.run(run_research("Test topic"))
+
+        assert metrics.get("wall_clock_seconds") > 0
+
+    def test_run_research_preloads_translation_models(self) -> None:
+        """run_research should start loading models for the task's language."""
+        import asyncio
+
+        from src.main import run_research
+
+        mock_graph = AsyncMock()
+        mock_graph.ainvoke.return_value = {"report": "レポート"}
+
+        with (
+            patch("src.main.build_graph", return_value=mock_graph),
+            patch("src.main.preload_models") as mock_preload,
+        ):
+            asyncio.run(
+                run_research("量子コンピュータの誤り訂正について教えてください")
+            )
+
+        mock_preload.assert_called_once_with("ja")
+
     def test_main_without_demo_runs_research(self) -> None:
         """Running without --demo should execute full research mode."""
         with (
@@ -163,6 +199,20 @@ class TestFullResearchMode:
         mock_run.assert_called_once_with("What is AI?")
         assert "AI Research Report" in output
 
+    def test_main_prints_run_metrics_to_stderr(self) -> None:
+        """Run metrics should be reported on stderr, not mixed into the report."""
+        with (
+            patch.object(sys, "argv", ["main", "What is AI?"]),
+            patch("src.main.run_research", new_callable=AsyncMock) as mock_run,
+            patch("sys.stdout", new=StringIO()) as mock_stdout,
+            patch("sys.stderr", new=StringIO()) as mock_stderr,
+        ):
+            mock_run.return_value = "# Report"
+            main()
+
+        assert "Run metrics:" in mock_stderr.getvalue()
+        assert "Run metrics:" not in mock_stdout.getvalue()
+
     def test_output_flag_saves_to_file(self) -> None:
         """--output flag should save report to file."""
         import os
@@ -201,3 +251,23 @@ class TestFullResearchMode:
             result = asyncio.run(run_research("Test topic"))
 
         assert result == ""
+
+    def test_run_research_closes_crawler_pool(self) -> None:
+        """run_research should start and always close the crawler pool."""
+        import asyncio
+
+        from src.main import run_research
+
+        mock_graph = AsyncMock()
+        mock_graph.ainvoke.side_effect = RuntimeError("graph failed")
+
+        with (
+            patch("src.main.build_graph", return_value=mock_graph),
+            patch("src.main.start_crawler_pool", new_callable=AsyncMock) as mock_start,
+            patch("src.main.close_crawler_pool", new_callable=AsyncMock) as mock_close,
+        ):
+            with pytest.raises(RuntimeError):
+                asyncio.run(run_research("Test topic"))
+
+        mock_start.assert_awaited_once()
+        mock_close.assert_awaited_once()
@@ -0,0 +1,79 @@
+"""Tests for per-run metrics."""
+
+from __future__ import annotations
+
+from src import metrics
+from src.cache import get_cache
+
+
+class TestCounters:
+    """Tests for metric counters."""
+
+    def test_increment_and_get(self) -> None:
+        """Counters should accumulate increments."""
+        metrics.reset()
+        metrics.increment("llm_calls")
+        metrics.increment("llm_calls", 2)
+
+        assert metrics.get("llm_calls") == 3
+
+    def test_maximum_keeps_largest_value(self) -> None:
+        """maximum() should only ever raise a counter."""
+        metrics.reset()
+        metrics.maximum("prompt_tokens_max", 120)
+        metrics.maximum("prompt_tokens_max", 80)
+
+        assert metrics.get("prompt_tokens_max") == 120
+
+    def test_unknown_counter_is_zero(self) -> None:
+        """Counters that were never incremented should read as zero."""
+        metrics.reset()
+
+        assert metrics.get("never_used") == 0
+
+    def test_reset_clears_counters_and_cache_stats(self) -> None:
+        """reset() should zero counters and cache hit/miss counters."""
+        cache = get_cache("metrics-test")
+        cache.get("missing")
+        metrics.increment("llm_calls")
+
+        metrics.reset()
+
+        assert metrics.snapshot() == {}
+        assert cache.misses == 0
+
+
+class TestFormatMetrics:
+    """Tests for format_metrics."""
+
+    def test_includes_counters(self) -> None:
+        """Formatted output should list each counter."""
+        metrics.reset()
+        metrics.increment("llm_calls", 4)
+
+        assert "llm_calls: 4" in metrics.format_metrics()
+
+    def test_includes_cache_hit_rate(self) -> None:
+        """Formatted output should show hit rates of used caches."""
+        metrics.reset()
+        cache = get_cache("llm")
+        cache.set("key", "value")
+        cache.get("key")
+        cache.get("missing")
+
+        output = metrics.format_metrics()
+
+        assert "llm cache: 1 hits / 1 misses (50.0% hit rate)" in output
+
+    def test_pairs_hits_and_misses(self) -> None:
+        """<name>_hits and <name>_misses counters should show as a hit rate."""
+        metrics.reset()
+        metrics.increment("translation_memory_hits", 3)
+        metrics.increment("translation_memory_misses")
+        metrics.increment("other_hits")
+
+        output = metrics.format_metrics()
+
+        assert "translation_memory: 3 hits / 1 misses (75.0% hit rate)" in output
+        assert "other: 1 hits / 0 misses (100.0% hit rate)" in output
+        assert "translation_memory_hits" not in output
@@ -5,14 +5,19 @@ from __future__ import annotations
 import pytest
 
 from src.prompts.templates import (
+    COMBINE_PROMPT,
     PLANNER_PROMPT,
+    PLANNER_SCHEMA,
     REVIEWER_PROMPT,
+    REVIEWER_SCHEMA,
     SUMMARIZER_PROMPT,
     WRITER_PROMPT,
+    format_combine_prompt,
     format_planner_prompt,
     format_reviewer_prompt,
     format_summarizer_prompt,
     format_writer_prompt,
+    select_reviewer_content,
 )
 
 
@@ -63,6 +68,21 @@ class TestSummarizerPrompt:
         assert "200" in result
 
 
+class TestCombinePrompt:
+    """Tests for the partial-summary combine prompt."""
+
+    def test_combine_prompt_contains_placeholders(self) -> None:
+        """COMBINE_PROMPT should contain {summaries} and {max_length}."""
+        assert "{summaries}" in COMBINE_PROMPT
+        assert "{max_length}" in COMBINE_PROMPT
+
+    def test_format_combine_prompt_keeps_order(self) -> None:
+        """format_combine_prompt should list partial summaries in order."""
+        result = format_combine_prompt(["Part one", "Part two"], max_length=300)
+        assert result.index("Part one") < result.index("Part two")
+        assert "300" in result
+
+
 class TestReviewerPrompt:
     """Tests for reviewer prompt template."""
 
@@ -81,6 +101,43 @@ class TestReviewerPrompt:
         assert "{task}" not in result
         assert "{content}" not in result
 
+    def test_format_reviewer_prompt_includes_digest(self) -> None:
+        """format_reviewer_prompt should include the running digest."""
+        result = format_reviewer_prompt(
+            "What is AI?", ["New summary"], digest="- AI definition covered"
+        )
+        assert "- AI definition covered" in result
+        assert "New summary" in result
+        assert "{digest}" not in result
+
+    def test_select_reviewer_content_keeps_whole_leading_items(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Summaries that do not fit whole should wait instead of being cut."""
+        from src.config import settings
+
+        monkeypatch.setattr(settings, "max_context_length", 2048)
+        content = [f"Summary {i}: " + "detail " * 300 for i in range(6)]
+
+        selected = select_reviewer_content("What is AI?", content)
+
+        assert 0 < len(selected) < len(content)
+        assert selected == content[: len(selected)]
+
+    def test_select_reviewer_content_truncates_oversized_first_item(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A summary larger than the whole budget should still be reviewed."""
+        from src.config import settings
+
+        monkeypatch.setattr(settings, "max_context_length", 2048)
+        content = ["detail " * 4000, "Short summary"]
+
+        selected = select_reviewer_content("What is AI?", content)
+
+        assert len(selected) == 1
+        assert content[0].startswith(selected[0].removesuffix(" [...]"))
+
 
 class TestWriterPrompt:
     """Tests for writer prompt template."""
@@ -108,3 +165,17 @@ class TestWriterPrompt:
         result = format_writer_prompt("Question?", content, [])
         assert "Question?" in result
         assert "{references}" not in result
+
+
+class TestStructuredOutputSchemas:
+    """Tests for the JSON schemas used with Ollama structured output."""
+
+    def test_planner_schema_requires_queries(self) -> None:
+        """PLANNER_SCHEMA should require a list of string queries."""
+        assert PLANNER_SCHEMA["required"] == ["queries"]
+        assert PLANNER_SCHEMA["properties"]["queries"]["items"] == {"type": "string"}
+
+    def test_reviewer_schema_requires_decision_reason_and_digest(self) -> None:
+        """REVIEWER_SCHEMA should require a decision, a reason and a digest."""
+        assert set(REVIEWER_SCHEMA["required"]) == {"sufficient", "reason", "digest"}
+        assert REVIEWER_SCHEMA["properties"]["sufficient"] == {"type": "boolean"}
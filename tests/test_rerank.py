@@ -0,0 +1,147 @@
+"""Tests for search result reranking."""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+
+import pytest
+from aioresponses import aioresponses
+
+from src.rerank import domain_prior, rerank_results
+from src.tools.http import close_http_session
+from src.tools.search import SearchResult, search
+
+FIXTURES = Path(__file__).parent / "fixtures" / "searxng"
+SEARXNG = re.compile(r"^http://localhost:8080/search\?.*$")
+
+
+@pytest.fixture(autouse=True)
+async def _close_shared_session():
+    """Close the shared HTTP session opened by each test."""
+    yield
+    await close_http_session()
+
+
+async def _search_fixture(name: str) -> list[SearchResult]:
+    """Run search() against a SearXNG response stored in tests/fixtures."""
+    payload = json.loads((FIXTURES / name).read_text(encoding="utf-8"))
+    with aioresponses() as mocked:
+        mocked.get(SEARXNG, payload=payload)
+        return await search(payload["query"], num_results=10)
+
+
+class TestDomainPrior:
+    """Tests for domain_prior."""
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://en.wikipedia.org/wiki/Python",
+            "https://arxiv.org/abs/2101.00001",
+            "https://cs.stanford.edu/people/",
+            "https://www.riken.go.jp/press/",
+            "https://peps.python.org/pep-0703/",
+        ],
+    )
+    def test_preferred_domains(self, url: str) -> None:
+        """Reference and institutional domains should get a positive prior."""
+        assert domain_prior(url) == 1.0
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://www.pinterest.com/pin/1/",
+            "https://m.facebook.com/groups/python",
+            "https://x.com/user/status/1",
+            "https://www.youtube.com/watch?v=abc",
+        ],
+    )
+    def test_discouraged_domains(self, url: str) -> None:
+        """Social, video and shopping sites should get a negative prior."""
+        assert domain_prior(url) == -1.0
+
+    def test_other_domains_are_neutral(self) -> None:
+        """Unknown domains and lookalike hosts should be neutral."""
+        assert domain_prior("https://example.com/page") == 0.0
+        assert domain_prior("https://notwikipedia.org/") == 0.0
+        assert domain_prior("https://box.com/") == 0.0
+        assert domain_prior("not a url") == 0.0
+
+
+class TestRerankResults:
+    """Tests for rerank_results."""
+
+    def test_relevant_snippet_moves_up(self) -> None:
+        """A result whose snippet matches the query should outrank others."""
+        results = [
+            SearchResult(title="Weather", url="https://a.example/", snippet="rain"),
+            SearchResult(title="Cooking", url="https://b.example/", snippet="pasta"),
+            SearchResult(
+                title="Qubits",
+                url="https://c.example/",
+                snippet="quantum error correction with qubits",
+            ),
+        ]
+
+        ranked = rerank_results(results, "quantum error correction")
+
+        assert ranked[0].url == "https://c.example/"
+
+    def test_ties_keep_search_order(self) -> None:
+        """Without any signal, SearXNG's order should be kept."""
+        results = [
+            SearchResult(title=f"R{i}", url=f"https://example.com/{i}", snippet="")
+            for i in range(5)
+        ]
+
+        assert rerank_results(results, "unrelated") == results
+
+    def test_does_not_drop_results(self) -> None:
+        """Reranking should only reorder results."""
+        results = [
+            SearchResult(title=f"R{i}", url=f"https://site{i}.example/", snippet="x")
+            for i in range(4)
+        ]
+
+        ranked = rerank_results(results, "x")
+
+        assert sorted(r.url for r in ranked) == sorted(r.url for r in results)
+
+    def test_empty_and_single(self) -> None:
+        """Short lists should be returned unchanged."""
+        result = SearchResult(title="T", url="https://example.com/", snippet="")
+
+        assert rerank_results([], "query") == []
+        assert rerank_results([result], "query") == [result]
+
+
+class TestRecordedResponses:
+    """Rerank SearXNG responses parsed by search()."""
+
+    async def test_english_query(self) -> None:
+        """On-topic reference pages should come before social and shop links."""
+        results = await _search_fixture("python_gil.json")
+
+        ranked = rerank_results(results, "python gil removal")
+        top = [result.url for result in ranked[:3]]
+
+        assert results[0].url.startswith("https://www.pinterest.com/")
+        assert set(top) == {
+            "https://peps.python.org/pep-0703/",
+            "https://realpython.com/python-gil/",
+            "https://en.wikipedia.org/wiki/Global_interpreter_lock",
+        }
+        assert ranked[-1].url == "https://www.facebook.com/groups/pythonprogrammers/"
+
+    async def test_japanese_query(self) -> None:
+        """CJK snippets should be scored through character bigrams."""
+        results = await _search_fixture("quantum_ja.json")
+
+        ranked = rerank_results(results, "量子コンピュータ 誤り訂正")
+        urls = [result.url for result in ranked]
+
+        assert urls[0] == "https://www.riken.go.jp/press/quantum-error-correction/"
+        assert urls[-1].startswith("https://www.quora.com/")
+        assert urls.index("https://www.s.u-tokyo.ac.jp/ja/press/surface-code/") < 3
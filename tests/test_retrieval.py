@@ -0,0 +1,75 @@
+"""Tests for BM25 passage selection."""
+
+from __future__ import annotations
+
+from src.prompts.budget import count_tokens
+from src.retrieval import bm25_scores, select_passages, tokenize
+
+
+class TestTokenize:
+    """Tests for tokenize."""
+
+    def test_lowercases_and_drops_stopwords(self) -> None:
+        """Terms should be lowercased and stopwords removed."""
+        assert tokenize("The Quantum Computer and the Qubit") == [
+            "quantum",
+            "computer",
+            "qubit",
+        ]
+
+    def test_cjk_text_uses_bigrams(self) -> None:
+        """CJK runs should be split into character bigrams."""
+        assert tokenize("量子計算") == ["量子", "子計", "計算"]
+
+
+class TestBM25Scores:
+    """Tests for bm25_scores."""
+
+    def test_relevant_document_scores_highest(self) -> None:
+        """The document matching the query should score highest."""
+        documents = [
+            "Cookie settings and newsletter signup.",
+            "Qubit error correction protects quantum states.",
+            "Our company history and team.",
+        ]
+
+        scores = bm25_scores(documents, "quantum error correction")
+
+        assert scores.index(max(scores)) == 1
+        assert scores[0] == 0
+
+    def test_empty_query_scores_zero(self) -> None:
+        """A query without terms should give every document zero."""
+        assert bm25_scores(["some text", "more text"], "the of") == [0.0, 0.0]
+
+
+class TestSelectPassages:
+    """Tests for select_passages."""
+
+    def test_keeps_top_passages_in_document_order(self) -> None:
+        """Selected passages should be the relevant ones, in original order."""
+        passages = [
+            "qubit basics explained",
+            "unrelated footer text",
+            "qubit error correction codes",
+            "more unrelated navigation",
+        ]
+
+        result = select_passages(passages, "qubit", top_k=2, max_tokens=1000)
+
+        assert result == ["qubit basics explained", "qubit error correction codes"]
+
+    def test_respects_token_budget(self) -> None:
+        """Selection should stop adding passages at the token budget."""
+        passages = [f"qubit passage {i} " + "detail " * 50 for i in range(10)]
+
+        result = select_passages(passages, "qubit", top_k=10, max_tokens=200)
+
+        assert 0 < len(result) < 10
+        assert sum(count_tokens(passage) for passage in result) <= 200
+
+    def test_falls_back_when_nothing_matches(self) -> None:
+        """Without any matching passage, selection should still return text."""
+        result = select_passages(["alpha", "beta"], "qubit", top_k=1, max_tokens=100)
+
+        assert len(result) == 1
@@ -0,0 +1,121 @@
+"""Tests for markdown segmentation for translation."""
+
+from __future__ import annotations
+
+from src.segmentation import MAX_SEGMENT_CHARS, segment_markdown
+
+REPORT = """# Introduction
+
+Quantum computers use qubits [1]. They are fast! See https://example.com/a now.
+
+- **Key finding**: error rates fell (see [the paper](https://arxiv.org/abs/1)).
+- `pip install qiskit` works.
+
+```python
+print("Do not translate. This is code.")
+```
+
+| Name | Value |
+|------|-------|
+| Speed | Very fast. |
+
+## References
+1. https://example.com/ref
+"""
+
+
+def _marked(text: str) -> str:
+    """Segment text and wrap every segment in angle brackets."""
+    document = segment_markdown(text)
+    return document.join([f"<{segment}>" for segment in document.segments])
+
+
+class TestSegmentMarkdown:
+    """Tests for segment_markdown."""
+
+    def test_round_trip(self) -> None:
+        """Joining the untranslated segments should reproduce the document."""
+        document = segment_markdown(REPORT)
+
+        assert document.join(document.segments) == REPORT
+
+    def test_splits_sentences(self) -> None:
+        """Each sentence should become its own segment."""
+        segments = segment_markdown("One is here. Two is there! Three?").segments
+
+        assert segments == ["One is here.", "Two is there!", "Three?"]
+
+    def test_keeps_markup_and_protected_spans(self) -> None:
+        """Headings, lists, code, URLs and citations should not be translated."""
+        marked = _marked(REPORT)
+
+        assert "# <Introduction>" in marked
+        assert "<Quantum computers use qubits [1].>" in marked
+        assert "<See> https://example.com/a <now.>" in marked
+        assert "- <**Key finding**: error rates fell" in marked
+        assert "(see [the paper](https://arxiv.org/abs/1)).>" in marked
+        assert "- `pip install qiskit` <works.>" in marked
+        assert 'print("Do not translate. This is code.")' in marked
+        assert "1. https://example.com/ref" in marked
+
+    def test_inline_markup_stays_in_segment_as_placeholders(self) -> None:
+        """Emphasis, links and citations should not split a sentence."""
+        document = segment_markdown(
+            "Error rates **fell** in [the study](https://x.org) [2]."
+        )
+
+        assert document.segments == [
+            "Error rates <x0>fell<x1> in <x2>the study<x3> <x4>."
+        ]
+        assert (
+            document.join(["Les taux <X0>ont baissé< x1 > dans <x2>l'étude<x3> <x4>."])
+            == "Les taux **ont baissé** dans [l'étude](https://x.org) [2]."
+        )
+
+    def test_placeholders_number_from_zero_per_segment(self) -> None:
+        """A sentence should read the same wherever it occurs in a line."""
+        document = segment_markdown("It is **big**. It is **big**.")
+
+        assert document.segments == ["It is <x0>big<x1>.", "It is <x0>big<x1>."]
+
+    def test_dropped_placeholder_keeps_its_span(self) -> None:
+        """A span whose placeholder the model lost should not disappear."""
+        document = segment_markdown("Qubits decohere [3].")
+
+        assert document.join(["Les qubits décohèrent."]) == (
+            "Les qubits décohèrent. [3]"
+        )
+
+    def test_translates_table_cells(self) -> None:
+        """Table cells should be translated and the rule line kept."""
+        marked = _marked(REPORT)
+
+        assert "| <Name> | <Value> |\n|------|-------|" in marked
+        assert "| <Speed> | <Very fast.> |" in marked
+
+    def test_cjk_sentences(self) -> None:
+        """CJK sentences should split after their full stops."""
+        document = segment_markdown("量子コンピュータは速い。誤り訂正が重要です！")
+
+        assert document.segments == ["量子コンピュータは速い。", "誤り訂正が重要です！"]
+        assert (
+            document.join(["Quantum computers are fast.", "Error correction matters!"])
+            == "Quantum computers are fast. Error correction matters!"
+        )
+        assert document.join(["速い。", "重要！"]) == "速い。重要！"
+
+    def test_splits_long_sentences(self) -> None:
+        """Sentences over MAX_SEGMENT_CHARS should split at clause boundaries."""
+        sentence = ", ".join(f"clause number {i} of a long sentence" for i in range(40))
+        document = segment_markdown(sentence + ".")
+
+        assert len(document.segments) > 1
+        assert all(len(s) <= MAX_SEGMENT_CHARS for s in document.segments)
+        assert document.join(document.segments) == sentence + "."
+
+    def test_blank_document(self) -> None:
+        """Text without words should have no segments."""
+        document = segment_markdown("\n\n---\n[1] https://example.com\n")
+
+        assert document.segments == []
+        assert document.join([]) == "\n\n---\n[1] https://example.com\n"
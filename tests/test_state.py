@@ -131,3 +131,107 @@ class TestResearchStateTranslationFields:
 
         hints = typing.get_type_hints(ResearchState)
         assert hints["original_task"] is str
+
+
+class TestDedupReducers:
+    """Tests for the order-preserving dedup reducers on list channels."""
+
+    def test_list_channels_use_dedup_reducer(self) -> None:
+        """content, references and scraped_urls should merge without duplicates."""
+        import typing
+
+        from src.state import ResearchState, _add_unique
+
+        hints = typing.get_type_hints(ResearchState, include_extras=True)
+        for field in ("content", "references", "scraped_urls"):
+            assert hints[field].__metadata__ == (_add_unique,)
+
+    def test_add_unique_keeps_order_and_drops_duplicates(self) -> None:
+        """Merged lists should keep first-seen order without repeats."""
+        from src.state import _add_unique
+
+        merged = _add_unique(["a", "b"], ["b", "c", "a", "d", "c"])
+
+        assert merged == ["a", "b", "c", "d"]
+        assert isinstance(merged, list)
+
+    def test_add_unique_does_not_mutate_previous_value(self) -> None:
+        """Earlier state values should stay unchanged after a merge."""
+        from src.state import _add_unique
+
+        first = _add_unique([], ["a"])
+        second = _add_unique(first, ["b"])
+
+        assert first == ["a"]
+        assert "b" not in first
+        assert second == ["a", "b"]
+
+    def test_unique_list_survives_copying(self) -> None:
+        """UniqueList should keep its items and index through deepcopy and pickle."""
+        import copy
+        import pickle
+
+        from src.state import UniqueList
+
+        items = UniqueList(["a", "b", "a"])
+
+        for clone in (copy.deepcopy(items), pickle.loads(pickle.dumps(items))):
+            assert clone == ["a", "b"]
+            assert "a" in clone
+            clone.append("a")
+            assert clone == ["a", "b"]
+
+    def test_unique_list_mutators_keep_membership(self) -> None:
+        """Every list mutator should keep `in` and uniqueness correct."""
+        from src.state import UniqueList
+
+        items = UniqueList(["a", "b"])
+        items += ["b", "c"]
+        items.insert(0, "c")
+        items.insert(0, "z")
+        assert items == ["z", "a", "b", "c"]
+
+        items[0] = "y"
+        assert "z" not in items
+        assert "y" in items
+        items[1:3] = ["c", "d"]
+        assert items == ["y", "c", "d"]
+        assert "a" not in items
+
+        items.remove("y")
+        assert items.pop() == "d"
+        del items[0]
+        assert items == []
+        assert "c" not in items
+        assert "d" not in items
+
+        items.extend(["a", "b"])
+        items *= 2
+        assert items == ["a", "b"]
+        items.clear()
+        assert "a" not in items
+        items.append("a")
+        assert items == ["a"]
+
+    async def test_graph_merges_parallel_duplicates(self) -> None:
+        """Parallel branches adding the same item should leave one copy."""
+        from langgraph.graph import END, START, StateGraph
+        from langgraph.types import Send
+
+        from src.state import ResearchState
+
+        async def branch(state: dict) -> dict:
+            return {"references": ["https://example.com/shared"]}
+
+        graph = StateGraph(ResearchState)
+        graph.add_node("branch", branch)  # type: ignore[type-var]
+        graph.add_conditional_edges(
+            START, lambda state: [Send("branch", state) for _ in range(3)], ["branch"]
+        )
+        graph.add_edge("branch", END)
+
+        result = await graph.compile().ainvoke(
+            {"references": ["https://example.com/shared"]}
+        )
+
+        assert result["references"] == ["https://example.com/shared"]
@@ -0,0 +1,55 @@
+"""Tests for URL canonicalization."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.urls import canonicalize_url
+
+
+class TestCanonicalizeUrl:
+    """Tests for canonicalize_url."""
+
+    @pytest.mark.parametrize(
+        "variant",
+        [
+            "https://example.com/article",
+            "http://example.com/article",
+            "https://www.example.com/article",
+            "https://EXAMPLE.com/article/",
+            "https://example.com:443/article",
+            "https://example.com//article",
+            "https://example.com/article#comments",
+            "https://example.com/article?utm_source=news&utm_medium=email",
+            "https://example.com/article?fbclid=abc123",
+            "  https://example.com/article  ",
+        ],
+    )
+    def test_variants_share_canonical_form(self, variant: str) -> None:
+        """Common variants of one page should canonicalize alike."""
+        assert canonicalize_url(variant) == "https://example.com/article"
+
+    def test_query_parameters_are_sorted_and_kept(self) -> None:
+        """Meaningful query parameters should be kept in a stable order."""
+        assert canonicalize_url("https://example.com/s?q=ai&page=2") == (
+            canonicalize_url("https://example.com/s?page=2&q=ai")
+        )
+        assert "q=ai" in canonicalize_url("https://example.com/s?q=ai")
+
+    def test_path_case_is_preserved(self) -> None:
+        """Paths are case-sensitive and should not be lowercased."""
+        assert canonicalize_url("https://example.com/Wiki/Qubit") == (
+            "https://example.com/Wiki/Qubit"
+        )
+
+    def test_non_default_port_is_kept(self) -> None:
+        """Non-default ports identify a different server."""
+        assert canonicalize_url("http://example.com:8080/") == (
+            "https://example.com:8080/"
+        )
+
+    def test_non_http_urls_are_unchanged(self) -> None:
+        """Non-http(s) URLs should be returned as given."""
+        assert canonicalize_url("mailto:someone@example.com") == (
+            "mailto:someone@example.com"
+        )
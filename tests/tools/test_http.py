@@ -0,0 +1,56 @@
+"""Tests for the shared HTTP session."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.tools.http import close_http_session, get_http_session
+
+
+@pytest.fixture(autouse=True)
+async def _close_shared_session():
+    """Close the shared HTTP session opened by each test."""
+    yield
+    await close_http_session()
+
+
+class TestGetHttpSession:
+    """Tests for get_http_session."""
+
+    async def test_returns_same_session_within_loop(self) -> None:
+        """Repeated calls should return the same session."""
+        assert get_http_session() is get_http_session()
+
+    async def test_connector_uses_pool_settings(self) -> None:
+        """The connector should use the configured pool limits."""
+        from src.config import settings
+
+        connector = get_http_session().connector
+
+        assert connector is not None
+        assert connector.limit == settings.http_pool_limit
+        assert connector.limit_per_host == settings.http_pool_limit_per_host
+
+    async def test_closed_session_is_replaced(self) -> None:
+        """A closed session should be replaced on the next call."""
+        session = get_http_session()
+        await session.close()
+
+        assert get_http_session() is not session
+
+
+class TestCloseHttpSession:
+    """Tests for close_http_session."""
+
+    async def test_close_closes_session(self) -> None:
+        """Closing should close the shared session."""
+        session = get_http_session()
+
+        await close_http_session()
+
+        assert session.closed
+
+    async def test_close_without_session_is_noop(self) -> None:
+        """Closing before any session exists should not fail."""
+        await close_http_session()
+        await close_http_session()
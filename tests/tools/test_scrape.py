@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-
-from src.tools.scrape import ScrapeResult, scrape, scrape_multiple
+from aioresponses import aioresponses
+
+from src.tools.scrape import (
+    CrawlerPool,
+    ScrapeError,
+    ScrapeResult,
+    close_crawler_pool,
+    scrape,
+    scrape_multiple,
+    start_crawler_pool,
+)
 
 # ============================================================
 # Fixtures
@@ -43,9 +53,29 @@ def mock_crawler(mock_crawl_result_success: MagicMock) -> MagicMock:
     crawler.arun = AsyncMock(return_value=mock_crawl_result_success)
     crawler.__aenter__ = AsyncMock(return_value=crawler)
     crawler.__aexit__ = AsyncMock(return_value=None)
+    crawler.start = AsyncMock(return_value=crawler)
+    crawler.close = AsyncMock(return_value=None)
+    crawler.ready = True
     return crawler
 
 
+@pytest.fixture
+def crawler_factory(mock_crawl_result_success: MagicMock) -> MagicMock:
+    """Return an AsyncWebCrawler stand-in that creates a new mock per launch."""
+
+    def _create(*args: object, **kwargs: object) -> MagicMock:
+        crawler = MagicMock()
+        crawler.arun = AsyncMock(return_value=mock_crawl_result_success)
+        crawler.start = AsyncMock(return_value=crawler)
+        crawler.close = AsyncMock(return_value=None)
+        crawler.ready = True
+        browser = crawler.crawler_strategy.browser_manager.browser
+        browser.is_connected.return_value = True
+        return crawler
+
+    return MagicMock(side_effect=_create)
+
+
 # ============================================================
 # Test: ScrapeResult Dataclass
 # ============================================================
@@ -251,3 +281,511 @@ class TestScrapeMultiple:
             assert len(results) == 2
             assert results[0].success is False
             assert results[1].success is True
+
+
+# ============================================================
+# Test: Crawler Pool
+# ============================================================
+
+
+class TestCrawlerPool:
+    """Test the shared browser pool."""
+
+    def test_invalid_size_raises_value_error(self) -> None:
+        """Pool size must be positive."""
+        with pytest.raises(ValueError, match="size"):
+            CrawlerPool(size=0, max_pages_per_browser=10)
+
+    @pytest.mark.asyncio
+    async def test_browser_reused_across_scrapes(
+        self,
+        crawler_factory: MagicMock,
+    ) -> None:
+        """Scrapes should share one browser instead of launching per URL."""
+        with patch("src.tools.scrape.AsyncWebCrawler", crawler_factory):
+            await start_crawler_pool(size=1, max_pages_per_browser=10)
+            try:
+                await scrape("https://example.com/1")
+                await scrape("https://example.com/2")
+            finally:
+                await close_crawler_pool()
+
+        assert crawler_factory.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_browser_recycled_after_max_pages(
+        self,
+        crawler_factory: MagicMock,
+    ) -> None:
+        """A browser should be closed and replaced after max pages."""
+        pool = CrawlerPool(size=1, max_pages_per_browser=2)
+
+        with patch("src.tools.scrape.AsyncWebCrawler", crawler_factory):
+            for _ in range(3):
+                async with pool.acquire():
+                    pass
+            await pool.close()
+
+        assert crawler_factory.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_browser_is_retired(
+        self,
+        crawler_factory: MagicMock,
+    ) -> None:
+        """A browser whose scrape raised should not be reused."""
+        pool = CrawlerPool(size=1, max_pages_per_browser=10)
+
+        with patch("src.tools.scrape.AsyncWebCrawler", crawler_factory):
+            with pytest.raises(RuntimeError):
+                async with pool.acquire() as crawler:
+                    raise RuntimeError("browser crashed")
+            async with pool.acquire() as replacement:
+                pass
+            await pool.close()
+
+        crawler.close.assert_awaited_once()
+        assert replacement is not crawler
+
+    @pytest.mark.asyncio
+    async def test_unready_browser_is_replaced(
+        self,
+        crawler_factory: MagicMock,
+    ) -> None:
+        """A browser that is no longer ready should fail its health check."""
+        pool = CrawlerPool(size=1, max_pages_per_browser=10)
+
+        with patch("src.tools.scrape.AsyncWebCrawler", crawler_factory):
+            async with pool.acquire() as crawler:
+                pass
+            crawler.ready = False
+            async with pool.acquire() as replacement:
+                pass
+            await pool.close()
+
+        assert replacement is not crawler
+        crawler.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_disconnected_browser_is_replaced(
+        self,
+        crawler_factory: MagicMock,
+    ) -> None:
+        """A browser that crashed while idle should not be handed out again."""
+        pool = CrawlerPool(size=1, max_pages_per_browser=10)
+
+        with patch("src.tools.scrape.AsyncWebCrawler", crawler_factory):
+            async with pool.acquire() as crawler:
+                pass
+            browser = crawler.crawler_strategy.browser_manager.browser
+            browser.is_connected.return_value = False
+            async with pool.acquire() as replacement:
+                pass
+            await pool.close()
+
+        assert crawler.ready is True
+        assert replacement is not crawler
+        crawler.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_pool_bounds_concurrent_browsers(
+        self,
+        crawler_factory: MagicMock,
+    ) -> None:
+        """No more browsers than the pool size should be alive at once."""
+        import asyncio
+
+        pool = CrawlerPool(size=2, max_pages_per_browser=10)
+
+        async def borrow() -> None:
+            async with pool.acquire():
+                await asyncio.sleep(0.01)
+
+        with patch("src.tools.scrape.AsyncWebCrawler", crawler_factory):
+            await asyncio.gather(*(borrow() for _ in range(6)))
+            await pool.close()
+
+        assert crawler_factory.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_close_shuts_down_idle_browsers(
+        self,
+        crawler_factory: MagicMock,
+    ) -> None:
+        """Closing the pool should close every idle browser."""
+        pool = CrawlerPool(size=1, max_pages_per_browser=10)
+
+        with patch("src.tools.scrape.AsyncWebCrawler", crawler_factory):
+            async with pool.acquire() as crawler:
+                pass
+            await pool.close()
+
+        crawler.close.assert_awaited_once()
+        with pytest.raises(ScrapeError):
+            async with pool.acquire():
+                pass
+
+
+# ============================================================
+# Test: Concurrent Scraping
+# ============================================================
+
+
+class TestScrapeMultipleConcurrency:
+    """Test bounded-concurrency scrape_multiple."""
+
+    @staticmethod
+    def _tracking_scrape(delays: dict[str, float], active: dict[str, int]) -> AsyncMock:
+        """Return a fake scrape() recording peak concurrency overall and per host."""
+        import asyncio
+
+        from src.tools.scrape import _domain_of
+
+        async def fake_scrape(url: str, **kwargs: object) -> ScrapeResult:
+            domain = _domain_of(url)
+            active["now"] += 1
+            active[domain] = active.get(domain, 0) + 1
+            active["peak"] = max(active["peak"], active["now"])
+            active[f"peak:{domain}"] = max(
+                active.get(f"peak:{domain}", 0), active[domain]
+            )
+            await asyncio.sleep(delays.get(url, 0.01))
+            active["now"] -= 1
+            active[domain] -= 1
+            return ScrapeResult(url=url, markdown=url, success=True)
+
+        return AsyncMock(side_effect=fake_scrape)
+
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self) -> None:
+        """Results should follow the input order, not completion order."""
+        urls = [f"https://site{i}.com/page" for i in range(4)]
+        delays = {urls[0]: 0.05, urls[1]: 0.01, urls[2]: 0.03, urls[3]: 0.0}
+        active = {"now": 0, "peak": 0}
+
+        with (
+            patch("src.tools.scrape.scrape", self._tracking_scrape(delays, active)),
+            patch("src.tools.scrape._available_memory_mb", return_value=None),
+        ):
+            results = await scrape_multiple(urls, concurrency=4, per_domain_limit=1)
+
+        assert [r.url for r in results] == urls
+        assert active["peak"] > 1
+
+    @pytest.mark.asyncio
+    async def test_global_concurrency_is_bounded(self) -> None:
+        """No more than `concurrency` scrapes should run at once."""
+        urls = [f"https://site{i}.com/page" for i in range(6)]
+        active = {"now": 0, "peak": 0}
+
+        with (
+            patch("src.tools.scrape.scrape", self._tracking_scrape({}, active)),
+            patch("src.tools.scrape._available_memory_mb", return_value=None),
+        ):
+            await scrape_multiple(urls, concurrency=2, per_domain_limit=5)
+
+        assert active["peak"] == 2
+
+    @pytest.mark.asyncio
+    async def test_per_domain_limit_is_respected(self) -> None:
+        """Scrapes against one host should not exceed the per-domain cap."""
+        urls = [f"https://example.com/{i}" for i in range(4)] + ["https://other.org/a"]
+        active = {"now": 0, "peak": 0}
+
+        with (
+            patch("src.tools.scrape.scrape", self._tracking_scrape({}, active)),
+            patch("src.tools.scrape._available_memory_mb", return_value=None),
+        ):
+            await scrape_multiple(urls, concurrency=4, per_domain_limit=1)
+
+        assert active["peak:example.com"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_one_is_sequential(self) -> None:
+        """A concurrency of 1 should scrape strictly one URL at a time."""
+        urls = [f"https://site{i}.com/page" for i in range(3)]
+        active = {"now": 0, "peak": 0}
+
+        with patch("src.tools.scrape.scrape", self._tracking_scrape({}, active)):
+            results = await scrape_multiple(urls, concurrency=1)
+
+        assert active["peak"] == 1
+        assert [r.url for r in results] == urls
+
+    @pytest.mark.asyncio
+    async def test_low_memory_caps_concurrency(self) -> None:
+        """Concurrency should shrink to what available memory allows."""
+        from src.config import settings
+
+        urls = [f"https://site{i}.com/page" for i in range(4)]
+        active = {"now": 0, "peak": 0}
+
+        with (
+            patch("src.tools.scrape.scrape", self._tracking_scrape({}, active)),
+            patch("src.tools.scrape._available_memory_mb", return_value=300),
+            patch.object(settings, "scrape_memory_per_page_mb", 256),
+        ):
+            await scrape_multiple(urls, concurrency=4, per_domain_limit=1)
+
+        assert active["peak"] == 1
+
+
+class TestAvailableMemory:
+    """Test the memory probe used to cap scrape concurrency."""
+
+    def test_reads_mem_available(self, tmp_path: Path) -> None:
+        """MemAvailable should be used, including reclaimable page cache."""
+        from src.tools.scrape import _available_memory_mb
+
+        meminfo = tmp_path / "meminfo"
+        meminfo.write_text(
+            "MemTotal:        8000000 kB\n"
+            "MemFree:         3891200 kB\n"
+            "MemAvailable:    5734400 kB\n"
+        )
+
+        with patch("src.tools.scrape._MEMINFO", str(meminfo)):
+            assert _available_memory_mb() == 5600
+
+    def test_falls_back_to_sysconf(self, tmp_path: Path) -> None:
+        """Without /proc/meminfo, the free page count should be used."""
+        from src.tools.scrape import _available_memory_mb
+
+        values = {"SC_AVPHYS_PAGES": 1024, "SC_PAGE_SIZE": 4096}
+
+        with (
+            patch("src.tools.scrape._MEMINFO", str(tmp_path / "missing")),
+            patch("src.tools.scrape.os.sysconf", side_effect=values.__getitem__),
+        ):
+            assert _available_memory_mb() == 4
+
+
+class TestScrapeStream:
+    """Test the streaming variant of scrape_multiple."""
+
+    @pytest.mark.asyncio
+    async def test_yields_results_in_completion_order(self) -> None:
+        """Faster pages should be yielded first, tagged with their index."""
+        from src.tools.scrape import scrape_stream
+
+        urls = ["https://slow.com/page", "https://fast.com/page"]
+        delays = {urls[0]: 0.05, urls[1]: 0.0}
+        active = {"now": 0, "peak": 0}
+
+        with (
+            patch(
+                "src.tools.scrape.scrape",
+                TestScrapeMultipleConcurrency._tracking_scrape(delays, active),
+            ),
+            patch("src.tools.scrape._available_memory_mb", return_value=None),
+        ):
+            indexes = [
+                index
+                async for index, _ in scrape_stream(
+                    urls, concurrency=2, per_domain_limit=1
+                )
+            ]
+
+        assert indexes == [1, 0]
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_limits_in_flight_scrapes(self) -> None:
+        """No new scrapes should start beyond the concurrency window."""
+        import asyncio
+
+        from src.tools.scrape import scrape_stream
+
+        urls = [f"https://site{i}.com/page" for i in range(6)]
+        started: list[str] = []
+
+        async def fake_scrape(url: str, **kwargs: object) -> ScrapeResult:
+            started.append(url)
+            return ScrapeResult(url=url, markdown="", success=True)
+
+        with (
+            patch("src.tools.scrape.scrape", AsyncMock(side_effect=fake_scrape)),
+            patch("src.tools.scrape._available_memory_mb", return_value=None),
+        ):
+            stream = scrape_stream(urls, concurrency=2, per_domain_limit=1)
+            await anext(stream)
+            await asyncio.sleep(0.01)
+            started_while_consuming = len(started)
+            await stream.aclose()
+
+        assert started_while_consuming <= 4
+
+
+# ============================================================
+# Test: Page Cache
+# ============================================================
+
+
+class TestPageCache:
+    """Test the on-disk page cache and HTTP revalidation."""
+
+    @pytest.fixture(autouse=True)
+    async def _close_shared_session(self):
+        """Close the shared HTTP session used for revalidation."""
+        from src.tools.http import close_http_session
+
+        yield
+        await close_http_session()
+
+    @pytest.fixture
+    def validated_result(self, mock_crawl_result_success: MagicMock) -> MagicMock:
+        """Return a crawl result carrying ETag and Last-Modified headers."""
+        mock_crawl_result_success.response_headers = {
+            "ETag": '"v1"',
+            "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+        return mock_crawl_result_success
+
+    @staticmethod
+    def _expire_cached_pages() -> None:
+        """Age every cached page past the freshness window."""
+        from src.cache import get_cache
+
+        cache = get_cache("pages")
+        cache._conn.execute("UPDATE entries SET created_at = 0")
+        cache._conn.commit()
+
+    @pytest.mark.asyncio
+    async def test_fresh_page_served_without_browser(
+        self,
+        mock_crawler: MagicMock,
+    ) -> None:
+        """A fresh cached page should not launch the browser again."""
+        with patch("src.tools.scrape.AsyncWebCrawler", return_value=mock_crawler):
+            first = await scrape("https://example.com")
+            second = await scrape("https://example.com#section")
+
+        assert mock_crawler.arun.await_count == 1
+        assert second.markdown == first.markdown
+        assert second.success is True
+
+    @pytest.mark.asyncio
+    async def test_failed_scrape_not_cached(
+        self,
+        mock_crawler: MagicMock,
+        mock_crawl_result_failure: MagicMock,
+    ) -> None:
+        """Failures should be retried on the next scrape."""
+        mock_crawler.arun = AsyncMock(return_value=mock_crawl_result_failure)
+
+        with patch("src.tools.scrape.AsyncWebCrawler", return_value=mock_crawler):
+            await scrape("https://example.com/404")
+            await scrape("https://example.com/404")
+
+        assert mock_crawler.arun.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_identical_content_stored_once(
+        self,
+        mock_crawler: MagicMock,
+    ) -> None:
+        """Pages with identical markdown should share one content blob."""
+        from src.cache import get_cache
+
+        with patch("src.tools.scrape.AsyncWebCrawler", return_value=mock_crawler):
+            await scrape("https://example.com/a")
+            await scrape("https://mirror.example.org/a")
+
+        # Two URL records plus a single content entry.
+        assert len(get_cache("pages")) == 3
+
+    @pytest.mark.asyncio
+    async def test_not_modified_serves_cached_copy(
+        self,
+        mock_crawler: MagicMock,
+        validated_result: MagicMock,
+    ) -> None:
+        """A 304 on revalidation should skip the headless render."""
+        with patch("src.tools.scrape.AsyncWebCrawler", return_value=mock_crawler):
+            await scrape("https://example.com")
+            self._expire_cached_pages()
+
+            with aioresponses() as mocked:
+                mocked.get("https://example.com", status=304)
+                result = await scrape("https://example.com")
+
+            request = next(iter(mocked.requests.values()))[0]
+
+        assert mock_crawler.arun.await_count == 1
+        assert result.markdown == "# Test Page\n\nThis is test content."
+        assert request.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_modified_page_is_rendered_again(
+        self,
+        mock_crawler: MagicMock,
+        validated_result: MagicMock,
+    ) -> None:
+        """A 200 on revalidation should fall back to a full render."""
+        with patch("src.tools.scrape.AsyncWebCrawler", return_value=mock_crawler):
+            await scrape("https://example.com")
+            self._expire_cached_pages()
+            validated_result.markdown.raw_markdown = "# Updated"
+
+            with aioresponses() as mocked:
+                mocked.get("https://example.com", status=200, body="changed")
+                result = await scrape("https://example.com")
+
+        assert mock_crawler.arun.await_count == 2
+        assert result.markdown == "# Updated"
+
+    @pytest.mark.asyncio
+    async def test_slow_site_serves_stale_copy(
+        self,
+        mock_crawler: MagicMock,
+        validated_result: MagicMock,
+    ) -> None:
+        """A revalidation timeout should serve the stale copy when allowed."""
+        with patch("src.tools.scrape.AsyncWebCrawler", return_value=mock_crawler):
+            await scrape("https://example.com")
+            self._expire_cached_pages()
+
+            with aioresponses() as mocked:
+                mocked.get("https://example.com", exception=TimeoutError())
+                result = await scrape("https://example.com")
+
+        assert mock_crawler.arun.await_count == 1
+        assert result.success is True
+
+    @pytest.mark.asyncio
+    async def test_slow_site_rerenders_when_stale_disabled(
+        self,
+        mock_crawler: MagicMock,
+        validated_result: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Without serve-stale, a revalidation timeout should re-render."""
+        from src.config import settings
+
+        monkeypatch.setattr(settings, "page_cache_serve_stale", False)
+
+        with patch("src.tools.scrape.AsyncWebCrawler", return_value=mock_crawler):
+            await scrape("https://example.com")
+            self._expire_cached_pages()
+
+            with aioresponses() as mocked:
+                mocked.get("https://example.com", exception=TimeoutError())
+                await scrape("https://example.com")
+
+        assert mock_crawler.arun.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_cache(
+        self,
+        mock_crawler: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """PAGE_CACHE_TTL=0 should render every scrape."""
+        from src.config import settings
+
+        monkeypatch.setattr(settings, "page_cache_ttl", 0)
+
+        with patch("src.tools.scrape.AsyncWebCrawler", return_value=mock_crawler):
+            await scrape("https://example.com")
+            await scrape("https://example.com")
+
+        assert mock_crawler.arun.await_count == 2
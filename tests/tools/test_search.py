@@ -6,6 +6,7 @@ import aiohttp
 import pytest
 from aioresponses import aioresponses
 
+from src.tools.http import close_http_session
 from src.tools.search import SearchError, SearchResult, search
 
 # ============================================================
@@ -13,6 +14,13 @@ from src.tools.search import SearchError, SearchResult, search
 # ============================================================
 
 
+@pytest.fixture(autouse=True)
+async def _close_shared_session():
+    """Close the shared HTTP session opened by each test."""
+    yield
+    await close_http_session()
+
+
 @pytest.fixture
 def mock_search_response() -> dict:
     """Return a mock SearXNG JSON response."""
@@ -285,7 +293,9 @@ class TestSearchConfiguration:
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Search should use SEARXNG_URL from settings."""
-        monkeypatch.setenv("SEARXNG_URL", "http://custom:9999")
+        from src.config import settings
+
+        monkeypatch.setattr(settings, "searxng_url", "http://custom:9999")
 
         with aioresponses() as mocked:
             mocked.get(
@@ -295,3 +305,157 @@ class TestSearchConfiguration:
 
             results = await search("test")
             assert len(results) > 0
+
+    @pytest.mark.asyncio
+    async def test_reuses_shared_session(
+        self,
+        mock_search_response: dict,
+    ) -> None:
+        """Consecutive searches should share one pooled session."""
+        from src.tools.http import get_http_session
+
+        with aioresponses() as mocked:
+            mocked.get(
+                "http://localhost:8080/search?q=test&format=json",
+                payload=mock_search_response,
+                repeat=True,
+            )
+
+            await search("test")
+            session = get_http_session()
+            await search("test")
+
+            assert get_http_session() is session
+            assert not session.closed
+
+
+# ============================================================
+# Test: Result Cache
+# ============================================================
+
+
+class TestSearchCache:
+    """Test the on-disk search result cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_served_from_cache(
+        self,
+        mock_search_response: dict,
+    ) -> None:
+        """A repeated query should not reach SearXNG again."""
+        with aioresponses() as mocked:
+            mocked.get(
+                "http://localhost:8080/search?q=test&format=json",
+                payload=mock_search_response,
+            )
+
+            first = await search("test")
+            second = await search("test")
+
+        assert second == first
+
+    @pytest.mark.asyncio
+    async def test_normalized_query_hits_cache(
+        self,
+        mock_search_response: dict,
+    ) -> None:
+        """Case and whitespace differences should share a cache entry."""
+        from src.cache import cache_stats
+
+        with aioresponses() as mocked:
+            mocked.get(
+                "http://localhost:8080/search?q=Test+Query&format=json",
+                payload=mock_search_response,
+            )
+
+            await search("Test Query")
+            results = await search("  test   QUERY ")
+
+        assert len(results) == 2
+        assert cache_stats()["search"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_respects_num_results(
+        self,
+        mock_search_response: dict,
+    ) -> None:
+        """Cached results should still be limited to num_results."""
+        with aioresponses() as mocked:
+            mocked.get(
+                "http://localhost:8080/search?q=test&format=json",
+                payload=mock_search_response,
+            )
+
+            await search("test", num_results=1)
+            results = await search("test", num_results=10)
+
+        assert len(results) == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(
+        self,
+        mock_search_response: dict,
+    ) -> None:
+        """A failed search should be retried on the next call."""
+        with aioresponses() as mocked:
+            mocked.get(
+                "http://localhost:8080/search?q=test&format=json",
+                status=500,
+            )
+            mocked.get(
+                "http://localhost:8080/search?q=test&format=json",
+                payload=mock_search_response,
+            )
+
+            with pytest.raises(SearchError):
+                await search("test")
+            results = await search("test")
+
+        assert len(results) == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_results_are_not_cached(
+        self,
+        empty_search_response: dict,
+        mock_search_response: dict,
+    ) -> None:
+        """An empty answer (e.g. rate-limited engines) should not be cached."""
+        empty_search_response["unresponsive_engines"] = [
+            ["google", "too many requests"]
+        ]
+        with aioresponses() as mocked:
+            mocked.get(
+                "http://localhost:8080/search?q=test&format=json",
+                payload=empty_search_response,
+            )
+            mocked.get(
+                "http://localhost:8080/search?q=test&format=json",
+                payload=mock_search_response,
+            )
+
+            assert await search("test") == []
+            results = await search("test")
+
+        assert len(results) == 2
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_cache(
+        self,
+        mock_search_response: dict,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """SEARCH_CACHE_TTL=0 should send every query to SearXNG."""
+        from src.config import settings
+
+        monkeypatch.setattr(settings, "search_cache_ttl", 0)
+
+        with aioresponses() as mocked:
+            mocked.get(
+                "http://localhost:8080/search?q=test&format=json",
+                payload=mock_search_response,
+            )
+
+            await search("test")
+            with pytest.raises(SearchError):
+                # The single mocked response has been consumed.
+                await search("test")
@@ -170,3 +170,544 @@ class TestNormalizeLanguageCode:
         from src.tools.translate import normalize_language_code
 
         assert normalize_language_code("en") == "en"
+
+
+class TestTranslationExecutor:
+    """Tests for running translations off the event loop."""
+
+    @pytest.fixture(autouse=True)
+    def _close_executor(self):
+        """Shut down the executor created by each test."""
+        from src.tools.translate import close_translation_executor
+
+        yield
+        close_translation_executor()
+
+    async def test_runs_in_worker_thread(self) -> None:
+        """Translations should run in a dedicated worker thread."""
+        import threading
+
+        from src.tools.translate import run_translation
+
+        name = await run_translation(lambda: threading.current_thread().name)
+
+        assert name.startswith("translate")
+        assert name != threading.current_thread().name
+
+    async def test_event_loop_keeps_running(self) -> None:
+        """Other coroutines should make progress during a translation."""
+        import asyncio
+        import threading
+
+        from src.tools.translate import run_translation
+
+        release = threading.Event()
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            for _ in range(5):
+                ticks += 1
+                await asyncio.sleep(0.001)
+            release.set()
+
+        def blocking(text: str) -> str:
+            # Only returns once the ticker has run on the event loop.
+            assert release.wait(timeout=5)
+            return text.upper()
+
+        translation = asyncio.ensure_future(run_translation(blocking, "hello"))
+        await ticker()
+
+        assert await translation == "HELLO"
+        assert ticks == 5
+
+    async def test_queue_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Callers beyond workers plus queue size should wait before submitting."""
+        import asyncio
+        import threading
+
+        from src.config import settings
+        from src.tools import translate
+
+        monkeypatch.setattr(settings, "translation_workers", 1)
+        monkeypatch.setattr(settings, "translation_queue_size", 1)
+        release = threading.Event()
+        submitted = 0
+        original = translate._get_executor
+
+        def counting_executor():
+            nonlocal submitted
+            submitted += 1
+            return original()
+
+        monkeypatch.setattr(translate, "_get_executor", counting_executor)
+        calls = [
+            asyncio.ensure_future(translate.run_translation(release.wait, 5))
+            for _ in range(4)
+        ]
+        await asyncio.sleep(0.05)
+
+        assert submitted == 2
+        release.set()
+        assert await asyncio.gather(*calls) == [True] * 4
+        assert submitted == 4
+
+    async def test_errors_propagate(self) -> None:
+        """Exceptions raised by the translation should reach the caller."""
+        from src.tools.translate import (
+            TranslationError,
+            run_translation,
+            translate_to_english,
+        )
+
+        with pytest.raises(TranslationError):
+            await run_translation(translate_to_english, "text", "xyz")
+
+    def test_torch_threads_split_cores(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """By default the CPU cores should be shared between the workers."""
+        from src.config import settings
+        from src.tools import translate
+
+        monkeypatch.setattr(translate.os, "cpu_count", lambda: 8)
+        monkeypatch.setattr(settings, "translation_threads", 0)
+        monkeypatch.setattr(settings, "translation_workers", 2)
+        assert translate.torch_threads() == 4
+
+        monkeypatch.setattr(settings, "translation_workers", 16)
+        assert translate.torch_threads() == 1
+
+        monkeypatch.setattr(settings, "translation_threads", 3)
+        assert translate.torch_threads() == 3
+
+    def test_worker_sets_torch_threads(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Worker initialization should set torch's intra-op thread count."""
+        import sys
+        from unittest.mock import MagicMock
+
+        from src.tools import translate
+
+        fake_torch = MagicMock()
+        monkeypatch.setitem(sys.modules, "torch", fake_torch)
+
+        translate._init_worker(3)
+
+        fake_torch.set_num_threads.assert_called_once_with(3)
+
+
+class _FakeTokenizer:
+    """Tokenizer stand-in that passes texts through unchanged."""
+
+    def __call__(self, texts: list[str], **kwargs) -> dict:
+        return {"input_ids": list(texts)}
+
+    def batch_decode(self, outputs: list[str], **kwargs) -> list[str]:
+        return list(outputs)
+
+
+class _FakeModel:
+    """Model stand-in that upper-cases its inputs and records batches."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    def generate(self, input_ids: list[str]) -> list[str]:
+        self.batches.append(input_ids)
+        return [text.upper() for text in input_ids]
+
+
+class TestBatchedTranslation:
+    """Tests for segmented, batched translation."""
+
+    @pytest.fixture
+    def model(self, monkeypatch: pytest.MonkeyPatch) -> _FakeModel:
+        """Replace the Marian model with a recording fake."""
+        from src.tools import translate
+
+        model = _FakeModel()
+        monkeypatch.setattr(
+            translate, "_load_model", lambda name: (_FakeTokenizer(), model)
+        )
+        return model
+
+    def test_long_report_is_not_truncated(
+        self, model: _FakeModel, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Every sentence of a long report should be translated."""
+        from src.config import settings
+        from src.tools.translate import translate_from_english
+
+        monkeypatch.setattr(settings, "translation_batch_size", 16)
+        report = " ".join(f"Sentence {i} is here." for i in range(100))
+
+        result = translate_from_english(report, "ja")
+
+        assert result.translated_text == report.upper()
+        assert len(model.batches) == 7
+        assert all(len(batch) <= 16 for batch in model.batches)
+
+    def test_markdown_structure_is_kept(self, model: _FakeModel) -> None:
+        """Markup, code and URLs should come back unchanged."""
+        from src.tools.translate import translate_from_english
+
+        report = (
+            "## Findings\n\nIt **works** [1].\n\n```\nkeep this.\n```\n\n"
+            "- https://example.com/source\n"
+        )
+
+        result = translate_from_english(report, "ja")
+
+        assert result.translated_text == (
+            "## FINDINGS\n\nIT **WORKS** [1].\n\n```\nkeep this.\n```\n\n"
+            "- https://example.com/source\n"
+        )
+
+    def test_repeated_segments_translated_once(self, model: _FakeModel) -> None:
+        """Identical segments should share one translation."""
+        from src.tools.translate import translate_segments
+
+        result = translate_segments(["Intro", "Body text", "Intro"], "model")
+
+        assert result == ["INTRO", "BODY TEXT", "INTRO"]
+        assert sorted(model.batches[0]) == ["Body text", "Intro"]
+
+    def test_batches_group_similar_lengths(
+        self, model: _FakeModel, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Segments should be batched by length to limit padding."""
+        from src.config import settings
+        from src.tools.translate import translate_segments
+
+        monkeypatch.setattr(settings, "translation_batch_size", 2)
+        segments = ["a much longer segment", "b", "a long one", "c"]
+
+        result = translate_segments(segments, "model")
+
+        assert result == [segment.upper() for segment in segments]
+        assert model.batches == [["b", "c"], ["a long one", "a much longer segment"]]
+
+    def test_records_metrics(self, model: _FakeModel) -> None:
+        """Segment and batch counts should be recorded."""
+        from src import metrics
+        from src.tools.translate import translate_segments
+
+        metrics.reset()
+        translate_segments(["One.", "Two."], "model")
+
+        assert metrics.get("translation_segments") == 2
+        assert metrics.get("translation_batches") == 1
+
+
+class TestTranslationMemory:
+    """Tests for the two-tier translation memory."""
+
+    @pytest.fixture
+    def model(self, monkeypatch: pytest.MonkeyPatch) -> _FakeModel:
+        """Replace the Marian model with a recording fake."""
+        from src.tools import translate
+
+        model = _FakeModel()
+        monkeypatch.setattr(
+            translate, "_load_model", lambda name: (_FakeTokenizer(), model)
+        )
+        return model
+
+    def test_repeated_segments_skip_generate(self, model: _FakeModel) -> None:
+        """Segments translated before should come from memory."""
+        from src.tools.translate import translate_segments
+
+        translate_segments(["Introduction", "Body."], "model")
+        result = translate_segments(["Introduction", "Conclusion"], "model")
+
+        assert result == ["INTRODUCTION", "CONCLUSION"]
+        assert model.batches == [["Body.", "Introduction"], ["Conclusion"]]
+
+    def test_full_hit_does_not_load_model(
+        self, model: _FakeModel, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A fully remembered text should not load the model at all."""
+        from src.tools import translate
+
+        translate.translate_to_english("Same question.", "ja")
+
+        def fail(name: str) -> None:
+            raise AssertionError("model loaded")
+
+        monkeypatch.setattr(translate, "_load_model", fail)
+        result = translate.translate_to_english("Same question.", "ja")
+
+        assert result.translated_text == "SAME QUESTION."
+
+    def test_normalized_segments_match(self, model: _FakeModel) -> None:
+        """Whitespace and full-width variants should share an entry."""
+        from src.tools.translate import translate_segments
+
+        translate_segments(["量子 コンピュータ"], "model")
+        result = translate_segments(["量子　　コンピュータ"], "model")
+
+        assert result == ["量子 コンピュータ"]
+        assert len(model.batches) == 1
+
+    def test_models_do_not_share_entries(self, model: _FakeModel) -> None:
+        """The same segment should be translated separately per model."""
+        from src.tools.translate import translate_segments
+
+        translate_segments(["Hello."], "model-a")
+        translate_segments(["Hello."], "model-b")
+
+        assert len(model.batches) == 2
+
+    def test_disk_tier_survives_memory_clear(self, model: _FakeModel) -> None:
+        """Translations should persist on disk across processes."""
+        from src.cache import cache_stats
+        from src.tools.translate import clear_translation_memory, translate_segments
+
+        translate_segments(["Conclusion"], "model")
+        clear_translation_memory()
+        result = translate_segments(["Conclusion"], "model")
+
+        assert result == ["CONCLUSION"]
+        assert len(model.batches) == 1
+        assert cache_stats()["translations"]["hits"] == 1
+
+    def test_memory_tier_is_lru_bounded(
+        self, model: _FakeModel, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The in-memory tier should evict its least recently used entries."""
+        from src.config import settings
+        from src.tools.translate import translate_segments
+
+        monkeypatch.setattr(settings, "translation_memory_size", 2)
+        monkeypatch.setattr(settings, "translation_cache_ttl", 0)
+        translate_segments(["One"], "model")
+        translate_segments(["Two"], "model")
+        translate_segments(["One"], "model")
+        translate_segments(["Three"], "model")
+        translate_segments(["One", "Two"], "model")
+
+        assert model.batches == [["One"], ["Two"], ["Three"], ["Two"]]
+
+    def test_hit_rate_in_metrics(self, model: _FakeModel) -> None:
+        """Memory hits and misses should appear in the run metrics."""
+        from src import metrics
+        from src.tools.translate import translate_segments
+
+        metrics.reset()
+        translate_segments(["Introduction"], "model")
+        translate_segments(["Introduction"], "model")
+
+        assert metrics.get("translation_memory_hits") == 1
+        assert metrics.get("translation_memory_misses") == 1
+        assert "translation_memory: 1 hits / 1 misses" in metrics.format_metrics()
+
+
+class TestTranslationBackends:
+    """Tests for selecting the inference backend."""
+
+    @pytest.fixture
+    def model(self, monkeypatch: pytest.MonkeyPatch) -> _FakeModel:
+        """Replace the Marian model with a recording fake."""
+        from src.tools import translate
+
+        model = _FakeModel()
+        monkeypatch.setattr(
+            translate, "_load_model", lambda name: (_FakeTokenizer(), model)
+        )
+        return model
+
+    def test_unknown_backend_raises(
+        self, model: _FakeModel, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """An unknown backend name should raise TranslationError."""
+        from src.config import settings
+        from src.tools.translate import TranslationError, translate_segments
+
+        monkeypatch.setattr(settings, "translation_backend", "onnx-magic")
+
+        with pytest.raises(TranslationError):
+            translate_segments(["Hello."], "model")
+
+    def test_missing_backend_falls_back(
+        self, model: _FakeModel, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without the ctranslate2 package the transformers backend is used."""
+        import sys
+
+        from src import metrics
+        from src.config import settings
+        from src.tools.translate import translate_segments
+
+        metrics.reset()
+        monkeypatch.setitem(sys.modules, "ctranslate2", None)
+        monkeypatch.setattr(settings, "translation_backend", "ctranslate2")
+
+        result = translate_segments(["Hello."], "model")
+
+        assert result == ["HELLO."]
+        assert model.batches == [["Hello."]]
+        assert metrics.get("translation_backend_fallbacks") == 1
+
+    def test_quantized_backend_is_used(
+        self, model: _FakeModel, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The configured backend should translate, with its own memory entries."""
+        from src.config import settings
+        from src.tools import translate
+
+        quantized = _FakeModel()
+        loaded: list[tuple[str, str]] = []
+
+        def load_optimized(model_name: str, backend: str):
+            loaded.append((model_name, backend))
+            return translate._MarianBackend(_FakeTokenizer(), quantized)
+
+        monkeypatch.setattr(translate, "_load_optimized", load_optimized)
+        translate.translate_segments(["Hello."], "model")
+        monkeypatch.setattr(settings, "translation_backend", "int8")
+        result = translate.translate_segments(["Hello."], "model")
+
+        assert result == ["HELLO."]
+        assert loaded == [("model", "int8")]
+        assert model.batches == [["Hello."]]
+        assert quantized.batches == [["Hello."]]
+
+    def test_ctranslate2_backend_round_trips_tokens(self) -> None:
+        """The CTranslate2 backend should translate token sequences."""
+        from types import SimpleNamespace
+
+        from src.tools.translate import _CTranslate2Backend
+
+        class Tokenizer:
+            def encode(self, text: str, **kwargs) -> list[str]:
+                return [*text.split(), "</s>"]
+
+            def convert_ids_to_tokens(self, ids: list[str]) -> list[str]:
+                return ids
+
+            def convert_tokens_to_ids(self, tokens: list[str]) -> list[str]:
+                return tokens
+
+            def decode(self, ids: list[str], skip_special_tokens: bool) -> str:
+                return " ".join(i for i in ids if i != "</s>")
+
+        class Translator:
+            def translate_batch(self, sources: list[list[str]]) -> list:
+                return [
+                    SimpleNamespace(hypotheses=[[t.upper() for t in tokens[:-1]]])
+                    for tokens in sources
+                ]
+
+        backend = _CTranslate2Backend(Tokenizer(), Translator())
+
+        assert backend.translate_batch(["good day", "bye"]) == ["GOOD DAY", "BYE"]
+
+
+class TestModelPreload:
+    """Tests for loading translation models in the background."""
+
+    @pytest.fixture
+    def loaded(self, monkeypatch: pytest.MonkeyPatch):
+        """Enable preloading with a fake loader that records model names."""
+        from src.config import settings
+        from src.tools import translate
+
+        names: list[str] = []
+
+        def load(name: str):
+            names.append(name)
+            return _FakeTokenizer(), _FakeModel()
+
+        monkeypatch.setattr(settings, "translation_preload", True)
+        monkeypatch.setattr(translate, "_load_model", load)
+        yield names
+        translate.close_translation_executor()
+
+    async def test_loads_forward_then_reverse(self, loaded: list[str]) -> None:
+        """The forward model should load first, then the reverse model."""
+        from src.tools.translate import (
+            REVERSE_MODELS,
+            SUPPORTED_LANGUAGES,
+            model_ready,
+            preload_models,
+        )
+
+        preload_models("ja")
+        await model_ready(SUPPORTED_LANGUAGES["ja"])
+        await model_ready(REVERSE_MODELS["ja"])
+
+        assert loaded == [SUPPORTED_LANGUAGES["ja"], REVERSE_MODELS["ja"]]
+
+    async def test_preload_is_started_once(self, loaded: list[str]) -> None:
+        """Repeated preloads of a language should share one load."""
+        from src.tools.translate import SUPPORTED_LANGUAGES, model_ready, preload_models
+
+        preload_models("zh-cn")
+        preload_models("zh-tw")
+        await model_ready(SUPPORTED_LANGUAGES["zh"])
+
+        assert loaded.count(SUPPORTED_LANGUAGES["zh"]) == 1
+
+    async def test_english_and_unsupported_load_nothing(
+        self, loaded: list[str]
+    ) -> None:
+        """No models should be loaded for English or unsupported languages."""
+        from src.tools.translate import close_translation_executor, preload_models
+
+        preload_models("en")
+        preload_models("xyz")
+        close_translation_executor()
+
+        assert loaded == []
+
+    async def test_disabled_preload_loads_nothing(
+        self, loaded: list[str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """With TRANSLATION_PRELOAD off, model_ready should return at once."""
+        from src.config import settings
+        from src.tools.translate import SUPPORTED_LANGUAGES, model_ready, preload_models
+
+        monkeypatch.setattr(settings, "translation_preload", False)
+        preload_models("ja")
+        await model_ready(SUPPORTED_LANGUAGES["ja"])
+
+        assert loaded == []
+
+    async def test_failed_load_is_retried(
+        self, loaded: list[str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A failed background load should raise once and then be retried."""
+        from src.tools import translate
+
+        def fail(name: str):
+            raise OSError("model not found")
+
+        monkeypatch.setattr(translate, "_load_model", fail)
+        translate.preload_models("de")
+        with pytest.raises(OSError):
+            await translate.model_ready(translate.SUPPORTED_LANGUAGES["de"])
+
+        monkeypatch.setattr(
+            translate, "_load_model", lambda name: (_FakeTokenizer(), _FakeModel())
+        )
+        translate.preload_models("de")
+        await translate.model_ready(translate.SUPPORTED_LANGUAGES["de"])
+
+    async def test_loads_off_the_event_loop(
+        self, loaded: list[str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Models should load in the background loader thread."""
+        import threading
+
+        from src.tools import translate
+
+        threads: list[str] = []
+
+        def load(name: str):
+            threads.append(threading.current_thread().name)
+            return _FakeTokenizer(), _FakeModel()
+
+        monkeypatch.setattr(translate, "_load_model", load)
+        translate.preload_models("fr")
+        await translate.model_ready(translate.SUPPORTED_LANGUAGES["fr"])
+
+        assert threads[0].startswith("translate-load")